@@ -0,0 +1,89 @@
+"""Benchmark reading an export with the PyArrow engine and Arrow-backed dtypes against the default C engine.
+
+Usage:
+    PYTHONPATH=. python benchmarks/arrow_engine.py [n_rows] [n_columns]
+"""
+
+import io
+import sys
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from qualtrics_utils.misc import ExportedFile
+from qualtrics_utils.survey import read_export_df
+
+
+def make_export(n_rows: int, n_columns: int) -> tuple[bytes, dict[str, type]]:
+    rng = np.random.default_rng(0)
+
+    columns: dict[str, object] = {
+        "StartDate": pd.date_range("2023-01-01", periods=n_rows, freq="min"),
+        "ResponseId": [f"R_{i}" for i in range(n_rows)],
+    }
+    dtypes: dict[str, type] = {"ResponseId": str}
+
+    for c in range(n_columns):
+        if c % 2 == 0:
+            columns[f"Q{c}"] = rng.integers(-1, 6, n_rows)
+            dtypes[f"Q{c}"] = float
+        else:
+            columns[f"Q{c}"] = rng.choice(
+                ["Agree", "Neutral", "Disagree", "-1"], n_rows
+            )
+            dtypes[f"Q{c}"] = str
+
+    df = pd.DataFrame(columns)
+    # The two rows of Qualtrics metadata following the header.
+    csv = df.to_csv(index=False)
+    header, body = csv.split("\n", 1)
+    csv = "\n".join([header, header, header, body])
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as f:
+        f.writestr("survey.csv", csv)
+
+    return buffer.getvalue(), dtypes
+
+
+def bench(data: bytes, dtypes: dict[str, type], **kwargs) -> tuple[float, int]:
+    raw_data = ExportedFile(
+        survey_id="SV_1",
+        file_id="F_1",
+        last_response_id=None,
+        continuation_token=None,
+        timestamp=None,  # type: ignore
+        data=data,
+    )
+
+    start = time.perf_counter()
+    df = read_export_df(
+        raw_data=raw_data, dtypes=dtypes, parse_dates=["StartDate"], **kwargs
+    )
+    elapsed = time.perf_counter() - start
+
+    return elapsed, int(df.memory_usage(deep=True).sum())
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    data, dtypes = make_export(n_rows, n_columns)
+    print(f"{n_rows} rows x {n_columns} columns")
+
+    for name, kwargs in {
+        "c": {},
+        "pyarrow": dict(engine="pyarrow"),
+        "pyarrow, dtype_backend=pyarrow": dict(
+            engine="pyarrow", dtype_backend="pyarrow"
+        ),
+    }.items():
+        elapsed, memory = bench(data, dtypes, **kwargs)
+        print(f"{name}: {elapsed:.2f}s, {memory / 1024**2:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark the vectorized `coalesce_multiselect` against the original row-wise `DataFrame.apply` implementation.
+
+Usage:
+    PYTHONPATH=. python benchmarks/coalesce_multiselect.py [n_rows] [n_questions]
+"""
+
+import sys
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from qualtrics_utils.utils import coalesce_multiselect
+
+N_CHOICES = 6
+
+
+def coalesce_multiselect_apply(
+    df: pd.DataFrame,
+    codebook: list[dict[str, Any]],
+    delimiter: str = ", ",
+    use_multiple: bool = True,
+) -> pd.DataFrame:
+    def join(x: pd.Series) -> str:
+        l = x.dropna().tolist()
+
+        if use_multiple and len(l) > 1:
+            return "Multiple"
+        else:
+            return delimiter.join(l)
+
+    root_questions = {}
+
+    for question in codebook:
+        sub_question_columns = [q["question_number"] for q in question["questions"]]
+        root_questions[question["question_number"]] = df[sub_question_columns].apply(
+            lambda x: join(x), axis=1
+        )
+        df.drop(columns=sub_question_columns, inplace=True)
+
+    for root_q_num, root_question_df in root_questions.items():
+        df[root_q_num] = root_question_df
+
+    return df
+
+
+def make_data(
+    n_rows: int, n_questions: int
+) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
+    rng = np.random.default_rng(0)
+
+    columns = {}
+    codebook = []
+
+    for q in range(1, n_questions + 1):
+        sub_questions = []
+
+        for c in range(1, N_CHOICES + 1):
+            name = f"Q{q}_{c}"
+            selected = rng.random(n_rows) < 0.2
+            columns[name] = pd.Series(
+                np.where(selected, f"Choice {c}", None), dtype=object
+            )
+            sub_questions.append({"question_number": name})
+
+        codebook.append(
+            {
+                "question_number": f"Q{q}",
+                "question_type": "MC",
+                "questions": sub_questions,
+            }
+        )
+
+    return pd.DataFrame(columns), codebook
+
+
+def bench(
+    func, df: pd.DataFrame, codebook: list[dict[str, Any]], **kwargs
+) -> tuple[float, pd.DataFrame]:
+    df = df.copy()
+
+    start = time.perf_counter()
+    out = func(df, codebook, **kwargs)
+    return time.perf_counter() - start, out
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n_questions = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    df, codebook = make_data(n_rows, n_questions)
+    print(
+        f"{n_rows} rows x {n_questions} multi-select questions of {N_CHOICES} choices"
+    )
+
+    for use_multiple in (True, False):
+        old_time, old = bench(
+            coalesce_multiselect_apply, df, codebook, use_multiple=use_multiple
+        )
+        new_time, new = bench(
+            coalesce_multiselect, df, codebook, use_multiple=use_multiple
+        )
+
+        pd.testing.assert_frame_equal(old, new)
+
+        print(
+            f"use_multiple={use_multiple}: apply {old_time:.2f}s, vectorized {new_time:.2f}s, "
+            f"{old_time / new_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
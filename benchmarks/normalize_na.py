@@ -0,0 +1,74 @@
+"""Benchmark parse-time NA values and the dtype-aware `normalize_na` against the original regex `DataFrame.replace`.
+
+Usage:
+    PYTHONPATH=. python benchmarks/normalize_na.py [n_rows] [n_columns]
+"""
+
+import io
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from qualtrics_utils.survey import NA_VALUES, normalize_na
+
+
+def make_csv(n_rows: int, n_columns: int) -> str:
+    rng = np.random.default_rng(0)
+
+    columns = {}
+
+    for c in range(n_columns):
+        # Half numeric answers, half labeled or free text; either recoded as -1 or left blank.
+        if c % 2 == 0:
+            values = rng.integers(1, 6, n_rows).astype(str).astype(object)
+        else:
+            values = rng.choice(["Agree", "Neutral", "Disagree"], n_rows).astype(object)
+
+        draw = rng.random(n_rows)
+        values[draw < 0.1] = "-1"
+        values[(draw >= 0.1) & (draw < 0.2)] = " "
+
+        columns[f"Q{c}"] = values
+
+    return pd.DataFrame(columns).to_csv(index=False)
+
+
+def read_replace(data: str) -> pd.DataFrame:
+    df = pd.read_csv(io.StringIO(data))
+    df.replace([r"^\s*$", "-1", -1], pd.NA, regex=True, inplace=True)
+    return df
+
+
+def read_normalize(data: str) -> pd.DataFrame:
+    df = pd.read_csv(io.StringIO(data), na_values=NA_VALUES)
+    return normalize_na(df)
+
+
+def bench(func, data: str) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    out = func(data)
+    return time.perf_counter() - start, out
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    data = make_csv(n_rows, n_columns)
+    print(f"{n_rows} rows x {n_columns} columns")
+
+    old_time, old = bench(read_replace, data)
+    new_time, new = bench(read_normalize, data)
+
+    pd.testing.assert_frame_equal(old.isna(), new.isna())
+
+    print(
+        f"read + replace {old_time:.2f}s, read + normalize_na {new_time:.2f}s, "
+        f"{old_time / new_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
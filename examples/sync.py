@@ -5,9 +5,8 @@ import pandas as pd
 
 from qualtrics_utils import (
     Surveys,
-    coalesce_multiselect,
+    apply_codebook,
     generate_codebook,
-    rename_columns,
 )
 from googleapiutils2 import Sheets, get_oauth2_creds
 
@@ -33,10 +32,7 @@ def post_processing_func(df: pd.DataFrame):
     codebook_path = pathlib.Path(config["qualtrics"]["codebook_path"])
 
     codebook = generate_codebook(codebook_path)
-    tmp = coalesce_multiselect(df, codebook=codebook)
-    tmp = rename_columns(tmp, codebook=codebook, verbose=False)
-
-    return tmp
+    return apply_codebook(df, codebook=codebook, verbose=False)
 
 
 sync(
@@ -1,18 +1,33 @@
+from qualtrics_utils.async_survey import AsyncSurveys
+from qualtrics_utils.cache import SchemaCache
 from qualtrics_utils.codebook.generate import generate_codebook
+from qualtrics_utils.polling import ETAPolling, ExponentialPolling, FixedPolling
 from qualtrics_utils.survey import Surveys
-from qualtrics_utils.sync import sync_sheets, sync_sql
+from qualtrics_utils.sync import sync_parquet, sync_sheets, sync_sql
 from qualtrics_utils.utils import (
+    ColumnPlan,
+    apply_codebook,
     coalesce_multiselect,
+    compile_column_plan,
     create_mysql_engine,
     rename_columns,
 )
 
 __all__ = [
     "Surveys",
+    "AsyncSurveys",
+    "SchemaCache",
+    "FixedPolling",
+    "ExponentialPolling",
+    "ETAPolling",
     "generate_codebook",
     "coalesce_multiselect",
+    "apply_codebook",
+    "ColumnPlan",
+    "compile_column_plan",
     "rename_columns",
     "create_mysql_engine",
     "sync_sheets",
     "sync_sql",
+    "sync_parquet",
 ]
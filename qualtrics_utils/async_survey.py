@@ -0,0 +1,755 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import datetime
+import tempfile
+from http import HTTPStatus
+from typing import IO, Any, AsyncIterator, Iterable, Literal, Optional, overload
+
+import pandas as pd
+from loguru import logger
+
+from qualtrics_utils.cache import SchemaCache
+from qualtrics_utils.misc import BASE_URL, VERSION, ExportedFile
+from qualtrics_utils.polling import (
+    ExponentialPolling,
+    Poller,
+    PollingMetrics,
+    PollingStrategy,
+    parse_retry_after,
+)
+from qualtrics_utils.survey import (
+    CHUNK_SIZE,
+    DOWNLOAD_CHUNK_SIZE,
+    READABLE_FORMATS,
+    SPOOL_MAX_SIZE,
+    as_utc,
+    find_filter_id,
+    iter_responses_chunks,
+    make_export_request,
+    merge_sharded_dfs,
+    read_export_df,
+    read_responses_df,
+    shard_date_range,
+)
+from qualtrics_utils.surveys_response_import_export_api_client.api.response_exports import (
+    create_export,
+    get_export_progress,
+    get_filters_list,
+)
+from qualtrics_utils.surveys_response_import_export_api_client.client import (
+    AuthenticatedClient,
+)
+from qualtrics_utils.surveys_response_import_export_api_client.models import (
+    CreationResponse,
+    ExportCreationRequestFormat,
+    ExportStatusResponse,
+    GetFiltersListResponse,
+    GetFiltersListResponseResultElementsItem,
+    RequestStatus,
+)
+from qualtrics_utils.surveys_response_import_export_api_client.types import Unset
+from qualtrics_utils.utils import ColumnPlan, compile_column_plan, parse_file_id
+
+
+class AsyncSurveys:
+    """An asyncio counterpart to `Surveys`, exposing the same surface.
+
+    Every request is made through a single, pooled `httpx.AsyncClient`, so one event loop
+    can drive many survey exports concurrently. Use as an async context manager, or call `aclose` when done.
+
+    CSV parsing is CPU-bound, so `get_responses_df` runs it in a worker thread to keep the event loop responsive.
+
+    Args:
+        api_token (str): The Qualtrics API token.
+        version (str, optional): The Qualtrics API version. Defaults to VERSION.
+        polling (PollingStrategy, optional): How to wait between polls of an export's progress. Defaults to ExponentialPolling().
+        poll_timeout (float, optional): The maximum number of seconds to wait for an export to complete. Defaults to None, no timeout.
+        max_concurrent_requests (int, optional): The maximum number of in-flight API requests. Defaults to None, unbounded.
+        schema_cache (SchemaCache, optional): The cache of survey response schemas. Defaults to an in-memory SchemaCache().
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        version: str = VERSION,
+        polling: PollingStrategy | None = None,
+        poll_timeout: float | None = None,
+        max_concurrent_requests: int | None = None,
+        schema_cache: SchemaCache | None = None,
+    ):
+        self.base_url = BASE_URL(version)
+        self.version = version
+
+        self.client = AuthenticatedClient(
+            token=api_token,
+            base_url=self.base_url,
+            prefix="",
+            auth_header_name="X-API-TOKEN",
+        )
+
+        self.polling = polling if polling is not None else ExponentialPolling()
+        self.poll_timeout = poll_timeout
+        # Metrics of every export polled by this client, in order.
+        self.polling_metrics: list[PollingMetrics] = []
+
+        self.schema_cache = schema_cache if schema_cache is not None else SchemaCache()
+
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrent_requests)
+            if max_concurrent_requests is not None
+            else None
+        )
+
+    async def __aenter__(self) -> AsyncSurveys:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.get_async_httpx_client().aclose()
+
+    def _limit(self) -> contextlib.AbstractAsyncContextManager:
+        return (
+            self._semaphore
+            if self._semaphore is not None
+            else contextlib.nullcontext()  # type: ignore
+        )
+
+    async def _get(self, url: str, headers: dict[str, str] | None = None):
+        async with self._limit():
+            return await self.client.get_async_httpx_client().get(url, headers=headers)
+
+    async def _get_json(self, url: str) -> dict[str, Any]:
+        r = await self._get(url)
+        r.raise_for_status()
+        return r.json()
+
+    async def _response_export(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        **kwargs: Any,
+    ) -> CreationResponse:
+        payload = make_export_request(
+            format=format,
+            use_labels=use_labels,
+            start_date=start_date,
+            end_date=end_date,
+            export_responses_in_progress=export_responses_in_progress,
+            continuation_token=continuation_token,
+            **kwargs,
+        )
+
+        logger.info(
+            f"Exporting responses from {survey_id} from {start_date} to {end_date}."
+        )
+        logger.debug(f"Exporting with payload: {payload}")
+
+        async with self._limit():
+            r = await create_export.asyncio(
+                survey_id=survey_id,
+                client=self.client,
+                json_body=payload,
+            )
+
+        if not isinstance(r, CreationResponse):
+            raise Exception("Export creation failed", r)
+
+        return r
+
+    async def _response_export_status(
+        self, survey_id: str, export_progress_id: str
+    ) -> ExportStatusResponse:
+        logger.info(f"Getting export progress for survey {survey_id}...")
+
+        poller = Poller(strategy=self.polling, timeout=self.poll_timeout)
+
+        while True:
+            async with self._limit():
+                response = await get_export_progress.asyncio_detailed(
+                    survey_id=survey_id,
+                    export_progress_id=export_progress_id,
+                    client=self.client,
+                )
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                delay = poller.next_delay(retry_after=retry_after)
+                logger.warning(f"Rate limited; retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                continue
+
+            r = response.parsed
+            if not isinstance(r, ExportStatusResponse):
+                raise Exception("Export failed", response)
+
+            status = r.result.status
+
+            logger.info(
+                f"Export progress for file {r.result.file_id}: {r.result.percent_complete}%"
+            )
+
+            match status:
+                case None | RequestStatus.FAILED:
+                    raise Exception("Export failed", r)
+                case RequestStatus.COMPLETE:
+                    metrics = poller.finish()
+                    self.polling_metrics.append(metrics)
+
+                    logger.info(
+                        f"Export completed after {metrics.polls} polls, {metrics.total_wait:.1f}s waiting and {metrics.elapsed:.1f}s total."
+                    )
+                    return r
+                case RequestStatus.INPROGRESS:
+                    await asyncio.sleep(
+                        poller.next_delay(
+                            percent_complete=r.result.percent_complete,
+                            retry_after=retry_after,
+                        )
+                    )
+
+    async def _iter_response_export_file(
+        self, survey_id: str, file_id: str
+    ) -> AsyncIterator[bytes]:
+        url = f"surveys/{survey_id}/export-responses/{file_id}/file"
+
+        async with self._limit():
+            async with self.client.get_async_httpx_client().stream("GET", url) as r:
+                r.raise_for_status()
+
+                async for chunk in r.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+
+    async def _response_export_file(self, survey_id: str, file_id: str) -> bytes:
+        logger.info(f"Downloading file {file_id} for survey {survey_id}...")
+
+        return b"".join(
+            [
+                chunk
+                async for chunk in self._iter_response_export_file(
+                    survey_id=survey_id, file_id=file_id
+                )
+            ]
+        )
+
+    async def _response_export_file_stream(
+        self, survey_id: str, file_id: str
+    ) -> IO[bytes]:
+        """Stream an export file into a spooled temporary file; see `Surveys._response_export_file_stream`."""
+        logger.info(f"Streaming file {file_id} for survey {survey_id}...")
+
+        file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+
+        try:
+            async for chunk in self._iter_response_export_file(
+                survey_id=survey_id, file_id=file_id
+            ):
+                file.write(chunk)
+        except BaseException:
+            file.close()
+            raise
+
+        logger.info(f"Downloaded {file.tell()} bytes for file {file_id}.")
+
+        file.seek(0)
+        return file  # type: ignore
+
+    async def list_filters(
+        self, survey_id: str
+    ) -> list[GetFiltersListResponseResultElementsItem]:
+        """List the saved filters of a survey, across every page; see `Surveys.list_filters`."""
+        survey_id = parse_file_id(survey_id)
+        logger.info(f"Listing filters for survey {survey_id}...")
+
+        async with self._limit():
+            r = await get_filters_list.asyncio(survey_id=survey_id, client=self.client)
+
+        filters = []
+
+        while True:
+            if not isinstance(r, GetFiltersListResponse):
+                raise Exception("Listing filters failed", r)
+
+            filters.extend(r.result.elements)
+
+            if not r.result.next_page:
+                return filters
+
+            r = GetFiltersListResponse.from_dict(
+                await self._get_json(r.result.next_page)
+            )
+
+    async def resolve_filter(self, survey_id: str, filter_name: str) -> str:
+        """Get the ID of a survey's saved filter by its name; see `Surveys.resolve_filter`."""
+        return find_filter_id(await self.list_filters(survey_id=survey_id), filter_name)
+
+    @overload
+    async def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: Literal[False] = False,
+        **kwargs: Any,
+    ) -> ExportedFile[bytes]: ...
+
+    @overload
+    async def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        *,
+        stream: Literal[True],
+        **kwargs: Any,
+    ) -> ExportedFile[IO[bytes]]: ...
+
+    @overload
+    async def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> ExportedFile[bytes] | ExportedFile[IO[bytes]]: ...
+
+    async def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> ExportedFile[Any]:
+        """Get responses from a survey by survey_id; see `Surveys.get_responses`."""
+        survey_id = parse_file_id(survey_id)
+
+        if filter_name is not None:
+            if filter_id is not None:
+                raise ValueError("Pass either a filter_id or a filter_name, not both.")
+
+            filter_id = await self.resolve_filter(
+                survey_id=survey_id, filter_name=filter_name
+            )
+
+        if columns is not None:
+            plan = await self.get_column_plan(
+                survey_id=survey_id, use_labels=use_labels
+            )
+            kwargs.update(plan.projection(columns))
+
+        if start_date is None and last_response_id is not None:
+            start_date = (
+                as_utc(last_start_date)
+                if last_start_date is not None
+                else await self._response_id_to_date(
+                    survey_id=survey_id, response_id=last_response_id
+                )
+            )
+
+        export = await self._response_export(
+            survey_id=survey_id,
+            format=format,
+            use_labels=use_labels,
+            start_date=start_date,
+            end_date=end_date,
+            export_responses_in_progress=export_responses_in_progress,
+            continuation_token=continuation_token,
+            filter_id=filter_id,
+            **kwargs,
+        )
+
+        progress_id = export.result.progress_id
+        export_status = await self._response_export_status(
+            survey_id=survey_id, export_progress_id=progress_id
+        )
+
+        file_id = export_status.result.file_id
+        if isinstance(file_id, Unset):
+            raise ValueError(f"Export of survey {survey_id} completed without a file.")
+
+        # Only continuable exports have a continuation token.
+        next_continuation_token = export_status.result.continuation_token
+
+        file = await (
+            self._response_export_file_stream(survey_id=survey_id, file_id=file_id)
+            if stream
+            else self._response_export_file(survey_id=survey_id, file_id=file_id)
+        )
+
+        return ExportedFile(
+            survey_id=survey_id,
+            file_id=file_id,
+            last_response_id=None,
+            continuation_token=(
+                next_continuation_token
+                if not isinstance(next_continuation_token, Unset)
+                else None
+            ),
+            data=file,
+            timestamp=datetime.datetime.now(),
+        )
+
+    async def get_response(self, survey_id: str, response_id: str) -> dict[str, Any]:
+        """Get a single response from a survey by survey_id and response_id; see `Surveys.get_response`."""
+        survey_id = parse_file_id(survey_id)
+
+        return await self._get_json(f"surveys/{survey_id}/responses/{response_id}")
+
+    async def _response_id_to_date(
+        self, survey_id: str, response_id: str
+    ) -> datetime.datetime | None:
+        response = await self.get_response(survey_id=survey_id, response_id=response_id)
+
+        return datetime.datetime.fromisoformat(
+            response["result"]["values"]["startDate"]
+        )
+
+    async def iter_responses_df(
+        self,
+        survey_id: str,
+        use_labels: bool = True,
+        end_date: datetime.datetime | None = None,
+        start_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        filter_preview: bool = True,
+        dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        chunksize: int = CHUNK_SIZE,
+        stream: bool = True,
+        format: ExportCreationRequestFormat | str = ExportCreationRequestFormat.CSV,
+        **kwargs: Any,
+    ) -> AsyncIterator[ExportedFile[pd.DataFrame]]:
+        """Get responses from a survey by survey_id, as an async iterator of DataFrame chunks; see `Surveys.iter_responses_df`.
+
+        Each chunk is parsed in a worker thread, like `get_responses_df`.
+        """
+        survey_id = parse_file_id(survey_id)
+        format = ExportCreationRequestFormat(format)
+
+        if format not in READABLE_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        raw_data, plan = await asyncio.gather(
+            self.get_responses(
+                survey_id=survey_id,
+                format=format,
+                use_labels=use_labels,
+                end_date=end_date,
+                start_date=start_date,
+                export_responses_in_progress=export_responses_in_progress,
+                continuation_token=continuation_token,
+                last_response_id=last_response_id,
+                last_start_date=last_start_date,
+                columns=columns,
+                stream=stream,
+                **kwargs,
+            ),
+            self.get_column_plan(
+                survey_id=survey_id,
+                use_labels=use_labels,
+                columns=columns,
+                categorical=categorical,
+            ),
+        )
+        read_dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
+
+        chunks = iter_responses_chunks(
+            raw_data=raw_data,
+            dtypes=read_dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            format=format,
+            fields=plan.fields,
+            use_labels=use_labels,
+            chunksize=chunksize,
+        )
+
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
+    async def get_responses_df(
+        self,
+        survey_id: str,
+        use_labels: bool = True,
+        end_date: datetime.datetime | None = None,
+        start_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        filter_preview: bool = True,
+        dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        stream: bool = True,
+        shards: int = 1,
+        engine: str = "c",
+        dtype_backend: str | None = None,
+        format: ExportCreationRequestFormat | str = ExportCreationRequestFormat.CSV,
+        **kwargs: Any,
+    ) -> ExportedFile[pd.DataFrame]:
+        """Get responses from a survey by survey_id, as a DataFrame; see `Surveys.get_responses_df`."""
+        survey_id = parse_file_id(survey_id)
+        format = ExportCreationRequestFormat(format)
+
+        if format not in READABLE_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        if shards > 1:
+            return await self._get_responses_df_sharded(
+                survey_id=survey_id,
+                shards=shards,
+                use_labels=use_labels,
+                end_date=end_date,
+                start_date=start_date,
+                export_responses_in_progress=export_responses_in_progress,
+                continuation_token=continuation_token,
+                last_response_id=last_response_id,
+                last_start_date=last_start_date,
+                filter_preview=filter_preview,
+                dtypes=dtypes,
+                columns=columns,
+                categorical=categorical,
+                stream=stream,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                format=format,
+                **kwargs,
+            )
+
+        raw_data, plan = await asyncio.gather(
+            self.get_responses(
+                survey_id=survey_id,
+                format=format,
+                use_labels=use_labels,
+                end_date=end_date,
+                start_date=start_date,
+                export_responses_in_progress=export_responses_in_progress,
+                continuation_token=continuation_token,
+                last_response_id=last_response_id,
+                last_start_date=last_start_date,
+                columns=columns,
+                stream=stream,
+                **kwargs,
+            ),
+            self.get_column_plan(
+                survey_id=survey_id,
+                use_labels=use_labels,
+                columns=columns,
+                categorical=categorical,
+            ),
+        )
+        read_dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
+
+        return await asyncio.to_thread(
+            read_responses_df,
+            raw_data=raw_data,
+            dtypes=read_dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            format=format,
+            fields=plan.fields,
+            use_labels=use_labels,
+        )
+
+    async def _get_responses_df_sharded(
+        self,
+        survey_id: str,
+        shards: int,
+        use_labels: bool = True,
+        end_date: datetime.datetime | None = None,
+        start_date: datetime.datetime | None = None,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        filter_preview: bool = True,
+        dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        engine: str = "c",
+        dtype_backend: str | None = None,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        **kwargs: Any,
+    ) -> ExportedFile[pd.DataFrame]:
+        if continuation_token is not None:
+            raise ValueError("Sharded exports can't be continued.")
+
+        if start_date is None and last_response_id is not None:
+            start_date = (
+                last_start_date
+                if last_start_date is not None
+                else await self._response_id_to_date(
+                    survey_id=survey_id, response_id=last_response_id
+                )
+            )
+        if start_date is None:
+            raise ValueError(
+                "Sharded exports need a start_date, or a last_response_id to resume from."
+            )
+
+        date_ranges = shard_date_range(
+            start_date=as_utc(start_date),
+            end_date=as_utc(
+                end_date
+                if end_date is not None
+                else datetime.datetime.now(datetime.timezone.utc)
+            ),
+            shards=shards,
+        )
+        if not date_ranges:
+            raise ValueError(
+                "The start_date of a sharded export must precede its end_date."
+            )
+
+        # Resolved and fetched once, rather than by every shard.
+        if kwargs.get("filter_name") is not None and kwargs.get("filter_id") is None:
+            kwargs["filter_id"] = await self.resolve_filter(
+                survey_id=survey_id, filter_name=kwargs.pop("filter_name")
+            )
+
+        plan = await self.get_column_plan(
+            survey_id=survey_id,
+            use_labels=use_labels,
+            columns=columns,
+            categorical=categorical,
+        )
+        read_dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
+
+        logger.info(f"Exporting {len(date_ranges)} shards of survey {survey_id}...")
+
+        async def export_shard(date_range: tuple[datetime.datetime, datetime.datetime]):
+            t_start_date, t_end_date = date_range
+
+            raw_data = await self.get_responses(
+                survey_id=survey_id,
+                format=format,
+                use_labels=use_labels,
+                start_date=t_start_date,
+                end_date=t_end_date,
+                columns=columns,
+                **kwargs,
+            )
+            df = await asyncio.to_thread(
+                read_export_df,
+                raw_data=raw_data,
+                dtypes=read_dtypes,
+                parse_dates=parse_dates,
+                last_response_id=last_response_id,
+                filter_preview=filter_preview,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                format=format,
+                fields=plan.fields,
+                use_labels=use_labels,
+            )
+            return raw_data, df
+
+        results = await asyncio.gather(*map(export_shard, date_ranges))
+
+        return merge_sharded_dfs(list(results), last_response_id=last_response_id)
+
+    async def get_column_plan(
+        self,
+        survey_id: str,
+        use_labels: bool = True,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+    ) -> ColumnPlan:
+        """Get the compiled column plan of a survey's responses; see `Surveys.get_column_plan`."""
+        survey_id = parse_file_id(survey_id)
+        schema = await self.get_survey_schema(survey_id=survey_id)
+
+        plan = self.schema_cache.memoize(
+            survey_id,
+            ("column_plan", use_labels, categorical),
+            lambda: compile_column_plan(
+                schema=schema,
+                use_labels=use_labels,
+                categorical=categorical,
+            ),
+        )
+        return plan.project(columns) if columns is not None else plan
+
+    async def get_survey_schema(self, survey_id: str) -> dict[str, Any]:
+        """Get the schema of a survey by survey_id; see `Surveys.get_survey_schema`."""
+        survey_id = parse_file_id(survey_id)
+
+        entry = self.schema_cache.get(survey_id)
+        if entry is not None and self.schema_cache.is_fresh(entry):
+            return entry.schema
+
+        logger.info(f"Getting schema for survey {survey_id}...")
+
+        r = await self._get(
+            f"surveys/{survey_id}/response-schema/",
+            headers=entry.revalidation_headers() if entry is not None else None,
+        )
+
+        if entry is not None and r.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.info(f"Schema for survey {survey_id} is unchanged.")
+            self.schema_cache.touch(survey_id)
+            return entry.schema
+
+        r.raise_for_status()
+
+        entry = self.schema_cache.put(
+            survey_id,
+            schema=r.json(),
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
+        return entry.schema
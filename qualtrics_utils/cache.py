@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+from loguru import logger
+
+V = TypeVar("V")
+
+
+@dataclass
+class SchemaCacheEntry:
+    """A cached survey response schema, with the validators needed to revalidate it.
+
+    `derived` memoizes values computed from the schema, e.g. its dtypes; it's never persisted to disk.
+    """
+
+    schema: dict[str, Any]
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    derived: dict[Any, Any] = field(default_factory=dict)
+
+    def revalidation_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SchemaCache:
+    """A cache of survey response schemas, keyed by survey ID.
+
+    Entries are kept in an in-memory LRU of `maxsize` entries, and optionally persisted as JSON files under `path`,
+    so they survive across processes, e.g. incremental syncs run on a cron.
+
+    An entry younger than `ttl` seconds is used as-is. A stale entry is revalidated with the `ETag` and `Last-Modified`
+    validators it was served with, if any, so that an unchanged schema needn't be downloaded again.
+
+    Args:
+        maxsize (int, optional): The maximum number of in-memory entries. Defaults to 128.
+        ttl (float, optional): The number of seconds an entry is considered fresh. Defaults to 300.
+        path (pathlib.Path | str, optional): The directory to persist entries to. Defaults to None, in-memory only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        path: pathlib.Path | str | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = pathlib.Path(path) if path is not None else None
+
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, SchemaCacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _entry_path(self, survey_id: str) -> pathlib.Path:
+        assert self.path is not None
+        return self.path / f"{survey_id}.json"
+
+    def _load(self, survey_id: str) -> SchemaCacheEntry | None:
+        if self.path is None or not (path := self._entry_path(survey_id)).exists():
+            return None
+
+        try:
+            return SchemaCacheEntry(**json.loads(path.read_text()))
+        except Exception as e:
+            logger.warning(f"Failed to load cached schema for survey {survey_id}: {e}")
+            return None
+
+    def _dump(self, survey_id: str, entry: SchemaCacheEntry):
+        if self.path is None:
+            return
+
+        data = dict(
+            schema=entry.schema,
+            fetched_at=entry.fetched_at,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+        )
+        self._entry_path(survey_id).write_text(json.dumps(data))
+
+    def _set(self, survey_id: str, entry: SchemaCacheEntry):
+        self._entries[survey_id] = entry
+        self._entries.move_to_end(survey_id)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, survey_id: str) -> SchemaCacheEntry | None:
+        """Get the entry of a survey, fresh or not."""
+        with self._lock:
+            if (entry := self._entries.get(survey_id)) is not None:
+                self._entries.move_to_end(survey_id)
+                return entry
+
+            if (entry := self._load(survey_id)) is not None:
+                self._set(survey_id, entry)
+
+            return entry
+
+    def is_fresh(self, entry: SchemaCacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(
+        self,
+        survey_id: str,
+        schema: dict[str, Any],
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> SchemaCacheEntry:
+        """Cache a freshly fetched schema, replacing any previous entry and its derived values."""
+        entry = SchemaCacheEntry(
+            schema=schema,
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+        with self._lock:
+            self._set(survey_id, entry)
+            self._dump(survey_id, entry)
+
+        return entry
+
+    def touch(self, survey_id: str) -> SchemaCacheEntry | None:
+        """Mark the entry of a survey as fresh, e.g. after the server confirmed it's unchanged."""
+        with self._lock:
+            if (entry := self.get(survey_id)) is None:
+                return None
+
+            entry.fetched_at = time.time()
+            self._dump(survey_id, entry)
+
+            return entry
+
+    def memoize(self, survey_id: str, key: Any, func: Callable[[], V]) -> V:
+        """Get a value derived from the cached schema of a survey, computing it with `func` on first use."""
+        with self._lock:
+            if (entry := self.get(survey_id)) is None:
+                return func()
+
+            if key not in entry.derived:
+                entry.derived[key] = func()
+
+            return entry.derived[key]
+
+    def invalidate(self, survey_id: str | None = None):
+        """Drop the entry of a survey, or every entry if no survey is given."""
+        with self._lock:
+            survey_ids = [survey_id] if survey_id is not None else list(self._entries)
+
+            for t_survey_id in survey_ids:
+                self._entries.pop(t_survey_id, None)
+
+                if self.path is not None:
+                    self._entry_path(t_survey_id).unlink(missing_ok=True)
+
+            if survey_id is None and self.path is not None:
+                for path in self.path.glob("*.json"):
+                    path.unlink(missing_ok=True)
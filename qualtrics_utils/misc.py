@@ -26,3 +26,9 @@ class ExportedFile(Generic[T]):
     timestamp: datetime
 
     data: T
+
+    # Watermarks of the exported responses: the latest start, recorded and modified dates, and the number of responses.
+    last_start_date: datetime | None = None
+    last_recorded_date: datetime | None = None
+    last_modified_date: datetime | None = None
+    row_count: int | None = None
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import datetime
+import json
+import pathlib
+import uuid
+from typing import Any
+
+import pandas as pd
+from loguru import logger
+
+from qualtrics_utils.utils import decode_categoricals
+
+# Responses are partitioned by the month of their start date, as hive-style `start_month=YYYY-MM` directories.
+PARTITION_COLUMN = "start_month"
+PARTITION_DATE_COLUMN = "StartDate"
+
+# The default maximum number of rows per row group of each written file.
+ROW_GROUP_SIZE = 100_000
+
+# The status of each sync is appended to a JSON lines file of this suffix, next to the responses dataset.
+STATUS_SUFFIX = ".jsonl"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet syncs require pyarrow: pip install qualtrics-utils[arrow]"
+        ) from e
+
+    return pa, pc, pq
+
+
+def format_part_name(timestamp: datetime.datetime) -> str:
+    """Name the files written by one sync, so that they sort in the order they were written."""
+    return f"part-{timestamp:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+
+def to_arrow_table(df: pd.DataFrame):
+    """Convert responses to an Arrow table, with the response ID as a column and the partition column added.
+
+    Categoricals are decoded, and columns without any value are typed as strings, rather than Arrow's null type,
+    so that every file of a dataset shares the same types.
+    """
+    pa, _, _ = _import_pyarrow()
+
+    df = decode_categoricals(df).reset_index(drop=False)
+    df[PARTITION_COLUMN] = pd.to_datetime(df[PARTITION_DATE_COLUMN]).dt.strftime(
+        "%Y-%m"
+    )
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Object columns of mixed types, e.g. after post-processing, are written as strings.
+        df = df.astype(
+            {
+                col: "string"
+                for col in df.columns
+                if pd.api.types.is_object_dtype(df[col])
+            }
+        )
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+    schema = pa.schema(
+        [
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in table.schema
+        ]
+    )
+    return table.cast(schema)
+
+
+def write_dataset(
+    df: pd.DataFrame,
+    path: pathlib.Path,
+    name: str,
+    row_group_size: int = ROW_GROUP_SIZE,
+):
+    """Append responses to a Parquet dataset partitioned by PARTITION_COLUMN, as a new file named `name` per partition.
+
+    Existing files are left as-is: each write adds row groups to the dataset, never rewriting it.
+    """
+    _, _, pq = _import_pyarrow()
+
+    if df.empty:
+        return
+
+    table = to_arrow_table(df)
+
+    pq.write_to_dataset(
+        table,
+        root_path=str(path),
+        partition_cols=[PARTITION_COLUMN],
+        basename_template=f"{name}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=row_group_size,
+    )
+
+    logger.info(f"Wrote {len(df)} responses to {path}.")
+
+
+def upsert_dataset(
+    df: pd.DataFrame,
+    path: pathlib.Path,
+    name: str,
+    row_group_size: int = ROW_GROUP_SIZE,
+):
+    """Merge responses into a Parquet dataset written by `write_dataset`, keyed on their index, e.g. the response ID.
+
+    Only the partitions of the responses are touched: their files holding any of the responses are rewritten without
+    them, and the responses are then appended. New files are written before old ones are removed, so an interrupted
+    upsert can leave duplicates behind, but never lose responses.
+    """
+    pa, pc, pq = _import_pyarrow()
+
+    if df.empty:
+        return
+
+    index_name = str(df.index.name)
+    ids = pa.array(df.index.astype(str).tolist(), type=pa.string())
+
+    months = pd.to_datetime(df[PARTITION_DATE_COLUMN]).dt.strftime("%Y-%m").unique()
+    stale_paths: list[pathlib.Path] = []
+
+    for month in months:
+        partition_path = path / f"{PARTITION_COLUMN}={month}"
+
+        for file_path in sorted(partition_path.glob("*.parquet")):
+            table = pq.read_table(file_path)
+            mask = pc.is_in(table[index_name].cast(pa.string()), value_set=ids)
+
+            if not pc.any(mask).as_py():
+                continue
+
+            kept = table.filter(pc.invert(mask))
+            if kept.num_rows > 0:
+                pq.write_table(
+                    kept,
+                    partition_path
+                    / f"{format_part_name(datetime.datetime.now())}.parquet",
+                    row_group_size=row_group_size,
+                )
+
+            stale_paths.append(file_path)
+
+    write_dataset(df, path=path, name=name, row_group_size=row_group_size)
+
+    # Only once every replacement is written are the files they replace removed.
+    for file_path in stale_paths:
+        file_path.unlink()
+
+
+def read_last_status(path: pathlib.Path) -> dict[str, Any] | None:
+    """Read the last status appended to a status file by `append_status`, if any."""
+    if not path.exists():
+        return None
+
+    lines = [line for line in path.read_text().splitlines() if line.strip()]
+
+    return json.loads(lines[-1]) if len(lines) > 0 else None
+
+
+def append_status(path: pathlib.Path, status: dict[str, Any]):
+    """Append a status row to a JSON lines status file, with dates as ISO strings."""
+    row = {
+        k: v.isoformat() if isinstance(v, datetime.datetime) else v
+        for k, v in status.items()
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("a") as f:
+        f.write(json.dumps(row) + "\n")
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import abc
+import random
+import time
+from dataclasses import dataclass, field
+
+
+class PollingStrategy(abc.ABC):
+    """Decides how long to wait between polls of a long-running Qualtrics job, e.g. a response export.
+
+    Subclasses implement `delay`, which is given the number of polls made so far,
+    the seconds elapsed since polling began, and the job's last reported percent complete, if any.
+    """
+
+    @abc.abstractmethod
+    def delay(
+        self, polls: int, elapsed: float, percent_complete: float | None
+    ) -> float: ...
+
+
+@dataclass
+class FixedPolling(PollingStrategy):
+    """Wait a fixed `interval` seconds between polls."""
+
+    interval: float = 1.0
+
+    def delay(
+        self, polls: int, elapsed: float, percent_complete: float | None
+    ) -> float:
+        return self.interval
+
+
+@dataclass
+class ExponentialPolling(PollingStrategy):
+    """Wait `initial * factor ** polls` seconds between polls, capped at `max_delay`.
+
+    A random `jitter` fraction of the delay is added or subtracted,
+    so that concurrent syncs don't poll the API in lockstep.
+    """
+
+    initial: float = 0.5
+    factor: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.1
+
+    def delay(
+        self, polls: int, elapsed: float, percent_complete: float | None
+    ) -> float:
+        delay = min(self.initial * self.factor**polls, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+@dataclass
+class ETAPolling(PollingStrategy):
+    """Estimate the time remaining from the job's rate of progress, and wait for a `fraction` thereof.
+
+    Until any progress is reported, or while it's missing, e.g. UNSET, fall back to `fallback`, a fixed interval by default.
+    The delay is always clamped to [`min_delay`, `max_delay`].
+    """
+
+    fraction: float = 0.5
+    min_delay: float = 0.5
+    max_delay: float = 30.0
+    fallback: PollingStrategy = field(default_factory=FixedPolling)
+
+    def delay(
+        self, polls: int, elapsed: float, percent_complete: float | None
+    ) -> float:
+        if (
+            not isinstance(percent_complete, (int, float))
+            or percent_complete <= 0
+            or elapsed <= 0
+        ):
+            delay = self.fallback.delay(polls, elapsed, percent_complete)
+        else:
+            rate = percent_complete / elapsed
+            delay = self.fraction * (100 - percent_complete) / rate
+
+        return min(max(delay, self.min_delay), self.max_delay)
+
+
+@dataclass
+class PollingMetrics:
+    """Metrics of a single polling loop: the number of polls made, and the seconds spent waiting and in total."""
+
+    polls: int = 0
+    total_wait: float = 0.0
+    elapsed: float = 0.0
+
+
+class Poller:
+    """Tracks a single polling loop, driven by a `PollingStrategy`.
+
+    Call `next_delay` after each unfinished poll to get the number of seconds to wait before the next;
+    the caller is responsible for actually waiting, so the same poller works for both blocking and async code.
+
+    If a server hint is given, e.g. a `Retry-After` header, it takes precedence over the strategy's delay.
+
+    Args:
+        strategy (PollingStrategy): The strategy used to compute the delay between polls.
+        timeout (float, optional): The maximum number of seconds to poll for. Defaults to None, no timeout.
+    """
+
+    def __init__(self, strategy: PollingStrategy, timeout: float | None = None):
+        self.strategy = strategy
+        self.timeout = timeout
+        self.metrics = PollingMetrics()
+
+        self._start = time.monotonic()
+
+    def next_delay(
+        self, percent_complete: float | None = None, retry_after: float | None = None
+    ) -> float:
+        self.metrics.polls += 1
+        self.metrics.elapsed = time.monotonic() - self._start
+
+        delay = (
+            retry_after
+            if retry_after is not None
+            else self.strategy.delay(
+                self.metrics.polls - 1, self.metrics.elapsed, percent_complete
+            )
+        )
+
+        if self.timeout is not None:
+            remaining = self.timeout - self.metrics.elapsed
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Polling timed out after {self.metrics.elapsed:.1f}s and {self.metrics.polls} polls."
+                )
+            delay = min(delay, remaining)
+
+        self.metrics.total_wait += delay
+        return delay
+
+    def finish(self) -> PollingMetrics:
+        self.metrics.elapsed = time.monotonic() - self._start
+        return self.metrics
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given in seconds; HTTP-date values are ignored."""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
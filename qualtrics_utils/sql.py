@@ -0,0 +1,529 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+import pandas as pd
+import sqlalchemy
+from loguru import logger
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from qualtrics_utils.utils import dtype_to_sqlalchemy
+
+# The default number of rows per multi-row INSERT statement.
+BATCH_SIZE = 1_000
+
+# The default number of rows per `LOAD DATA` file.
+LOAD_DATA_BATCH_SIZE = 100_000
+
+# The null marker of `LOAD DATA`.
+TSV_NULL = "\\N"
+
+TSV_ESCAPES = [
+    ("\\", "\\\\"),
+    ("\t", "\\t"),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+    ("\0", "\\0"),
+]
+
+# Cap the bound parameters of a single statement (rows x columns) to stay below driver limits, e.g. SQLite's 32,766.
+MAX_BIND_PARAMS = 32_000
+
+
+class MetadataCache:
+    """A cache of the reflected tables of a single engine, keyed by table name.
+
+    Reflecting a wide table takes several round trips, so tables are reflected once and then reused;
+    anything that creates, drops or alters a table must `invalidate` it.
+    """
+
+    def __init__(self):
+        self._tables: dict[str, Table] = {}
+        self._lock = threading.RLock()
+
+    def get_table(self, conn: sqlalchemy.Connection, table_name: str) -> Table:
+        """Get a table, reflecting it on first use."""
+        with self._lock:
+            if (table := self._tables.get(table_name)) is None:
+                table = Table(table_name, MetaData(), autoload_with=conn)
+                self._tables[table_name] = table
+
+            return table
+
+    def has_table(self, conn: sqlalchemy.Connection, table_name: str) -> bool:
+        with self._lock:
+            return table_name in self._tables or conn.dialect.has_table(
+                conn, table_name
+            )
+
+    def invalidate(self, table_name: str | None = None):
+        """Drop a table, or every table if no name is given, to be reflected anew on next use."""
+        with self._lock:
+            if table_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_name, None)
+
+
+_metadata_caches: weakref.WeakKeyDictionary[sqlalchemy.Engine, MetadataCache] = (
+    weakref.WeakKeyDictionary()
+)
+_metadata_caches_lock = threading.Lock()
+
+
+def get_metadata_cache(conn: sqlalchemy.Connection) -> MetadataCache:
+    """Get the metadata cache of a connection's engine, shared by all its connections."""
+    with _metadata_caches_lock:
+        return _metadata_caches.setdefault(conn.engine, MetadataCache())
+
+
+def missing_columns(table: Table, df: pd.DataFrame) -> list[Column]:
+    """Get the columns of a DataFrame that are missing from `table`, typed per `dtype_to_sqlalchemy`."""
+    return [
+        Column(str(name), dtype_to_sqlalchemy(dtype))
+        for name, dtype in df.dtypes.items()
+        if str(name) not in table.columns
+    ]
+
+
+def add_columns(conn: sqlalchemy.Connection, table: Table, columns: list[Column]):
+    """Add columns to an existing table with `ALTER TABLE ... ADD COLUMN`.
+
+    All columns are added in a single statement where the dialect supports it, i.e. all but SQLite.
+    The table's entry in the metadata cache is invalidated. The caller is responsible for committing.
+    """
+    if len(columns) == 0:
+        return
+
+    quote = conn.dialect.identifier_preparer.quote
+    table_name = quote(table.name)
+
+    add_clauses = [
+        f"ADD COLUMN {quote(col.name)} {col.type.compile(dialect=conn.dialect)}"
+        for col in columns
+    ]
+
+    if conn.dialect.name == "sqlite":
+        for add_clause in add_clauses:
+            conn.execute(sqlalchemy.text(f"ALTER TABLE {table_name} {add_clause}"))
+    else:
+        conn.execute(
+            sqlalchemy.text(f"ALTER TABLE {table_name} {', '.join(add_clauses)}")
+        )
+
+    get_metadata_cache(conn).invalidate(table.name)
+
+    logger.info(
+        f"Added {len(columns)} columns to {table.name}: {[col.name for col in columns]}"
+    )
+
+
+def create_unique_index(
+    conn: sqlalchemy.Connection, table_name: str, columns: list[str]
+):
+    """Create a unique index on `columns` of an existing table, e.g. after bulk-loading it without one."""
+    quote = conn.dialect.identifier_preparer.quote
+    # Index names are global to a schema on some dialects, and tables may be renamed; so make them unique.
+    index_name = f"uq_{uuid.uuid4().hex[:16]}"
+
+    conn.execute(
+        sqlalchemy.text(
+            f"CREATE UNIQUE INDEX {quote(index_name)} ON {quote(table_name)} "
+            f"({', '.join(quote(col) for col in columns)})"
+        )
+    )
+
+
+def has_unique_index(
+    conn: sqlalchemy.Connection, table_name: str, columns: list[str]
+) -> bool:
+    """Whether an existing table has a unique index, constraint or primary key on exactly `columns`."""
+    inspector = sqlalchemy.inspect(conn)
+    key: frozenset[str | None] = frozenset(columns)
+
+    unique_keys: set[frozenset[str | None]] = {
+        frozenset(inspector.get_pk_constraint(table_name)["constrained_columns"]),
+        *(
+            frozenset(c["column_names"])
+            for c in inspector.get_unique_constraints(table_name)
+        ),
+        *(
+            frozenset(i["column_names"])
+            for i in inspector.get_indexes(table_name)
+            if i["unique"]
+        ),
+    }
+    return key in unique_keys
+
+
+def swap_tables(conn: sqlalchemy.Connection, renames: dict[str, str]):
+    """Atomically replace tables with others, e.g. live tables with fully loaded staging tables.
+
+    `renames` maps each replacement table to the table it replaces, which need not exist.
+    The replaced tables are renamed out of the way and then dropped.
+
+    On MySQL, all renames happen in a single, atomic `RENAME TABLE` statement. Elsewhere, they're issued one by one
+    within a single transaction, which is only atomic on dialects with transactional DDL, e.g. PostgreSQL, or SQLite
+    with pysqlite set to emit `BEGIN` itself; drivers that autocommit DDL can leave an interrupted swap half done.
+    This commits any open transaction.
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    metadata_cache = get_metadata_cache(conn)
+
+    old_names = {name: f"{name}_old" for name in renames.values()}
+
+    for old_name in old_names.values():
+        Table(old_name, MetaData()).drop(conn, checkfirst=True)
+    conn.commit()
+
+    pairs = [
+        (name, old_names[name])
+        for name in renames.values()
+        if metadata_cache.has_table(conn, name)
+    ] + list(renames.items())
+
+    if conn.dialect.name in ("mysql", "mariadb"):
+        conn.execute(
+            sqlalchemy.text(
+                "RENAME TABLE "
+                + ", ".join(f"{quote(src)} TO {quote(dst)}" for src, dst in pairs)
+            )
+        )
+    else:
+        for src, dst in pairs:
+            conn.execute(
+                sqlalchemy.text(f"ALTER TABLE {quote(src)} RENAME TO {quote(dst)}")
+            )
+    conn.commit()
+
+    for name in [*renames, *renames.values(), *old_names.values()]:
+        metadata_cache.invalidate(name)
+
+    for old_name in old_names.values():
+        Table(old_name, MetaData()).drop(conn, checkfirst=True)
+    conn.commit()
+
+    logger.info(f"Swapped tables: {renames}")
+
+
+class WriteMethod(Enum):
+    """How responses are written to a SQL table.
+
+    - TO_SQL: `pd.DataFrame.to_sql`, appending rows.
+    - BULK: batched multi-row `INSERT` statements, with a `ConflictPolicy`.
+    - LOAD_DATA: MySQL's `LOAD DATA LOCAL INFILE` from batches staged to local TSV files;
+        falls back to BULK on other dialects.
+    """
+
+    TO_SQL = "to_sql"
+    BULK = "bulk"
+    LOAD_DATA = "load_data"
+
+
+class ConflictPolicy(Enum):
+    """What to do when an inserted row conflicts with an existing one on a unique key, e.g. its response ID.
+
+    - ERROR: raise, as a plain `INSERT` would.
+    - IGNORE: keep the existing row.
+    - UPDATE: overwrite the existing row, i.e. upsert.
+    """
+
+    ERROR = "error"
+    IGNORE = "ignore"
+    UPDATE = "update"
+
+
+@dataclass
+class WriteStats:
+    """Statistics of a single bulk write."""
+
+    rows: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def insert_statement(
+    table: Table,
+    dialect: sqlalchemy.Dialect,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+    key_columns: list[str] | None = None,
+    update_columns: list[str] | None = None,
+):
+    """Create an `INSERT` statement into `table` that handles conflicts per `on_conflict`, for the given dialect.
+
+    MySQL uses `INSERT IGNORE` and `ON DUPLICATE KEY UPDATE`, which apply to any unique key of the table.
+    SQLite and PostgreSQL use `ON CONFLICT`, which requires the unique `key_columns` to be given.
+
+    Args:
+        table (Table): The table to insert into.
+        dialect (sqlalchemy.Dialect): The dialect of the target database.
+        on_conflict (ConflictPolicy, optional): The conflict policy. Defaults to ConflictPolicy.ERROR.
+        key_columns (list[str], optional): The unique key columns conflicts are detected on. Defaults to None.
+        update_columns (list[str], optional): The columns overwritten on conflict. Defaults to None, all non-key columns.
+    """
+    if on_conflict == ConflictPolicy.ERROR:
+        return table.insert()
+
+    key_columns = key_columns if key_columns is not None else []
+    if update_columns is None:
+        update_columns = [
+            col.name
+            for col in table.columns
+            if col.name not in key_columns and not col.primary_key
+        ]
+
+    match dialect.name:
+        case "mysql" | "mariadb":
+            stmt = mysql.insert(table)
+
+            if on_conflict == ConflictPolicy.IGNORE or len(update_columns) == 0:
+                return stmt.prefix_with("IGNORE")
+
+            return stmt.on_duplicate_key_update(
+                {col: stmt.inserted[col] for col in update_columns}
+            )
+        case "sqlite" | "postgresql":
+            if len(key_columns) == 0:
+                raise ValueError(
+                    f"Key columns are required to handle conflicts on {dialect.name}."
+                )
+
+            stmt = (sqlite if dialect.name == "sqlite" else postgresql).insert(table)
+
+            if on_conflict == ConflictPolicy.IGNORE or len(update_columns) == 0:
+                return stmt.on_conflict_do_nothing(index_elements=key_columns)
+
+            return stmt.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={col: stmt.excluded[col] for col in update_columns},
+            )
+        case _:
+            raise ValueError(
+                f"Conflict policy {on_conflict.value} is not supported on {dialect.name}."
+            )
+
+
+@contextlib.contextmanager
+def transaction(conn: sqlalchemy.Connection):
+    """Commit everything executed on `conn` within the block at once, or roll it all back on failure.
+
+    The transaction is begun up front, unless one is already open, so that writers which only commit transactions
+    they've begun themselves, e.g. `pd.DataFrame.to_sql`, join it rather than committing on their own.
+    """
+    if not conn.in_transaction():
+        conn.begin()
+
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def frame_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame, including its index, to a list of records, with every null value as None."""
+    df = df.reset_index(drop=False)
+    df = df.astype(object).where(df.notna(), None)
+
+    columns = [str(col) for col in df.columns]
+
+    return [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
+
+
+def bulk_insert(
+    conn: sqlalchemy.Connection,
+    table: Table,
+    df: pd.DataFrame,
+    batch_size: int = BATCH_SIZE,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+) -> WriteStats:
+    """Insert a DataFrame, including its index, into `table` with batched multi-row `INSERT` statements.
+
+    Conflicts are detected on the DataFrame's index columns, e.g. the response ID; see `insert_statement`.
+    The caller is responsible for committing.
+
+    Args:
+        conn (sqlalchemy.Connection): The connection to the target database.
+        table (Table): The table to insert into. Its columns must include those of the DataFrame.
+        df (pd.DataFrame): The DataFrame to insert.
+        batch_size (int, optional): The maximum number of rows per statement. Defaults to BATCH_SIZE.
+        on_conflict (ConflictPolicy, optional): The conflict policy. Defaults to ConflictPolicy.ERROR.
+    """
+    stats = WriteStats()
+    start = time.perf_counter()
+
+    key_columns = [str(name) for name in df.index.names if name is not None]
+    update_columns = [str(col) for col in df.columns]
+
+    stmt = insert_statement(
+        table=table,
+        dialect=conn.dialect,
+        on_conflict=on_conflict,
+        key_columns=key_columns,
+        update_columns=update_columns,
+    )
+
+    n_columns = len(key_columns) + len(update_columns)
+    batch_size = max(min(batch_size, MAX_BIND_PARAMS // max(n_columns, 1)), 1)
+
+    for i in range(0, len(df), batch_size):
+        records = frame_to_records(df.iloc[i : i + batch_size])
+
+        conn.execute(stmt.values(records))
+
+        stats.rows += len(records)
+        stats.batches += 1
+
+    stats.elapsed = time.perf_counter() - start
+
+    logger.info(
+        f"Inserted {stats.rows} rows into {table.name} in {stats.batches} batches: "
+        f"{stats.elapsed:.2f}s, {stats.rows_per_second:.0f} rows/s"
+    )
+
+    return stats
+
+
+def frame_to_tsv(df: pd.DataFrame) -> str:
+    """Format a DataFrame, including its index, as TSV lines in the format read by MySQL's `LOAD DATA`.
+
+    Nulls become `\\N`, and backslashes, tabs, newlines, carriage returns and NUL bytes are escaped with a backslash.
+    """
+    df = df.reset_index(drop=False)
+
+    columns = []
+    for _, series in df.items():
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+        elif pd.api.types.is_bool_dtype(series):
+            values = series.map({True: "1", False: "0"})
+        else:
+            values = series.astype(str)
+
+            if not pd.api.types.is_numeric_dtype(series):
+                for char, escaped in TSV_ESCAPES:
+                    values = values.str.replace(char, escaped, regex=False)
+
+        columns.append(values.where(series.notna(), TSV_NULL))
+
+    return "".join("\t".join(row) + "\n" for row in zip(*columns))
+
+
+def load_data_statement(
+    path: str,
+    table: Table,
+    columns: list[str],
+    dialect: sqlalchemy.Dialect,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+) -> sqlalchemy.TextClause:
+    quote = dialect.identifier_preparer.quote
+
+    # `LOCAL` loads can't abort on duplicate keys: they skip conflicting rows, like `IGNORE`.
+    duplicates = "REPLACE" if on_conflict == ConflictPolicy.UPDATE else "IGNORE"
+    path = path.replace("\\", "\\\\").replace("'", "\\'")
+
+    return sqlalchemy.text(
+        f"LOAD DATA LOCAL INFILE '{path}' {duplicates} INTO TABLE {quote(table.name)} "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+        "LINES TERMINATED BY '\\n' "
+        f"({', '.join(quote(col) for col in columns)})"
+    )
+
+
+def load_data_infile(
+    conn: sqlalchemy.Connection,
+    table: Table,
+    df: pd.DataFrame,
+    batch_size: int = LOAD_DATA_BATCH_SIZE,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+) -> WriteStats:
+    """Load a DataFrame, including its index, into `table` with MySQL's `LOAD DATA LOCAL INFILE`.
+
+    Each batch of `batch_size` rows is staged to a temporary TSV file, loaded, and then removed.
+    Both the client (see `create_mysql_engine`) and the server must allow `local_infile`.
+
+    Conflicting rows are replaced if `on_conflict` is ConflictPolicy.UPDATE, else skipped: a `LOCAL` load cannot abort
+    on them. Note that a replaced row is deleted and reinserted, so gets a new auto-increment ID.
+
+    On dialects other than MySQL, this falls back to `bulk_insert`.
+    The caller is responsible for committing.
+
+    Args:
+        conn (sqlalchemy.Connection): The connection to the target database.
+        table (Table): The table to load into. Its columns must include those of the DataFrame.
+        df (pd.DataFrame): The DataFrame to load.
+        batch_size (int, optional): The maximum number of rows per file. Defaults to LOAD_DATA_BATCH_SIZE.
+        on_conflict (ConflictPolicy, optional): The conflict policy. Defaults to ConflictPolicy.ERROR.
+    """
+    if conn.dialect.name not in ("mysql", "mariadb"):
+        logger.warning(
+            f"LOAD DATA is not supported on {conn.dialect.name}, falling back to batched inserts."
+        )
+        return bulk_insert(
+            conn=conn,
+            table=table,
+            df=df,
+            batch_size=min(batch_size, BATCH_SIZE),
+            on_conflict=on_conflict,
+        )
+
+    stats = WriteStats()
+    start = time.perf_counter()
+
+    columns = [str(name) for name in df.index.names] + [str(col) for col in df.columns]
+
+    for i in range(0, len(df), batch_size):
+        batch = df.iloc[i : i + batch_size]
+        batch_start = time.perf_counter()
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".tsv", encoding="utf-8", newline="", delete=False
+        ) as f:
+            f.write(frame_to_tsv(batch))
+
+        try:
+            conn.execute(
+                load_data_statement(
+                    path=f.name,
+                    table=table,
+                    columns=columns,
+                    dialect=conn.dialect,
+                    on_conflict=on_conflict,
+                )
+            )
+        finally:
+            os.remove(f.name)
+
+        batch_elapsed = time.perf_counter() - batch_start
+        stats.rows += len(batch)
+        stats.batches += 1
+
+        logger.info(
+            f"Loaded batch {stats.batches} of {len(batch)} rows into {table.name}: "
+            f"{batch_elapsed:.2f}s, {len(batch) / max(batch_elapsed, 1e-9):.0f} rows/s"
+        )
+
+    stats.elapsed = time.perf_counter() - start
+
+    logger.info(
+        f"Loaded {stats.rows} rows into {table.name} in {stats.batches} batches: "
+        f"{stats.elapsed:.2f}s, {stats.rows_per_second:.0f} rows/s"
+    )
+
+    return stats
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import datetime
+import itertools
+import json
+import tempfile
+import threading
+import time
 import urllib.parse
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from io import BytesIO
-from typing import IO, Any, Optional
+from typing import IO, Any, Iterable, Iterator, Literal, Optional, overload
 from zipfile import ZipFile
-import numpy as np
 
 import pandas as pd
 import requests
 from loguru import logger
 
+from qualtrics_utils.cache import SchemaCache
 from qualtrics_utils.misc import BASE_URL, HEADERS, VERSION, ExportedFile
+from qualtrics_utils.polling import (
+    ExponentialPolling,
+    Poller,
+    PollingMetrics,
+    PollingStrategy,
+    parse_retry_after,
+)
 from qualtrics_utils.surveys_response_import_export_api_client.api.response_exports import (
     create_export,
     get_export_file,
     get_export_progress,
+    get_filters_list,
 )
 from qualtrics_utils.surveys_response_import_export_api_client.client import (
     AuthenticatedClient,
@@ -24,21 +41,702 @@ from qualtrics_utils.surveys_response_import_export_api_client.client import (
 from qualtrics_utils.surveys_response_import_export_api_client.models import (
     ExportCreationRequest,
     ExportCreationRequestFormat,
+    ExportStatusResponse,
+    GetFiltersListResponse,
+    GetFiltersListResponseResultElementsItem,
     RequestStatus,
 )
-from qualtrics_utils.surveys_response_import_export_api_client.types import UNSET
+from qualtrics_utils.surveys_response_import_export_api_client.types import (
+    UNSET,
+    Unset,
+)
 from qualtrics_utils.utils import (
+    ColumnPlan,
+    categorical_labels,
+    categorize,
+    compile_column_plan,
+    dtypes_to_arrow,
     parse_file_id,
     reset_request_defaults,
-    qualtrics_schema_to_dtypes,
 )
 
 # The first two rows of the CSV are Qualtrics metadata.
 SKIP_ROWS = [1, 2]
 
+# Exports recode seen but unanswered questions as -1; it's parsed as NA, along with pandas' default NA values.
+NA_VALUES = ["-1"]
+NA_SENTINEL = -1
+
+# Size of each chunk read off the wire when streaming an export file.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Streamed exports are kept in memory up to this size, then spooled to disk.
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+# Number of responses parsed at a time when reading an export.
+CHUNK_SIZE = 10_000
+
+# Shards of a sharded export overlap by this much, so that no response falls between two; duplicates are dropped.
+SHARD_OVERLAP = datetime.timedelta(seconds=1)
+
+# Export formats that can be read into DataFrames; see `read_export_df`.
+READABLE_FORMATS = (ExportCreationRequestFormat.CSV, ExportCreationRequestFormat.NDJSON)
+
+# The column holding each response's last modified date, exported with `sort_by_last_modified_date`.
+LAST_MODIFIED_DATE = "LastModifiedDate"
+
+
+def find_filter_id(
+    filters: list[GetFiltersListResponseResultElementsItem], filter_name: str
+) -> str:
+    """Find the ID of the one filter named `filter_name`, as listed by `Surveys.list_filters`."""
+    filter_ids = [f.filter_id for f in filters if f.filter_name == filter_name]
+
+    if len(filter_ids) != 1:
+        raise ValueError(
+            f"Expected one filter named {filter_name!r}, found {len(filter_ids)}."
+        )
+
+    return filter_ids[0]
+
+
+def open_export_data(data: bytes | IO[bytes]) -> IO[bytes]:
+    """Wrap an export's data, as returned by `Surveys.get_responses`, in a readable file object."""
+    if isinstance(data, bytes):
+        return BytesIO(data)
+
+    data.seek(0)
+    return data
+
+
+def make_export_request(
+    format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+    use_labels: bool = True,
+    start_date: datetime.datetime | None = None,
+    end_date: datetime.datetime | None = None,
+    export_responses_in_progress: bool = False,
+    continuation_token: Optional[str] = None,
+    sort_by_last_modified_date: bool = False,
+    filter_id: str | None = None,
+    **kwargs: Any,
+) -> ExportCreationRequest:
+    """Create the payload of a response export request; see `Surveys.get_responses` for the arguments."""
+    if filter_id is not None and sort_by_last_modified_date:
+        raise ValueError("Filtered exports can't be sorted by last modified date.")
+
+    kwargs = dict(
+        format_=format,
+        use_labels=use_labels,
+        breakout_sets=True,
+        seen_unanswered_recode=-1,
+        multiselect_seen_unanswered_recode=-1,
+        # Continuation is only allowed for unfiltered exports of completed responses, up to now.
+        allow_continuation=(
+            not export_responses_in_progress and end_date is None and filter_id is None
+        ),
+        sort_by_last_modified_date=sort_by_last_modified_date,
+        compress=True,
+        export_responses_in_progress=export_responses_in_progress,
+        start_date=start_date if start_date is not None else UNSET,
+        end_date=end_date if end_date is not None else UNSET,
+        continuation_token=(
+            continuation_token if continuation_token is not None else UNSET
+        ),
+        filter_id=filter_id if filter_id is not None else UNSET,
+        **kwargs,
+    )
+    # Label columns are only supported by delimited formats; JSON exports always hold labels.
+    if format in (ExportCreationRequestFormat.CSV, ExportCreationRequestFormat.TSV):
+        kwargs.setdefault("include_label_columns", not use_labels)
+
+    payload = ExportCreationRequest(**kwargs)
+    # ! This is a hack: the Qualtrics OpenAPI docs suck tremendously and the defaults are NOT correct.
+    return reset_request_defaults(payload, kwargs)
+
+
+def normalize_na(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace blank and -1 values with pd.NA, in place, according to each column's dtype.
+
+    Numeric columns are compared to -1, and string columns matched against blank strings and "-1",
+    both vectorized; other columns, e.g. dates and booleans, can't hold either, and are skipped.
+    """
+    for col in df.columns:
+        values = df[col]
+
+        if pd.api.types.is_bool_dtype(values) or pd.api.types.is_datetime64_any_dtype(
+            values
+        ):
+            continue
+        elif pd.api.types.is_numeric_dtype(values):
+            mask = values.eq(NA_SENTINEL)
+        elif pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(
+            values
+        ):
+            mask = values.eq(str(NA_SENTINEL)) | values.eq(NA_SENTINEL)
+
+            # The `.str` accessor rejects object columns without any strings.
+            with contextlib.suppress(AttributeError):
+                mask |= values.str.strip().eq("").fillna(False)
+        else:
+            continue
+
+        mask = mask.fillna(False).to_numpy(dtype=bool)
+
+        if mask.any():
+            df[col] = values.mask(mask, pd.NA)
+
+    return df
+
+
+def clean_responses_chunk(
+    df: pd.DataFrame, filter_preview: bool = True
+) -> pd.DataFrame:
+    """Clean a chunk of freshly parsed responses, in place.
+
+    Sets the index to `ResponseId`, replaces all blank values with pd.NA,
+    and optionally filters out Survey Preview responses.
+
+    Empty and -1 values are expected to be parsed as NA already, with NA_VALUES; see `iter_export_chunks`.
+    """
+    df.set_index("ResponseId", inplace=True)
+
+    # Replace all blank values with pd.NA
+    normalize_na(df)
+
+    # Filter out Survey Preview responses
+    if filter_preview and "Status" in df.columns:
+        preview_df = df[df["Status"] == "Survey Preview"]
+        if len(preview_df) > 0:
+            logger.info(f"Filtering out {len(preview_df)} Survey Preview responses.")
+        df.drop(preview_df.index, inplace=True)
+
+    return df
+
+
+def iter_export_chunks(
+    data: bytes | IO[bytes],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    chunksize: int = CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """Read a zipped CSV export in chunks of at most `chunksize` rows, cleaning each with `clean_responses_chunk`.
+
+    At least one, possibly empty, chunk is always yielded. The export's data is closed once exhausted.
+
+    Args:
+        data (bytes | IO[bytes]): The export, as returned by `Surveys.get_responses`.
+        dtypes (dict[str, Any]): Column dtypes, excluding date columns.
+        parse_dates (list[str]): Columns to parse as dates.
+        last_response_id (str, optional): If the export's first response has this ID, it's dropped. Defaults to None.
+        filter_preview (bool, optional): Whether to filter out Survey Preview responses. Defaults to True.
+        chunksize (int, optional): The maximum number of rows per chunk. Defaults to CHUNK_SIZE.
+    """
+    # Categoricals are read as-is, then given their categories, so that values outside of them aren't lost.
+    categories = categorical_labels(dtypes)
+    dtypes = {**dtypes, **{col: "category" for col in categories}}
+
+    with open_export_data(data) as raw, zipfile.ZipFile(raw) as zf:
+        with zf.open(zf.filelist[0]) as f:
+            logger.info(f"Reading file {f.name}...")
+
+            with pd.read_csv(
+                f,
+                skiprows=SKIP_ROWS,
+                chunksize=chunksize,
+                dtype=dtypes,
+                skip_blank_lines=True,
+                parse_dates=parse_dates,
+                na_values=NA_VALUES,
+            ) as reader:
+                for n, df in enumerate(reader):
+                    df = clean_responses_chunk(df, filter_preview=filter_preview)
+                    categorize(df, categories)
+
+                    # If the first response is the last response from the previous export, drop it.
+                    if n == 0 and not df.empty and df.index[0] == last_response_id:
+                        df.drop(df.index[0], inplace=True)
+
+                    yield df
+
+
+def cast_json_column(values: list[Any], dtype: Any = None, is_date: bool = False):
+    """Cast a buffer of JSON values to `dtype`, or to naive UTC dates, as `pd.read_csv` would; see `iter_ndjson_chunks`.
+
+    Values that can't be cast are kept as objects, like `pd.read_csv` does for columns without a dtype.
+    """
+    series = pd.Series(values, dtype=object)
+
+    if is_date:
+        return pd.to_datetime(series, utc=True, format="ISO8601").dt.tz_localize(None)
+    elif dtype is None or isinstance(dtype, pd.CategoricalDtype):
+        return series
+    elif dtype is str:
+        return series.astype(str).mask(series.isna())
+
+    try:
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(
+            dtype
+        ):
+            return pd.to_numeric(series, errors="coerce").astype(dtype)
+        return series.astype(dtype)
+    except (TypeError, ValueError):
+        return series
+
+
+def iter_ndjson_chunks(
+    data: bytes | IO[bytes],
+    fields: dict[str, str],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    use_labels: bool = True,
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    chunksize: int = CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """Read a zipped NDJSON export in chunks of at most `chunksize` rows, cleaning each with `clean_responses_chunk`.
+
+    Responses are parsed one line at a time into a buffer per column, which are cast to their dtypes once per chunk.
+    Each response's values are keyed by field ID, and mapped to their columns with `fields`. Labeled values are
+    replaced with their labels if `use_labels`, so that the chunks match those of `iter_export_chunks`, without CSV's
+    quoting nor its metadata rows. Multi-valued fields, e.g. multi-select questions, are kept as JSON-encoded lists,
+    since their labels may hold commas.
+
+    At least one, possibly empty, chunk is always yielded. The export's data is closed once exhausted.
+
+    Args:
+        data (bytes | IO[bytes]): The export, as returned by `Surveys.get_responses`.
+        fields (dict[str, str]): A map of field IDs to column names; see `ColumnPlan.fields`. Unknown fields keep their ID.
+        dtypes (dict[str, Any]): Column dtypes, excluding date columns.
+        parse_dates (list[str]): Columns to parse as dates.
+        use_labels (bool, optional): Whether to read the labels of labeled values rather than their recodes. Defaults to True.
+        last_response_id (str, optional): If the export's first response has this ID, it's dropped. Defaults to None.
+        filter_preview (bool, optional): Whether to filter out Survey Preview responses. Defaults to True.
+        chunksize (int, optional): The maximum number of rows per chunk. Defaults to CHUNK_SIZE.
+    """
+    categories = categorical_labels(dtypes)
+    date_columns = set(parse_dates)
+
+    def empty_buffers() -> dict[str, list[Any]]:
+        # Every planned column is present, even if no response has a value for it.
+        return {col: [] for col in [*parse_dates, *dtypes]}
+
+    def iter_buffers(f: IO[bytes]) -> Iterator[tuple[list[str], dict[str, list[Any]]]]:
+        response_ids: list[str] = []
+        buffers = empty_buffers()
+
+        for line in f:
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            values: dict[str, Any] = record.get("values", {})
+            labels: dict[str, Any] = record.get("labels", {}) if use_labels else {}
+
+            response_ids.append(record["responseId"])
+            n = len(response_ids)
+
+            for key, value in values.items():
+                col = fields.get(key, key)
+                if col == "ResponseId":
+                    continue
+
+                value = labels.get(key, value)
+                if isinstance(value, list):
+                    value = json.dumps(value, ensure_ascii=False)
+
+                buffers.setdefault(col, [None] * (n - 1)).append(value)
+
+            # Pad the columns this response has no value for.
+            for buffer in buffers.values():
+                if len(buffer) < n:
+                    buffer.append(None)
+
+            if n == chunksize:
+                yield response_ids, buffers
+                response_ids, buffers = [], empty_buffers()
+
+        if len(response_ids) > 0:
+            yield response_ids, buffers
+
+    with open_export_data(data) as raw, zipfile.ZipFile(raw) as zf:
+        with zf.open(zf.filelist[0]) as f:
+            logger.info(f"Reading file {f.name}...")
+
+            chunks = iter_buffers(f)
+            # At least one chunk is yielded, so that the export's columns are known.
+            first_chunk = next(chunks, ([], empty_buffers()))
+
+            for n, (response_ids, buffers) in enumerate(
+                itertools.chain([first_chunk], chunks)
+            ):
+                df = pd.DataFrame(
+                    {
+                        "ResponseId": pd.Series(response_ids, dtype=object),
+                        **{
+                            col: cast_json_column(
+                                buffer,
+                                dtype=dtypes.get(col),
+                                is_date=col in date_columns,
+                            )
+                            for col, buffer in buffers.items()
+                        },
+                    }
+                )
+                df = clean_responses_chunk(df, filter_preview=filter_preview)
+                categorize(df, categories)
+
+                # If the first response is the last response from the previous export, drop it.
+                if n == 0 and not df.empty and df.index[0] == last_response_id:
+                    df.drop(df.index[0], inplace=True)
+
+                yield df
+
+
+def max_date(df: pd.DataFrame, column: str) -> datetime.datetime | None:
+    """Get the latest date of a column, if any, e.g. the `StartDate` watermark of an export."""
+    if column not in df.columns or df.empty:
+        return None
+
+    # The column may be unparsed, e.g. a date column without a dtype.
+    date = pd.to_datetime(df[column], errors="coerce").max()
+    return pd.Timestamp(date).to_pydatetime() if not pd.isna(date) else None
+
+
+def as_utc(date: datetime.datetime) -> datetime.datetime:
+    """Assume naive dates are in UTC, which exports use by default."""
+    return (
+        date if date.tzinfo is not None else date.replace(tzinfo=datetime.timezone.utc)
+    )
+
+
+def shard_date_range(
+    start_date: datetime.datetime, end_date: datetime.datetime, shards: int
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """Split `[start_date, end_date)` into `shards` consecutive ranges of whole seconds, each overlapping
+    the next by SHARD_OVERLAP."""
+    step = (end_date - start_date) / shards
+    bounds = [(start_date + step * i).replace(microsecond=0) for i in range(shards)] + [
+        end_date
+    ]
+
+    return [
+        (t_start_date, min(t_end_date + SHARD_OVERLAP, end_date))
+        for t_start_date, t_end_date in zip(bounds, bounds[1:])
+        if t_start_date < t_end_date
+    ]
+
+
+def read_export_arrow(
+    raw_data: ExportedFile[bytes] | ExportedFile[IO[bytes]],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    dtype_backend: str | None = None,
+) -> pd.DataFrame:
+    """Read a whole zipped CSV export with PyArrow's multithreaded CSV reader, cleaning it with `clean_responses_chunk`.
+
+    Columns are parsed as the Arrow types of `dtypes` and `parse_dates`; see `dtypes_to_arrow`.
+    If `dtype_backend` is "pyarrow", the frame keeps them, e.g. strings as Arrow buffers rather than Python objects;
+    otherwise they're converted to their NumPy counterparts. Requires the optional `pyarrow` dependency.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError as e:
+        raise ImportError(
+            "engine='pyarrow' requires pyarrow: pip install qualtrics-utils[arrow]"
+        ) from e
+
+    column_types = {
+        **dtypes_to_arrow(dtypes),
+        **{col: pa.timestamp("ns") for col in parse_dates},
+    }
+
+    with open_export_data(raw_data.data) as raw, zipfile.ZipFile(raw) as zf:
+        with zf.open(zf.filelist[0]) as f:
+            logger.info(f"Reading file {f.name} with pyarrow...")
+
+            table = pa_csv.read_csv(
+                f,
+                read_options=pa_csv.ReadOptions(skip_rows_after_names=len(SKIP_ROWS)),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    null_values=["", *NA_VALUES],
+                    strings_can_be_null=True,
+                ),
+            )
+
+    df = (
+        table.to_pandas(types_mapper=pd.ArrowDtype)
+        if dtype_backend == "pyarrow"
+        else table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+    )
+    df = clean_responses_chunk(df, filter_preview=filter_preview)
+    categorize(df, categorical_labels(dtypes))
+
+    # If the first response is the last response from the previous export, drop it.
+    if not df.empty and df.index[0] == last_response_id:
+        df.drop(df.index[0], inplace=True)
+
+    return df
+
+
+def read_export_df(
+    raw_data: ExportedFile[bytes] | ExportedFile[IO[bytes]],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    engine: str = "c",
+    dtype_backend: str | None = None,
+    format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+    fields: dict[str, str] | None = None,
+    use_labels: bool = True,
+) -> pd.DataFrame:
+    """Read and concatenate every chunk of a zipped CSV export; see `iter_export_chunks`.
+
+    If `engine` is "pyarrow", the export is instead read with `read_export_arrow`, with the given `dtype_backend`.
+    NDJSON exports are read with `iter_ndjson_chunks`, mapping their field IDs to columns with `fields`.
+    """
+    if format not in READABLE_FORMATS:
+        raise ValueError(f"Unsupported export format: {format}")
+    elif format == ExportCreationRequestFormat.NDJSON and (
+        engine != "c" or dtype_backend is not None
+    ):
+        raise ValueError("NDJSON exports can't be read with another engine.")
+
+    if format == ExportCreationRequestFormat.NDJSON:
+        chunks = iter_ndjson_chunks(
+            data=raw_data.data,
+            fields=fields if fields is not None else {},
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            use_labels=use_labels,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+        )
+        return categorize(pd.concat(chunks), categorical_labels(dtypes))
+    elif engine == "pyarrow":
+        return read_export_arrow(
+            raw_data=raw_data,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            dtype_backend=dtype_backend,
+        )
+    elif engine != "c":
+        raise ValueError(f"Unsupported engine: {engine}")
+    elif dtype_backend is not None:
+        raise ValueError("A dtype_backend requires engine='pyarrow'.")
+
+    df = pd.concat(
+        iter_export_chunks(
+            data=raw_data.data,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+        )
+    )
+    # Chunks with differing categories are concatenated as objects.
+    return categorize(df, categorical_labels(dtypes))
+
+
+def read_responses_df(
+    raw_data: ExportedFile[bytes] | ExportedFile[IO[bytes]],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    engine: str = "c",
+    dtype_backend: str | None = None,
+    format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+    fields: dict[str, str] | None = None,
+    use_labels: bool = True,
+) -> ExportedFile[pd.DataFrame]:
+    """Read a whole zipped CSV or NDJSON export into a DataFrame; see `Surveys.get_responses_df`."""
+    new_df = read_export_df(
+        raw_data=raw_data,
+        dtypes=dtypes,
+        parse_dates=parse_dates,
+        last_response_id=last_response_id,
+        filter_preview=filter_preview,
+        engine=engine,
+        dtype_backend=dtype_backend,
+        format=format,
+        fields=fields,
+        use_labels=use_labels,
+    )
+
+    return to_exported_df(
+        raw_data=raw_data, new_df=new_df, last_response_id=last_response_id
+    )
+
+
+def iter_responses_chunks(
+    raw_data: ExportedFile[bytes] | ExportedFile[IO[bytes]],
+    dtypes: dict[str, Any],
+    parse_dates: list[str],
+    last_response_id: str | None = None,
+    filter_preview: bool = True,
+    format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+    fields: dict[str, str] | None = None,
+    use_labels: bool = True,
+    chunksize: int = CHUNK_SIZE,
+) -> Iterator[ExportedFile[pd.DataFrame]]:
+    """Read a zipped CSV or NDJSON export in chunks of DataFrames; see `Surveys.iter_responses_df`."""
+    chunks = (
+        iter_ndjson_chunks(
+            data=raw_data.data,
+            fields=fields if fields is not None else {},
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            use_labels=use_labels,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            chunksize=chunksize,
+        )
+        if format == ExportCreationRequestFormat.NDJSON
+        else iter_export_chunks(
+            data=raw_data.data,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            chunksize=chunksize,
+        )
+    )
+    last_start_date = last_recorded_date = last_modified_date = None
+
+    for df in chunks:
+        if df.empty:
+            continue
+
+        df.sort_values("StartDate", inplace=True)
+        last_response_id = df.index[-1]
+
+        last_start_date = max(
+            filter(None, [last_start_date, max_date(df, "StartDate")]),
+            default=None,
+        )
+        last_recorded_date = max(
+            filter(None, [last_recorded_date, max_date(df, "RecordedDate")]),
+            default=None,
+        )
+        last_modified_date = max(
+            filter(None, [last_modified_date, max_date(df, LAST_MODIFIED_DATE)]),
+            default=None,
+        )
+
+        yield ExportedFile(
+            survey_id=raw_data.survey_id,
+            file_id=raw_data.file_id,
+            last_response_id=last_response_id,
+            continuation_token=raw_data.continuation_token,
+            data=df,
+            timestamp=datetime.datetime.now(),
+            last_start_date=last_start_date,
+            last_recorded_date=last_recorded_date,
+            last_modified_date=last_modified_date,
+            row_count=len(df),
+        )
+
+
+def merge_sharded_dfs(
+    shards: list[tuple[ExportedFile[bytes] | ExportedFile[IO[bytes]], pd.DataFrame]],
+    last_response_id: str | None = None,
+) -> ExportedFile[pd.DataFrame]:
+    """Merge the exports of a sharded export, in shard order, into one; see `Surveys.get_responses_df`.
+
+    Responses exported by more than one shard are deduplicated by their response ID.
+    """
+    new_df = pd.concat([df for _, df in shards])
+    new_df = new_df[~new_df.index.duplicated(keep="last")]
+
+    # Shards with differing categories are concatenated as objects.
+    categorize(
+        new_df,
+        {
+            col: list(dtype.categories)
+            for _, df in shards
+            for col, dtype in df.dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        },
+    )
+
+    logger.info(f"Merged {len(shards)} shards.")
+
+    # Sharded exports have an end date, and so no continuation token.
+    raw_data = dataclasses.replace(shards[-1][0], continuation_token=None)
+
+    return to_exported_df(
+        raw_data=raw_data, new_df=new_df, last_response_id=last_response_id
+    )
+
+
+def to_exported_df(
+    raw_data: ExportedFile[bytes] | ExportedFile[IO[bytes]],
+    new_df: pd.DataFrame,
+    last_response_id: str | None = None,
+) -> ExportedFile[pd.DataFrame]:
+    """Finish reading an export's responses: sort them, and compute the export's watermarks."""
+    logger.info(f"Exported {len(new_df)} responses.")
+
+    # Sort by StartDate
+    new_df.sort_values("StartDate", inplace=True)
+
+    # Cast all columns that are entirely pd.NA to object (str), keeping Arrow-backed ones as-is.
+    new_df = new_df.astype(
+        {
+            col: "object"
+            for col in new_df.columns
+            if not isinstance(new_df[col].dtype, pd.ArrowDtype)
+            and new_df[col].isna().all()
+        }
+    )
+
+    # Set the last_response_id to the last response in the DataFrame, or the last_response_id from the previous export.
+    last_response_id = new_df.index[-1] if len(new_df) > 0 else last_response_id
+
+    return ExportedFile(
+        survey_id=raw_data.survey_id,
+        file_id=raw_data.file_id,
+        last_response_id=last_response_id,
+        continuation_token=raw_data.continuation_token,
+        data=new_df,
+        timestamp=datetime.datetime.now(),
+        last_start_date=max_date(new_df, "StartDate"),
+        last_recorded_date=max_date(new_df, "RecordedDate"),
+        last_modified_date=max_date(new_df, LAST_MODIFIED_DATE),
+        row_count=len(new_df),
+    )
+
 
 class Surveys:
-    def __init__(self, api_token: str, version: str = VERSION):
+    """A client for exporting a survey's responses, and reading them into DataFrames.
+
+    Args:
+        api_token (str): The Qualtrics API token.
+        version (str, optional): The Qualtrics API version. Defaults to VERSION.
+        polling (PollingStrategy, optional): How to wait between polls of an export's progress. Defaults to ExponentialPolling().
+        poll_timeout (float, optional): The maximum number of seconds to wait for an export to complete. Defaults to None, no timeout.
+        max_concurrent_requests (int, optional): The maximum number of in-flight API requests, across all threads sharing this client. Defaults to None, unbounded.
+        schema_cache (SchemaCache, optional): The cache of survey response schemas. Defaults to an in-memory SchemaCache().
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        version: str = VERSION,
+        polling: PollingStrategy | None = None,
+        poll_timeout: float | None = None,
+        max_concurrent_requests: int | None = None,
+        schema_cache: SchemaCache | None = None,
+    ):
         self.base_url = BASE_URL(version)
 
         self.headers = HEADERS.copy()
@@ -53,6 +751,24 @@ class Surveys:
             auth_header_name="X-API-TOKEN",
         )
 
+        self.polling = polling if polling is not None else ExponentialPolling()
+        self.poll_timeout = poll_timeout
+        # Metrics of every export polled by this client, in order.
+        self.polling_metrics: list[PollingMetrics] = []
+
+        self.schema_cache = schema_cache if schema_cache is not None else SchemaCache()
+
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrent_requests)
+            if max_concurrent_requests is not None
+            else None
+        )
+
+    def _limit(self) -> contextlib.AbstractContextManager:
+        return (
+            self._semaphore if self._semaphore is not None else contextlib.nullcontext()
+        )
+
     @staticmethod
     def _get_zip(url: str) -> IO[bytes] | list[IO[bytes]]:
         r = requests.get(url)
@@ -74,72 +790,224 @@ class Surveys:
         continuation_token: Optional[str] = None,
         **kwargs: Any,
     ):
-        kwargs = dict(
-            format_=format,
+        payload = make_export_request(
+            format=format,
             use_labels=use_labels,
-            breakout_sets=True,
-            seen_unanswered_recode=-1,
-            multiselect_seen_unanswered_recode=-1,
-            allow_continuation=not export_responses_in_progress and end_date is None,
-            sort_by_last_modified_date=False,
-            include_label_columns=not use_labels,
-            compress=True,
+            start_date=start_date,
+            end_date=end_date,
             export_responses_in_progress=export_responses_in_progress,
-            start_date=start_date if start_date is not None else UNSET,
-            end_date=end_date if end_date is not None else UNSET,
-            continuation_token=continuation_token
-            if continuation_token is not None
-            else UNSET,
+            continuation_token=continuation_token,
             **kwargs,
         )
-        payload = ExportCreationRequest(**kwargs)
-        # ! This is a hack: the Qualtrics OpenAPI docs suck tremendously and the defaults are NOT correct.
-        payload = reset_request_defaults(payload, kwargs)
 
         logger.info(
             f"Exporting responses from {survey_id} from {start_date} to {end_date}."
         )
         logger.debug(f"Exporting with payload: {payload}")
 
-        return create_export.sync(
-            survey_id=survey_id,
-            client=self.client,
-            json_body=payload,
-        )
+        with self._limit():
+            return create_export.sync(
+                survey_id=survey_id,
+                client=self.client,
+                json_body=payload,
+            )
 
     def _response_export_status(self, survey_id: str, export_progress_id: str):
         logger.info(f"Getting export progress for survey {survey_id}...")
 
+        poller = Poller(strategy=self.polling, timeout=self.poll_timeout)
+
         while True:
-            r = get_export_progress.sync(
-                survey_id=survey_id,
-                export_progress_id=export_progress_id,
-                client=self.client,
-            )
-            status = r.result.status  # type: ignore
+            with self._limit():
+                response = get_export_progress.sync_detailed(
+                    survey_id=survey_id,
+                    export_progress_id=export_progress_id,
+                    client=self.client,
+                )
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                delay = poller.next_delay(retry_after=retry_after)
+                logger.warning(f"Rate limited; retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+
+            r = response.parsed
+            if not isinstance(r, ExportStatusResponse):
+                raise Exception("Export failed", response)
+
+            status = r.result.status
 
             logger.info(
-                f"Export progress for file {r.result.file_id}: {r.result.percent_complete}%"  # type: ignore
+                f"Export progress for file {r.result.file_id}: {r.result.percent_complete}%"
             )
 
             match status:
                 case None | RequestStatus.FAILED:
                     raise Exception("Export failed", r)
                 case RequestStatus.COMPLETE:
+                    metrics = poller.finish()
+                    self.polling_metrics.append(metrics)
+
+                    logger.info(
+                        f"Export completed after {metrics.polls} polls, {metrics.total_wait:.1f}s waiting and {metrics.elapsed:.1f}s total."
+                    )
                     return r
                 case RequestStatus.INPROGRESS:
-                    continue
+                    time.sleep(
+                        poller.next_delay(
+                            percent_complete=r.result.percent_complete,
+                            retry_after=retry_after,
+                        )
+                    )
 
     def _response_export_file(self, survey_id: str, file_id: str) -> bytes:
         logger.info(f"Downloading file {file_id} for survey {survey_id}...")
 
-        r = get_export_file.sync(
+        with self._limit():
+            r = get_export_file.sync(
+                survey_id=survey_id,
+                file_id=file_id,
+                client=self.client,
+            )
+
+        return r.payload.read()  # type: ignore
+
+    def _response_export_file_stream(self, survey_id: str, file_id: str) -> IO[bytes]:
+        """Stream an export file, chunk by chunk, into a spooled temporary file.
+
+        The file is held in memory up to `SPOOL_MAX_SIZE` bytes, then rolled over to disk,
+        so peak memory usage is bounded regardless of the export's size.
+        The returned file is rewound, and must be closed by the caller.
+        """
+        logger.info(f"Streaming file {file_id} for survey {survey_id}...")
+
+        url = self._make_api_url(
+            "surveys/{survey_id}/export-responses/{file_id}/file",
             survey_id=survey_id,
             file_id=file_id,
-            client=self.client,
         )
+        file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
 
-        return r.payload.read()  # type: ignore
+        try:
+            with (
+                self._limit(),
+                self.client.get_httpx_client().stream(
+                    "GET", url, headers=self.headers
+                ) as r,
+            ):
+                r.raise_for_status()
+
+                for chunk in r.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+        except Exception:
+            file.close()
+            raise
+
+        logger.info(f"Downloaded {file.tell()} bytes for file {file_id}.")
+
+        file.seek(0)
+        return file  # type: ignore
+
+    def list_filters(
+        self, survey_id: str
+    ) -> list[GetFiltersListResponseResultElementsItem]:
+        """List the saved filters of a survey, across every page.
+
+        Filters are created in the Qualtrics web app, and applied to exports by their ID; see `get_responses`.
+
+        Args:
+            survey_id (str): The survey_id of the survey to list the filters of.
+        """
+        survey_id = parse_file_id(survey_id)
+        logger.info(f"Listing filters for survey {survey_id}...")
+
+        with self._limit():
+            r = get_filters_list.sync(survey_id=survey_id, client=self.client)
+
+        filters = []
+
+        while True:
+            if not isinstance(r, GetFiltersListResponse):
+                raise Exception("Listing filters failed", r)
+
+            filters.extend(r.result.elements)
+
+            if not r.result.next_page:
+                return filters
+
+            with self._limit():
+                response = self.client.get_httpx_client().get(r.result.next_page)
+            response.raise_for_status()
+
+            r = GetFiltersListResponse.from_dict(response.json())
+
+    def resolve_filter(self, survey_id: str, filter_name: str) -> str:
+        """Get the ID of a survey's saved filter by its name.
+
+        Args:
+            survey_id (str): The survey_id of the survey the filter belongs to.
+            filter_name (str): The name of the filter.
+        """
+        return find_filter_id(self.list_filters(survey_id=survey_id), filter_name)
+
+    @overload
+    def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: Literal[False] = False,
+        **kwargs: Any,
+    ) -> ExportedFile[bytes]: ...
+
+    @overload
+    def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        *,
+        stream: Literal[True],
+        **kwargs: Any,
+    ) -> ExportedFile[IO[bytes]]: ...
+
+    @overload
+    def get_responses(
+        self,
+        survey_id: str,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        use_labels: bool = True,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> ExportedFile[bytes] | ExportedFile[IO[bytes]]: ...
 
     def get_responses(
         self,
@@ -151,14 +1019,32 @@ class Surveys:
         export_responses_in_progress: bool = False,
         continuation_token: Optional[str] = None,
         last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        columns: Iterable[str] | None = None,
+        filter_id: str | None = None,
+        filter_name: str | None = None,
+        stream: bool = False,
         **kwargs: Any,
-    ) -> ExportedFile[bytes]:
+    ) -> ExportedFile[Any]:
         """Get responses from a survey by survey_id.
         Outputs a zipped file, in bytes, in the format specified by `format`.
 
+        If `stream` is True, the file is instead streamed to a spooled temporary file, which is returned
+        as an open file handle; the caller is responsible for closing it.
+
         If a `last_response_id` is provided, the export will continue from the response after the last_response_id.
+        Its start date is fetched from the API, unless given as `last_start_date`, e.g. the watermark of a previous export.
         If a `continuation_token` is provided, the export will continue from where it left off. The continuation_token **cannot** be older than 1 week.
 
+        If `columns` are given, by export tag or ID, only they're exported, along with the response ID, start date
+        and status; see `ColumnPlan.projection`. This shrinks the export of a survey with many columns.
+
+        If a `filter_id`, or the `filter_name` of a saved filter, is given, only the responses it matches are exported;
+        see `list_filters`. Filtered exports can't be continued, nor sorted by last modified date.
+
+        If `sort_by_last_modified_date` is passed as True, responses are sorted, and filtered by `start_date`/`end_date`,
+        by their last modified date, which is exported as the `LastModifiedDate` column.
+
         Args:
             survey_id (str): The survey_id of the survey to get responses from.
             format (str, optional): The format of the response data. Defaults to "csv".
@@ -168,14 +1054,37 @@ class Surveys:
             export_responses_in_progress (bool, optional): Whether to export responses that are in progress. Defaults to False.
             continuation_token (Optional[str], optional): The continuation token for the response export. Defaults to None.
             last_response_id (Optional[str], optional): The responseId of the last response to export. Defaults to None.
+            last_start_date (Optional[datetime.datetime], optional): The start date of the last response; naive dates are in UTC. Defaults to None.
+            columns (Iterable[str], optional): The columns to export. Defaults to None, every column.
+            filter_id (str, optional): The ID of a saved filter to export the responses of. Defaults to None.
+            filter_name (str, optional): The name of a saved filter to export the responses of. Defaults to None.
+            stream (bool, optional): Whether to stream the file to a temporary file rather than memory. Defaults to False.
         """
         survey_id = parse_file_id(survey_id)
 
-        start_date = (
-            self._response_id_to_date(survey_id=survey_id, response_id=last_response_id)
-            if start_date is None and last_response_id is not None
-            else start_date
-        )
+        if filter_name is not None:
+            if filter_id is not None:
+                raise ValueError("Pass either a filter_id or a filter_name, not both.")
+
+            filter_id = self.resolve_filter(
+                survey_id=survey_id, filter_name=filter_name
+            )
+
+        if columns is not None:
+            kwargs.update(
+                self.get_column_plan(
+                    survey_id=survey_id, use_labels=use_labels
+                ).projection(columns)
+            )
+
+        if start_date is None and last_response_id is not None:
+            start_date = (
+                as_utc(last_start_date)
+                if last_start_date is not None
+                else self._response_id_to_date(
+                    survey_id=survey_id, response_id=last_response_id
+                )
+            )
 
         export = self._response_export(
             survey_id=survey_id,
@@ -185,6 +1094,7 @@ class Surveys:
             end_date=end_date,
             export_responses_in_progress=export_responses_in_progress,
             continuation_token=continuation_token,
+            filter_id=filter_id,
             **kwargs,
         )
 
@@ -194,13 +1104,27 @@ class Surveys:
         )
 
         file_id = export_status.result.file_id
-        file = self._response_export_file(survey_id=survey_id, file_id=file_id)
+        if isinstance(file_id, Unset):
+            raise ValueError(f"Export of survey {survey_id} completed without a file.")
+
+        # Only continuable exports have a continuation token.
+        next_continuation_token = export_status.result.continuation_token
+
+        file = (
+            self._response_export_file_stream(survey_id=survey_id, file_id=file_id)
+            if stream
+            else self._response_export_file(survey_id=survey_id, file_id=file_id)
+        )
 
         return ExportedFile(
             survey_id=survey_id,
             file_id=file_id,
             last_response_id=None,
-            continuation_token=export_status.result.continuation_token,
+            continuation_token=(
+                next_continuation_token
+                if not isinstance(next_continuation_token, Unset)
+                else None
+            ),
             data=file,
             timestamp=datetime.datetime.now(),
         )
@@ -219,7 +1143,8 @@ class Surveys:
             survey_id=survey_id,
             response_id=response_id,
         )
-        r = requests.get(response_url, headers=self.headers)
+        with self._limit():
+            r = requests.get(response_url, headers=self.headers)
         r.raise_for_status()
         return r.json()
 
@@ -232,6 +1157,110 @@ class Surveys:
             response["result"]["values"]["startDate"]
         )
 
+    def get_column_plan(
+        self,
+        survey_id: str,
+        use_labels: bool = True,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+    ) -> ColumnPlan:
+        """Get the compiled column plan of a survey's responses; see `compile_column_plan`.
+
+        The plan is memoized alongside the survey's cached schema.
+
+        Args:
+            survey_id (str): The survey_id of the survey.
+            use_labels (bool, optional): Whether the responses are exported with labels. Defaults to True.
+            columns (Iterable[str], optional): Only plan the columns exported by this projection; see `ColumnPlan.project`. Defaults to None.
+            categorical (bool, optional): Whether to plan labeled single-choice questions as categoricals. Defaults to False.
+        """
+        survey_id = parse_file_id(survey_id)
+        schema = self.get_survey_schema(survey_id=survey_id)
+
+        plan = self.schema_cache.memoize(
+            survey_id,
+            ("column_plan", use_labels, categorical),
+            lambda: compile_column_plan(
+                schema=schema,
+                use_labels=use_labels,
+                categorical=categorical,
+            ),
+        )
+        return plan.project(columns) if columns is not None else plan
+
+    def iter_responses_df(
+        self,
+        survey_id: str,
+        use_labels: bool = True,
+        end_date: datetime.datetime | None = None,
+        start_date: datetime.datetime | None = None,
+        export_responses_in_progress: bool = False,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        filter_preview: bool = True,
+        dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        chunksize: int = CHUNK_SIZE,
+        stream: bool = True,
+        format: ExportCreationRequestFormat | str = ExportCreationRequestFormat.CSV,
+        **kwargs: Any,
+    ) -> Iterator[ExportedFile[pd.DataFrame]]:
+        """Get responses from a survey by survey_id, as an iterator of DataFrame chunks.
+
+        Each chunk holds at most `chunksize` responses, indexed by `ResponseId`, and is cleaned as it's parsed:
+        blank values are replaced with pd.NA, Survey Preview responses are filtered out, and the survey's dtypes are applied.
+        Chunks are yielded in export order, and each is sorted by `StartDate`.
+        Unlike `get_responses_df`, columns that are entirely pd.NA are *not* cast to object, so every chunk shares the same dtypes.
+
+        Each yielded ExportedFile's `last_response_id` and date watermarks are those of the last response read so far,
+        so a chunk can be written, and its status recorded, before the rest of the file is parsed.
+
+        Args:
+            See `get_responses_df`.
+            chunksize (int, optional): The maximum number of responses per chunk. Defaults to CHUNK_SIZE.
+        """
+        survey_id = parse_file_id(survey_id)
+        format = ExportCreationRequestFormat(format)
+
+        if format not in READABLE_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        raw_data = self.get_responses(
+            survey_id=survey_id,
+            format=format,
+            use_labels=use_labels,
+            end_date=end_date,
+            start_date=start_date,
+            export_responses_in_progress=export_responses_in_progress,
+            continuation_token=continuation_token,
+            last_response_id=last_response_id,
+            last_start_date=last_start_date,
+            columns=columns,
+            stream=stream,
+            **kwargs,
+        )
+        plan = self.get_column_plan(
+            survey_id=survey_id,
+            use_labels=use_labels,
+            columns=columns,
+            categorical=categorical,
+        )
+        dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
+
+        yield from iter_responses_chunks(
+            raw_data=raw_data,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            format=format,
+            fields=plan.fields,
+            use_labels=use_labels,
+            chunksize=chunksize,
+        )
+
     def get_responses_df(
         self,
         survey_id: str,
@@ -241,8 +1270,16 @@ class Surveys:
         export_responses_in_progress: bool = False,
         continuation_token: Optional[str] = None,
         last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
         filter_preview: bool = True,
         dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        stream: bool = True,
+        shards: int = 1,
+        engine: str = "c",
+        dtype_backend: str | None = None,
+        format: ExportCreationRequestFormat | str = ExportCreationRequestFormat.CSV,
         **kwargs: Any,
     ) -> ExportedFile[pd.DataFrame]:
         """Get responses from a survey by survey_id.
@@ -254,6 +1291,24 @@ class Surveys:
         If a last_response_id is provided, the export will continue from the response after the last_response_id.
         If a continuation_token is provided, the export will continue from where it left off. The continuation_token **cannot** be older than 1 week.
 
+        If `shards` is greater than 1, `[start_date, end_date)` is split into as many ranges, which are exported,
+        polled and downloaded concurrently, then merged; `end_date` defaults to now. As the server-side time of
+        an export grows with its size, this cuts the wall-clock time of exporting large surveys.
+        Sharded exports need a start date, given or resolved from `last_response_id`, and can't be continued.
+
+        If `categorical` is True, labeled single-choice questions are read as categoricals of the labels in the survey's
+        schema, rather than strings, which greatly reduces the memory used by surveys of many such questions.
+        Values outside of a question's labels are kept, as extra categories.
+
+        If `engine` is "pyarrow", the export is read with PyArrow's multithreaded CSV reader, parsing each column
+        as the Arrow type of its dtype. With `dtype_backend="pyarrow"` the DataFrame is Arrow-backed too, e.g. holding
+        strings as Arrow buffers rather than Python objects, which greatly reduces the memory used by wide surveys.
+        Both require the optional `pyarrow` dependency.
+
+        If `format` is "ndjson", responses are exported as newline-delimited JSON, and parsed a response at a time
+        into typed column buffers, without the quoting, escaping and metadata rows of CSV exports;
+        multi-valued fields, e.g. multi-select questions, are exported as lists, and kept as JSON-encoded lists.
+
         Additional keyword arguments are passed to `get_responses`, see the ExportCreationRequest model for more details.
 
         Args:
@@ -264,112 +1319,213 @@ class Surveys:
             export_responses_in_progress (bool, optional): Whether to export responses that are in progress. Defaults to False.
             continuation_token (Optional[str], optional): The continuation token for the response export. Defaults to None.
             last_response_id (Optional[str], optional): The responseId of the last response to export. Defaults to None.
+            last_start_date (Optional[datetime.datetime], optional): The start date of the last response. Defaults to None.
             filter_preview (bool, optional): Whether to filter out Survey Preview responses. Defaults to True.
-            parse_dates (list[str], optional): List of columns to parse as dates. Defaults to ["StartDate", "EndDate"].
+            dtypes (dict[str, Any], optional): Column dtypes, overriding those inferred from the survey's schema. Defaults to None.
+            columns (Iterable[str], optional): The columns to export; see `get_responses`. Defaults to None, every column.
+            categorical (bool, optional): Whether to read labeled single-choice questions as categoricals. Defaults to False.
+            stream (bool, optional): Whether to stream the export to a temporary file rather than memory. Defaults to True.
+            shards (int, optional): The number of date ranges to split the export into. Defaults to 1, unsharded.
+            engine (str, optional): The CSV parser, "c" or "pyarrow". Defaults to "c".
+            dtype_backend (str, optional): With the "pyarrow" engine, "pyarrow" for Arrow-backed dtypes. Defaults to None, NumPy dtypes.
+            format (ExportCreationRequestFormat | str, optional): The export format, "csv" or "ndjson". Defaults to "csv".
         """
         survey_id = parse_file_id(survey_id)
+        format = ExportCreationRequestFormat(format)
+
+        if format not in READABLE_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        if shards > 1:
+            return self._get_responses_df_sharded(
+                survey_id=survey_id,
+                shards=shards,
+                use_labels=use_labels,
+                end_date=end_date,
+                start_date=start_date,
+                export_responses_in_progress=export_responses_in_progress,
+                continuation_token=continuation_token,
+                last_response_id=last_response_id,
+                last_start_date=last_start_date,
+                filter_preview=filter_preview,
+                dtypes=dtypes,
+                columns=columns,
+                categorical=categorical,
+                stream=stream,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                format=format,
+                **kwargs,
+            )
 
         raw_data = self.get_responses(
             survey_id=survey_id,
+            format=format,
             use_labels=use_labels,
             end_date=end_date,
             start_date=start_date,
             export_responses_in_progress=export_responses_in_progress,
             continuation_token=continuation_token,
             last_response_id=last_response_id,
+            last_start_date=last_start_date,
+            columns=columns,
+            stream=stream,
             **kwargs,
         )
+        plan = self.get_column_plan(
+            survey_id=survey_id,
+            use_labels=use_labels,
+            columns=columns,
+            categorical=categorical,
+        )
+        dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
 
-        schema = self.get_survey_schema(survey_id=survey_id)
-        dtypes = qualtrics_schema_to_dtypes(
-            schema=schema, use_labels=use_labels, dtypes=dtypes
-        )
-
-        # Pandas' CSV reader cannot parse dates using the dtypes arg
-        # So we have to feed them into the parse_dates arg
-        parse_dates = []
-        for col, type in dtypes.items():
-            if isinstance(type, np.datetime64) or type == np.datetime64:
-                parse_dates.append(col)
-
-        dtypes = {k: v for k, v in dtypes.items() if k not in parse_dates}
-
-        with zipfile.ZipFile(BytesIO(raw_data.data)) as data:
-            with data.open(data.filelist[0]) as f:
-                logger.info(f"Reading file {f.name}...")
-
-                new_df_reader = pd.read_csv(
-                    f,
-                    skiprows=SKIP_ROWS,
-                    iterator=True,
-                    dtype=dtypes,
-                    skip_blank_lines=True,
-                    parse_dates=parse_dates,
-                )
-                new_df = pd.concat(new_df_reader, ignore_index=True)
+        return read_responses_df(
+            raw_data=raw_data,
+            dtypes=dtypes,
+            parse_dates=parse_dates,
+            last_response_id=last_response_id,
+            filter_preview=filter_preview,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            format=format,
+            fields=plan.fields,
+            use_labels=use_labels,
+        )
 
-                logger.info(f"Exported {len(new_df)} responses.")
+    def _get_responses_df_sharded(
+        self,
+        survey_id: str,
+        shards: int,
+        use_labels: bool = True,
+        end_date: datetime.datetime | None = None,
+        start_date: datetime.datetime | None = None,
+        continuation_token: Optional[str] = None,
+        last_response_id: Optional[str] = None,
+        last_start_date: datetime.datetime | None = None,
+        filter_preview: bool = True,
+        dtypes: dict[str, Any] | None = None,
+        columns: Iterable[str] | None = None,
+        categorical: bool = False,
+        engine: str = "c",
+        dtype_backend: str | None = None,
+        format: ExportCreationRequestFormat = ExportCreationRequestFormat.CSV,
+        **kwargs: Any,
+    ) -> ExportedFile[pd.DataFrame]:
+        if continuation_token is not None:
+            raise ValueError("Sharded exports can't be continued.")
 
-                new_df.set_index("ResponseId", inplace=True)
+        if start_date is None and last_response_id is not None:
+            start_date = (
+                last_start_date
+                if last_start_date is not None
+                else self._response_id_to_date(
+                    survey_id=survey_id, response_id=last_response_id
+                )
+            )
+        if start_date is None:
+            raise ValueError(
+                "Sharded exports need a start_date, or a last_response_id to resume from."
+            )
 
-                # If the last response is the same as the last response from the previous export, drop it.
-                if not new_df.empty and new_df.index[0] == last_response_id:
-                    new_df.drop(new_df.index[0], inplace=True)
+        date_ranges = shard_date_range(
+            start_date=as_utc(start_date),
+            end_date=as_utc(
+                end_date
+                if end_date is not None
+                else datetime.datetime.now(datetime.timezone.utc)
+            ),
+            shards=shards,
+        )
+        if not date_ranges:
+            raise ValueError(
+                "The start_date of a sharded export must precede its end_date."
+            )
 
-                # Sort by StartDate
-                new_df.sort_values("StartDate", inplace=True)
+        # Resolved and fetched once, rather than by every shard.
+        if kwargs.get("filter_name") is not None and kwargs.get("filter_id") is None:
+            kwargs["filter_id"] = self.resolve_filter(
+                survey_id=survey_id, filter_name=kwargs.pop("filter_name")
+            )
+        plan = self.get_column_plan(
+            survey_id=survey_id,
+            use_labels=use_labels,
+            columns=columns,
+            categorical=categorical,
+        )
+        read_dtypes, parse_dates = plan.read_csv_dtypes(dtypes)
 
-                # Replace all blank values with pd.NA
-                try:
-                    new_df.replace(
-                        [r"^\s*$", "-1", -1], pd.NA, regex=True, inplace=True
-                    )
-                except Exception as e:
-                    logger.error(e)
+        logger.info(f"Exporting {len(date_ranges)} shards of survey {survey_id}...")
 
-                # Cast all columns that are entirely pd.NA to object (str)
-                new_df = new_df.astype(
-                    {
-                        col: "object"
-                        for col in new_df.columns
-                        if new_df[col].isna().all()
-                    }
-                )
-                # Filter out Survey Preview responses
-                if filter_preview and "Status" in new_df.columns:
-                    preview_df = new_df[new_df["Status"] == "Survey Preview"]
-                    logger.info(
-                        f"Filtering out {len(preview_df)} Survey Preview responses."
-                    )
-                    new_df.drop(preview_df.index, inplace=True)
+        def export_shard(date_range: tuple[datetime.datetime, datetime.datetime]):
+            t_start_date, t_end_date = date_range
 
-                # Set the last_response_id to the last response in the DataFrame, or the last_response_id from the previous export.
-                last_response_id = (
-                    new_df.index[-1] if len(new_df) > 0 else last_response_id
-                )
+            raw_data = self.get_responses(
+                survey_id=survey_id,
+                format=format,
+                use_labels=use_labels,
+                start_date=t_start_date,
+                end_date=t_end_date,
+                columns=columns,
+                **kwargs,
+            )
+            df = read_export_df(
+                raw_data=raw_data,
+                dtypes=read_dtypes,
+                parse_dates=parse_dates,
+                last_response_id=last_response_id,
+                filter_preview=filter_preview,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                format=format,
+                fields=plan.fields,
+                use_labels=use_labels,
+            )
+            return raw_data, df
 
-                return ExportedFile(
-                    survey_id=raw_data.survey_id,
-                    file_id=raw_data.file_id,
-                    last_response_id=last_response_id,
-                    continuation_token=raw_data.continuation_token,
-                    data=new_df,
-                    timestamp=datetime.datetime.now(),
-                )
+        # Concurrent requests are still capped by `max_concurrent_requests`.
+        with ThreadPoolExecutor(max_workers=len(date_ranges)) as executor:
+            results = list(executor.map(export_shard, date_ranges))
+
+        return merge_sharded_dfs(results, last_response_id=last_response_id)
 
     def get_survey_schema(self, survey_id: str) -> dict[str, Any]:
         """Get the schema of a survey by survey_id.
 
+        Schemas are cached by `schema_cache`: a fresh entry is returned as-is, and a stale one is revalidated.
+
         Args:
             survey_id (str): The survey_id of the survey to get the schema from.
         """
         survey_id = parse_file_id(survey_id)
 
+        entry = self.schema_cache.get(survey_id)
+        if entry is not None and self.schema_cache.is_fresh(entry):
+            return entry.schema
+
         logger.info(f"Getting schema for survey {survey_id}...")
 
         schema_url = self._make_api_url(
             "surveys/{survey_id}/response-schema/", survey_id=survey_id
         )
-        r = requests.get(schema_url, headers=self.headers)
+        headers = {
+            **self.headers,
+            **(entry.revalidation_headers() if entry is not None else {}),
+        }
+        with self._limit():
+            r = requests.get(schema_url, headers=headers)
+
+        if entry is not None and r.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.info(f"Schema for survey {survey_id} is unchanged.")
+            self.schema_cache.touch(survey_id)
+            return entry.schema
+
         r.raise_for_status()
-        return r.json()
+
+        entry = self.schema_cache.put(
+            survey_id,
+            schema=r.json(),
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
+        return entry.schema
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import contextlib
+import datetime
 import pathlib
+import shutil
+import threading
 import uuid
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
 
@@ -10,25 +16,65 @@ import pandas as pd
 import sqlalchemy
 import tomllib
 from googleapiutils2 import Sheets, SheetsValueRange, get_oauth2_creds  # type: ignore
+from googleapiutils2.sheets.misc import SheetsValues
+from googleapiutils2.sheets.sheets_slice import SheetsRange
 from loguru import logger
 from sqlalchemy import Column, DateTime, Integer, MetaData, Table, Text, func
 from sqlalchemy.orm import declarative_base
 
+from qualtrics_utils.cache import SchemaCache
 from qualtrics_utils.codebook.generate import generate_codebook
 from qualtrics_utils.misc import ExportedFile, T
-from qualtrics_utils.survey import Surveys
+from qualtrics_utils.parquet import (
+    ROW_GROUP_SIZE,
+    STATUS_SUFFIX,
+    append_status,
+    format_part_name,
+    read_last_status,
+    upsert_dataset,
+    write_dataset,
+)
+from qualtrics_utils.sql import (
+    BATCH_SIZE,
+    LOAD_DATA_BATCH_SIZE,
+    ConflictPolicy,
+    WriteMethod,
+    add_columns,
+    bulk_insert,
+    create_unique_index,
+    get_metadata_cache,
+    has_unique_index,
+    load_data_infile,
+    missing_columns,
+    swap_tables,
+    transaction,
+)
+from qualtrics_utils.survey import Surveys, as_utc
 from qualtrics_utils.utils import (
-    coalesce_multiselect,
+    apply_codebook,
     create_mysql_engine,
+    decode_categoricals,
     generate_sql_schema,
     parse_file_id,
-    rename_columns,
 )
 
 
 class SyncType(Enum):
     SHEETS = "sheets"
     MYSQL = "mysql"
+    PARQUET = "parquet"
+
+
+class SyncMode(Enum):
+    """What each sync exports, and how it's written to the target.
+
+    - APPEND: responses recorded since the last sync, appended to the target.
+    - UPDATE: responses recorded *or modified* since the last sync, by last modified date,
+        merged into the target as upserts keyed on the response ID.
+    """
+
+    APPEND = "append"
+    UPDATE = "update"
 
 
 Base = declarative_base()
@@ -43,6 +89,11 @@ def get_status_table(table_name: str):
         Column("last_response_id", Text),
         Column("continuation_token", Text),
         Column("file_id", Text),
+        Column("last_start_date", DateTime),
+        Column("last_recorded_date", DateTime),
+        Column("last_modified_date", DateTime),
+        Column("row_count", Integer),
+        extend_existing=True,
     )
 
 
@@ -58,26 +109,72 @@ def format_responses_name(survey_id: str, table_name: str | None):
     return format_name(survey_id=survey_id, table_name=table_name, suffix="responses")
 
 
+def format_staging_name(table_name: str):
+    return f"{table_name}_staging"
+
+
 def format_status_row(exported_file: ExportedFile[T]):
     return dict(
         file_id=exported_file.file_id,
-        timestamp=exported_file.timestamp.isoformat(),
+        timestamp=exported_file.timestamp,
         last_response_id=exported_file.last_response_id,
         continuation_token=exported_file.continuation_token,
+        last_start_date=exported_file.last_start_date,
+        last_recorded_date=exported_file.last_recorded_date,
+        last_modified_date=exported_file.last_modified_date,
+        row_count=exported_file.row_count,
     )
 
 
+def parse_status_date(value: Any) -> datetime.datetime | None:
+    """Parse a date read back from a status row: a datetime from SQL, or an ISO string from Sheets."""
+    if value is None or value == "" or (isinstance(value, float) and pd.isna(value)):
+        return None
+    elif isinstance(value, datetime.datetime):
+        return value
+    else:
+        return datetime.datetime.fromisoformat(str(value))
+
+
+def later(*dates: datetime.datetime | None) -> datetime.datetime | None:
+    """Get the latest of some dates, ignoring missing ones."""
+    return max(filter(None, dates), default=None)
+
+
+def ensure_unique_index(
+    conn: sqlalchemy.Connection, table_name: str, columns: list[str]
+):
+    """Add a unique index on `columns` to an existing responses table, if it lacks one, so that conflicts are detected."""
+    if has_unique_index(conn, table_name, columns):
+        return
+
+    logger.info(f"Adding a unique index on {columns} to {table_name}...")
+
+    try:
+        create_unique_index(conn, table_name, columns)
+    except sqlalchemy.exc.DBAPIError as e:
+        conn.rollback()
+        raise ValueError(
+            f"Could not add a unique index on {columns} to {table_name}, which conflicting rows need; "
+            f"it may hold duplicate responses, which must be removed first, or the sync restarted."
+        ) from e
+
+    get_metadata_cache(conn).invalidate(table_name)
+
+
 def setup_sql(
     responses_table_name: str | None,
     status_table_name: str | None,
     conn: sqlalchemy.Connection,
     restart: bool = False,
+    unique_index: bool = True,
 ):
     def inner(exported_file: ExportedFile[pd.DataFrame]):
         survey_id = exported_file.survey_id
         df = exported_file.data
 
         metadata = MetaData()
+        metadata_cache = get_metadata_cache(conn)
 
         t_responses_table_name = format_responses_name(
             survey_id=survey_id, table_name=responses_table_name
@@ -93,30 +190,92 @@ def setup_sql(
             responses_table.drop(conn, checkfirst=True)
             status_table.drop(conn, checkfirst=True)
 
-        if not conn.dialect.has_table(conn, t_responses_table_name):
+            metadata_cache.invalidate(t_responses_table_name)
+            metadata_cache.invalidate(t_status_table_name)
+
+        if not metadata_cache.has_table(conn, t_responses_table_name):
             responses_table = generate_sql_schema(
-                df=df, table_name=t_responses_table_name, index_as_pk=True
+                df=df,
+                table_name=t_responses_table_name,
+                index_as_pk=True,
+                unique_index=unique_index,
+                # SQLite can only autoincrement a sole integer primary key.
+                composite_pk=conn.dialect.name != "sqlite",
             )
             responses_table.create(conn)
+            metadata_cache.invalidate(t_responses_table_name)
+        elif unique_index:
+            # Tables created by older versions are only unique on (id, ResponseId), which never conflicts.
+            ensure_unique_index(
+                conn=conn,
+                table_name=t_responses_table_name,
+                columns=[str(name) for name in df.index.names],
+            )
 
-        if not conn.dialect.has_table(conn, t_status_table_name):
+        if not metadata_cache.has_table(conn, t_status_table_name):
             status_table = get_status_table(table_name=t_status_table_name)
             status_table.create(conn)
+            metadata_cache.invalidate(t_status_table_name)
+        else:
+            # Status tables created by older versions lack the watermark columns.
+            status_table = metadata_cache.get_table(conn, t_status_table_name)
+            add_columns(
+                conn,
+                status_table,
+                [
+                    Column(col.name, col.type)
+                    for col in get_status_table(table_name=t_status_table_name).columns
+                    if col.name not in status_table.columns
+                ],
+            )
 
         conn.commit()
 
     return inner
 
 
+def finalize_shadow_sql(
+    responses_table_name: str | None,
+    status_table_name: str | None,
+    conn: sqlalchemy.Connection,
+):
+    """Swap fully loaded staging tables, i.e. the `*_staging` tables `sync_sql` writes to on a shadow restart, into place."""
+
+    def inner(exported_file: ExportedFile[pd.DataFrame]):
+        survey_id = exported_file.survey_id
+
+        t_responses_table_name = format_responses_name(
+            survey_id=survey_id, table_name=responses_table_name
+        )
+        t_status_table_name = format_status_name(
+            survey_id=survey_id, table_name=status_table_name
+        )
+
+        # The unique index is only built once the table is loaded, which is faster than maintaining it per row.
+        create_unique_index(
+            conn,
+            format_staging_name(t_responses_table_name),
+            [str(name) for name in exported_file.data.index.names],
+        )
+
+        swap_tables(
+            conn,
+            {
+                format_staging_name(t_responses_table_name): t_responses_table_name,
+                format_staging_name(t_status_table_name): t_status_table_name,
+            },
+        )
+
+    return inner
+
+
 def get_last_status_sql(table_name: str | None, conn: sqlalchemy.Connection):
     def inner(survey_id: str):
-        metadata = MetaData()
-
         status_table_name = format_status_name(
             survey_id=survey_id, table_name=table_name
         )
 
-        status_table = Table(status_table_name, metadata, autoload_with=conn)
+        status_table = get_metadata_cache(conn).get_table(conn, status_table_name)
 
         query = status_table.select().order_by(status_table.c.id.desc()).limit(1)
 
@@ -129,24 +288,26 @@ def get_last_status_sql(table_name: str | None, conn: sqlalchemy.Connection):
 def write_status_sql(
     table_name: str | None,
     conn: sqlalchemy.Connection,
+    commit: bool = True,
 ):
     def inner(
         exported_file: ExportedFile[T],
     ):
         survey_id = exported_file.survey_id
-        metadata = MetaData()
 
         status_table_name = format_status_name(
             survey_id=survey_id, table_name=table_name
         )
-        status_table = Table(status_table_name, metadata, autoload_with=conn)
+        status_table = get_metadata_cache(conn).get_table(conn, status_table_name)
 
         conn.execute(
             status_table.insert().values(
                 **format_status_row(exported_file),
             )
         )
-        conn.commit()
+
+        if commit:
+            conn.commit()
 
     return inner
 
@@ -154,6 +315,11 @@ def write_status_sql(
 def write_responses_sql(
     table_name: str | None,
     conn: sqlalchemy.Connection,
+    write_method: WriteMethod = WriteMethod.TO_SQL,
+    batch_size: int | None = None,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+    evolve_schema: bool = False,
+    commit: bool = True,
 ):
     def inner(
         exported_file: ExportedFile[pd.DataFrame],
@@ -161,29 +327,53 @@ def write_responses_sql(
         survey_id = exported_file.survey_id
         df = exported_file.data
 
-        metadata = MetaData()
-
         respones_table_name = format_responses_name(
             survey_id=survey_id, table_name=table_name
         )
 
-        responses_table = Table(respones_table_name, metadata, autoload_with=conn)
+        metadata_cache = get_metadata_cache(conn)
+        responses_table = metadata_cache.get_table(conn, respones_table_name)
+
+        if evolve_schema:
+            add_columns(conn, responses_table, missing_columns(responses_table, df))
+            responses_table = metadata_cache.get_table(conn, respones_table_name)
 
         existing_columns = [col.name for col in responses_table.columns]
         df.drop(
             columns=[col for col in df.columns if col not in existing_columns],
             inplace=True,
         )
+        df = decode_categoricals(df)
 
-        df.to_sql(
-            respones_table_name,
-            conn,
-            if_exists="append",
-            index=True,
-            index_label=df.index.name,
-        )
+        if write_method == WriteMethod.LOAD_DATA:
+            load_data_infile(
+                conn=conn,
+                table=responses_table,
+                df=df,
+                batch_size=(
+                    batch_size if batch_size is not None else LOAD_DATA_BATCH_SIZE
+                ),
+                on_conflict=on_conflict,
+            )
+        elif write_method == WriteMethod.BULK:
+            bulk_insert(
+                conn=conn,
+                table=responses_table,
+                df=df,
+                batch_size=batch_size if batch_size is not None else BATCH_SIZE,
+                on_conflict=on_conflict,
+            )
+        else:
+            df.to_sql(
+                respones_table_name,
+                conn,
+                if_exists="append",
+                index=True,
+                index_label=df.index.name,
+            )
 
-        conn.commit()
+        if commit:
+            conn.commit()
 
     return inner
 
@@ -264,7 +454,10 @@ def write_status_sheets(
             survey_id=survey_id, table_name=sheet_name
         )
 
-        row = format_status_row(exported_file)
+        row = {
+            k: v.isoformat() if isinstance(v, datetime.datetime) else v
+            for k, v in format_status_row(exported_file).items()
+        }
         return sheets.append(
             spreadsheet_id=sheet_url,
             range_name=status_sheet_name,
@@ -274,19 +467,61 @@ def write_status_sheets(
     return inner
 
 
+def get_sheet_rows(
+    sheet_name: str, sheet_url: str, sheets: Sheets, column: str
+) -> dict[Any, int]:
+    """Map each value of a column of a sheet to its (1-based) row number, after the header row."""
+    df = sheets.to_frame(sheets.values(spreadsheet_id=sheet_url, range_name=sheet_name))
+
+    if df is None or column not in df.columns:
+        return {}
+
+    return {value: i + 2 for i, value in enumerate(df[column]) if not pd.isna(value)}
+
+
 def write_responses_sheets(
     sheet_name: str | None,
     sheet_url: str,
     sheets: Sheets,
+    upsert: bool = False,
 ):
+    """Write the exported responses to a sheet, appending them.
+
+    If `upsert` is True, responses already in the sheet, by their response ID, are updated in place instead.
+    """
+
     def inner(exported_file: ExportedFile[pd.DataFrame]):
-        df = exported_file.data
+        df = decode_categoricals(exported_file.data)
         survey_id = exported_file.survey_id
 
         responses_sheet_name = format_responses_name(
             survey_id=survey_id, table_name=sheet_name
         )
 
+        if upsert and len(df) > 0:
+            rows = get_sheet_rows(
+                sheet_name=responses_sheet_name,
+                sheet_url=sheet_url,
+                sheets=sheets,
+                column=df.index.name,
+            )
+            existing = df.index.isin(list(rows))
+
+            if existing.any():
+                updates = sheets.from_frame(
+                    df[existing].reset_index(drop=False), as_dict=True
+                )
+                # One single-row range per response, starting at its existing row.
+                data: dict[SheetsRange, SheetsValues] = {}
+                for row in updates:
+                    assert isinstance(row, dict)
+                    row_range = f"'{responses_sheet_name}'!A{rows[row[df.index.name]]}"
+                    data[row_range] = [row]
+
+                sheets.batch_update(sheet_url, data)
+
+            df = df[~existing]
+
         values = sheets.from_frame(df.reset_index(drop=False), as_dict=True)
 
         if len(values) == 0:
@@ -301,6 +536,88 @@ def write_responses_sheets(
     return inner
 
 
+def format_status_path(path: pathlib.Path, survey_id: str, file_name: str | None):
+    return (
+        path
+        / f"{format_status_name(survey_id=survey_id, table_name=file_name)}{STATUS_SUFFIX}"
+    )
+
+
+def setup_parquet(
+    responses_dataset_name: str | None,
+    status_file_name: str | None,
+    path: pathlib.Path,
+    restart: bool = False,
+):
+    def inner(exported_file: ExportedFile[pd.DataFrame]):
+        survey_id = exported_file.survey_id
+
+        responses_path = path / format_responses_name(
+            survey_id=survey_id, table_name=responses_dataset_name
+        )
+        status_path = format_status_path(
+            path=path, survey_id=survey_id, file_name=status_file_name
+        )
+
+        if restart:
+            shutil.rmtree(responses_path, ignore_errors=True)
+            status_path.unlink(missing_ok=True)
+
+        responses_path.mkdir(parents=True, exist_ok=True)
+
+    return inner
+
+
+def get_last_status_parquet(file_name: str | None, path: pathlib.Path):
+    def inner(survey_id: str):
+        return read_last_status(
+            format_status_path(path=path, survey_id=survey_id, file_name=file_name)
+        )
+
+    return inner
+
+
+def write_status_parquet(file_name: str | None, path: pathlib.Path):
+    def inner(exported_file: ExportedFile[T]):
+        append_status(
+            format_status_path(
+                path=path, survey_id=exported_file.survey_id, file_name=file_name
+            ),
+            format_status_row(exported_file),
+        )
+
+    return inner
+
+
+def write_responses_parquet(
+    dataset_name: str | None,
+    path: pathlib.Path,
+    upsert: bool = False,
+    row_group_size: int = ROW_GROUP_SIZE,
+):
+    """Write the exported responses to a Parquet dataset, appending them as new files; see `write_dataset`.
+
+    If `upsert` is True, responses already in the dataset, by their response ID, are replaced instead; see `upsert_dataset`.
+    """
+
+    def inner(exported_file: ExportedFile[pd.DataFrame]):
+        survey_id = exported_file.survey_id
+
+        responses_path = path / format_responses_name(
+            survey_id=survey_id, table_name=dataset_name
+        )
+        write_func = upsert_dataset if upsert else write_dataset
+
+        write_func(
+            exported_file.data,
+            path=responses_path,
+            name=format_part_name(exported_file.timestamp),
+            row_group_size=row_group_size,
+        )
+
+    return inner
+
+
 ResponsePostProcessingFunc = Callable[[pd.DataFrame], pd.DataFrame]
 
 responses_post_processing_func_default: ResponsePostProcessingFunc = lambda x: x
@@ -314,10 +631,14 @@ def _sync(
     responses_writer: Callable[[ExportedFile[pd.DataFrame]], None],
     setup_func: Callable[[ExportedFile[pd.DataFrame]], None],
     responses_post_processing_func: ResponsePostProcessingFunc = responses_post_processing_func_default,
+    write_lock: contextlib.AbstractContextManager | None = None,
+    transaction: Callable[[], contextlib.AbstractContextManager] | None = None,
+    finalize_func: Callable[[ExportedFile[pd.DataFrame]], None] | None = None,
+    mode: SyncMode = SyncMode.APPEND,
     **kwargs: Any,
 ):
     survey_id = parse_file_id(survey_id)
-    logger.info(f"Syncing survey {survey_id}...")
+    logger.info(f"Syncing survey {survey_id} in {mode.value} mode...")
 
     last_status = None
     try:
@@ -330,43 +651,110 @@ def _sync(
     last_response_id = (
         last_status["last_response_id"] if last_status is not None else None
     )
-    # Only fallback to continuation token if last response ID is None.
-    continuation_token = (
-        last_status["continuation_token"]
-        if last_status is not None and last_response_id is None
-        else None
+    last_start_date, last_recorded_date, last_modified_date = (
+        (
+            parse_status_date(last_status.get("last_start_date")),
+            parse_status_date(last_status.get("last_recorded_date")),
+            parse_status_date(last_status.get("last_modified_date")),
+        )
+        if last_status is not None
+        else (None, None, None)
     )
 
-    logger.info(
-        f"Last response ID: {last_response_id} and continuation token: {continuation_token}"
-    )
+    if mode == SyncMode.UPDATE:
+        logger.info(f"Last modified date: {last_modified_date}")
+
+        # Export every response created or modified since the last sync, by their last modified date.
+        start_date = kwargs.pop("start_date", None)
+        # Exports don't have a last modified date column, unless the survey's schema has one:
+        # the next sync then starts from when this export was requested, as naive UTC like the other watermarks.
+        exported_at = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+        exported_file = surveys.get_responses_df(
+            survey_id=survey_id,
+            start_date=(
+                as_utc(last_modified_date)
+                if last_modified_date is not None
+                else start_date
+            ),
+            sort_by_last_modified_date=True,
+            **kwargs,
+        )
+        if exported_file.last_modified_date is None:
+            exported_file.last_modified_date = exported_at
+    else:
+        # Only fallback to continuation token if last response ID is None.
+        continuation_token = (
+            last_status["continuation_token"]
+            if last_status is not None and last_response_id is None
+            else None
+        )
+
+        logger.info(
+            f"Last response ID: {last_response_id} and continuation token: {continuation_token}"
+        )
+
+        # Resume from the last start date watermark, if any, rather than fetching the last response's start date.
+        exported_file = surveys.get_responses_df(
+            survey_id=survey_id,
+            last_response_id=last_response_id,
+            continuation_token=continuation_token,
+            last_start_date=last_start_date if last_response_id is not None else None,
+            **kwargs,
+        )
 
-    exported_file = surveys.get_responses_df(
-        survey_id=survey_id,
-        last_response_id=last_response_id,
-        continuation_token=continuation_token,
-        **kwargs,
-    )
     exported_file.data = responses_post_processing_func(exported_file.data)
 
-    logger.info(f"Setting up tables...")
-    setup_func(exported_file)
+    # Watermarks only move forward: an empty export, or one of older modified responses, carries them over.
+    # An export ending on the watermark's start date keeps its own last response, which may be a newer one.
+    if last_start_date is not None and (
+        exported_file.last_start_date is None
+        or exported_file.last_start_date < last_start_date
+    ):
+        exported_file.last_start_date = last_start_date
+        exported_file.last_response_id = last_response_id
+
+    exported_file.last_recorded_date = later(
+        exported_file.last_recorded_date, last_recorded_date
+    )
+    exported_file.last_modified_date = later(
+        exported_file.last_modified_date, last_modified_date
+    )
+
+    # Only the writes are serialized: exporting runs concurrently with other syncs to the same target.
+    with write_lock if write_lock is not None else contextlib.nullcontext():
+        logger.info(f"Setting up tables...")
+        setup_func(exported_file)
+
+        # Write the responses and status atomically, if the target supports it.
+        with transaction() if transaction is not None else contextlib.nullcontext():
+            logger.info(f"Writing responses...")
+            responses_writer(exported_file)
 
-    logger.info(f"Writing responses...")
-    responses_writer(exported_file)
+            logger.info(f"Writing status...")
+            status_writer(exported_file)
 
-    logger.info(f"Writing status...")
-    status_writer(exported_file)
+        if finalize_func is not None:
+            logger.info(f"Finalizing...")
+            finalize_func(exported_file)
 
 
 def sync_sql(
     survey_id: str,
     surveys: Surveys,
-    conn: sqlalchemy.Connection,
+    conn: sqlalchemy.Connection | sqlalchemy.Engine,
     responses_table_name: str | None = None,
     status_table_name: str | None = None,
     restart: bool = False,
     response_post_processing_func: "ResponsePostProcessingFunc" = responses_post_processing_func_default,
+    write_lock: contextlib.AbstractContextManager | None = None,
+    write_method: WriteMethod = WriteMethod.TO_SQL,
+    batch_size: int | None = None,
+    on_conflict: ConflictPolicy = ConflictPolicy.ERROR,
+    evolve_schema: bool = False,
+    transactional: bool = False,
+    shadow_restart: bool = False,
+    mode: SyncMode = SyncMode.APPEND,
     **kwargs: Any,
 ) -> None:
     survey_id = parse_file_id(survey_id)
@@ -390,22 +778,126 @@ def sync_sql(
         3. The retrieved survey responses are post-processed using the response_post_processing_func function.
         4. The post-processed survey responses are written to the target.
         5. The last status is written to the target.
+
+    Responses are written with `pd.DataFrame.to_sql` by default, with batched multi-row inserts
+    if `write_method` is WriteMethod.BULK, or with `LOAD DATA LOCAL INFILE` if it's WriteMethod.LOAD_DATA;
+    `batch_size` defaults to BATCH_SIZE and LOAD_DATA_BATCH_SIZE rows respectively.
+    Both of the latter handle rows conflicting on the response ID per `on_conflict`.
+
+    Columns of the responses missing from an existing responses table are dropped, unless `evolve_schema` is True,
+    in which case they're added to the table with `ALTER TABLE ... ADD COLUMN`.
+
+    If `transactional` is True, the responses and status are written in a single transaction, so that an interrupted
+    sync leaves neither behind.
+
+    If `conn` is an engine, a connection is only checked out to read the last status, and then to set up and write
+    to the tables, under the `write_lock`; none is held while the responses are exported, which can take minutes.
+
+    On restart, the existing tables are dropped before the responses are written, unless `shadow_restart` is True:
+    then the responses are loaded into staging tables, without a unique index on the response ID until loaded,
+    which are then swapped into place atomically.
+
+    If `mode` is SyncMode.UPDATE, every response recorded or modified since the last sync is exported, by its last
+    modified date, and upserted into the responses table: `on_conflict` is ConflictPolicy.UPDATE, and WriteMethod.TO_SQL,
+    which can't upsert, is replaced by WriteMethod.BULK.
     """
+    # Modified responses are merged into the table by their response ID.
+    if mode == SyncMode.UPDATE:
+        on_conflict = ConflictPolicy.UPDATE
+
+        if write_method == WriteMethod.TO_SQL:
+            write_method = WriteMethod.BULK
+
+    # An engine's connections are only checked out while needed; a given connection is used as-is, and left open.
+    connect: Callable[[], contextlib.AbstractContextManager[sqlalchemy.Connection]] = (
+        conn.connect
+        if isinstance(conn, sqlalchemy.Engine)
+        else lambda: contextlib.nullcontext(conn)
+    )
+    # The connection of the write phase, checked out by `connect_writes`.
+    write_conns: list[sqlalchemy.Connection] = []
+
+    def get_conn() -> sqlalchemy.Connection:
+        return write_conns[-1]
+
+    @contextlib.contextmanager
+    def connect_writes():
+        with (
+            write_lock if write_lock is not None else contextlib.nullcontext(),
+            connect() as t_conn,
+        ):
+            write_conns.append(t_conn)
+            try:
+                yield
+            finally:
+                write_conns.pop()
+
+    def status_reader(survey_id: str):
+        with connect() as t_conn:
+            return get_last_status_sql(table_name=status_table_name, conn=t_conn)(
+                survey_id
+            )
+
+    shadow = restart and shadow_restart
+    t_responses_table_name, t_status_table_name = (
+        responses_table_name,
+        status_table_name,
+    )
+
+    if shadow:
+        t_responses_table_name = format_staging_name(
+            format_responses_name(survey_id=survey_id, table_name=responses_table_name)
+        )
+        t_status_table_name = format_staging_name(
+            format_status_name(survey_id=survey_id, table_name=status_table_name)
+        )
+
+    # Each writer is bound to the connection of the write phase when called.
+    def status_writer(exported_file: ExportedFile[pd.DataFrame]):
+        write_status_sql(
+            table_name=t_status_table_name, conn=get_conn(), commit=not transactional
+        )(exported_file)
+
+    def responses_writer(exported_file: ExportedFile[pd.DataFrame]):
+        write_responses_sql(
+            table_name=t_responses_table_name,
+            conn=get_conn(),
+            write_method=write_method,
+            batch_size=batch_size,
+            on_conflict=on_conflict,
+            evolve_schema=evolve_schema,
+            commit=not transactional,
+        )(exported_file)
+
+    def setup_func(exported_file: ExportedFile[pd.DataFrame]):
+        setup_sql(
+            responses_table_name=t_responses_table_name,
+            status_table_name=t_status_table_name,
+            conn=get_conn(),
+            restart=restart,
+            unique_index=not shadow,
+        )(exported_file)
+
+    def finalize_func(exported_file: ExportedFile[pd.DataFrame]):
+        finalize_shadow_sql(
+            responses_table_name=responses_table_name,
+            status_table_name=status_table_name,
+            conn=get_conn(),
+        )(exported_file)
+
     _sync(
         survey_id=survey_id,
         surveys=surveys,
-        status_reader=get_last_status_sql(table_name=status_table_name, conn=conn),
-        status_writer=write_status_sql(table_name=status_table_name, conn=conn),
-        responses_writer=write_responses_sql(
-            table_name=responses_table_name, conn=conn
-        ),
-        setup_func=setup_sql(
-            responses_table_name=responses_table_name,
-            status_table_name=status_table_name,
-            conn=conn,
-            restart=restart,
-        ),
+        # A restart exports every response, regardless of the last status.
+        status_reader=(lambda survey_id: None) if restart else status_reader,
+        status_writer=status_writer,
+        responses_writer=responses_writer,
+        setup_func=setup_func,
         responses_post_processing_func=response_post_processing_func,
+        write_lock=connect_writes(),
+        transaction=(lambda: transaction(get_conn())) if transactional else None,
+        finalize_func=finalize_func if shadow else None,
+        mode=mode,
         **kwargs,
     )
 
@@ -419,6 +911,8 @@ def sync_sheets(
     status_sheet_name: str | None = None,
     restart: bool = False,
     response_post_processing_func: "ResponsePostProcessingFunc" = responses_post_processing_func_default,
+    write_lock: contextlib.AbstractContextManager | None = None,
+    mode: SyncMode = SyncMode.APPEND,
     **kwargs: Any,
 ) -> None:
     """Syncs survey responses and status from a given survey source to a Google Sheet.
@@ -438,18 +932,30 @@ def sync_sheets(
         2. The survey responses are retrieved from the survey source, starting from the last response ID if possible, and the continuation token if possible.
         3. The retrieved survey responses are post-processed using the response_post_processing_func function.
         4. The post-processed survey responses are written to the target.
-        5. The last status is written to the target."""
+        5. The last status is written to the target.
+
+    If `mode` is SyncMode.UPDATE, every response recorded or modified since the last sync is exported, by its last
+    modified date; responses already in the sheet are updated in place, and the rest are appended.
+    """
     _sync(
         survey_id=survey_id,
         surveys=surveys,
-        status_reader=get_last_status_sheets(
-            sheet_name=status_sheet_name, sheet_url=sheet_url, sheets=sheets
+        # A restart exports every response, regardless of the last status.
+        status_reader=(
+            (lambda survey_id: None)
+            if restart
+            else get_last_status_sheets(
+                sheet_name=status_sheet_name, sheet_url=sheet_url, sheets=sheets
+            )
         ),
         status_writer=write_status_sheets(
             sheet_name=status_sheet_name, sheet_url=sheet_url, sheets=sheets
         ),
         responses_writer=write_responses_sheets(
-            sheet_name=responses_sheet_name, sheet_url=sheet_url, sheets=sheets
+            sheet_name=responses_sheet_name,
+            sheet_url=sheet_url,
+            sheets=sheets,
+            upsert=mode == SyncMode.UPDATE,
         ),
         setup_func=setup_sheets(
             responses_sheet_name=responses_sheet_name,
@@ -459,56 +965,211 @@ def sync_sheets(
             restart=restart,
         ),
         responses_post_processing_func=response_post_processing_func,
+        write_lock=write_lock,
+        mode=mode,
         **kwargs,
     )
 
 
-def sync(
-    config: dict[str, Any],
-    type: SyncType,
-    responses_table_name: str | None,
-    status_table_name: str | None,
-    verbose: bool,
-    restart: bool,
-):
-    qualtrics_config = config["qualtrics"]
+def sync_parquet(
+    survey_id: str,
+    surveys: Surveys,
+    path: pathlib.Path | str,
+    responses_dataset_name: str | None = None,
+    status_file_name: str | None = None,
+    restart: bool = False,
+    response_post_processing_func: "ResponsePostProcessingFunc" = responses_post_processing_func_default,
+    write_lock: contextlib.AbstractContextManager | None = None,
+    mode: SyncMode = SyncMode.APPEND,
+    row_group_size: int = ROW_GROUP_SIZE,
+    **kwargs: Any,
+) -> None:
+    """Syncs survey responses and status from a given survey source to a Parquet dataset under `path`.
 
-    if "api_token" not in qualtrics_config:
-        raise ValueError("API token is not provided in the config file.")
+    The responses are written to a dataset directory, named {survey_id}_responses unless a name is provided,
+    partitioned by the month of their start date, e.g. `start_month=2023-01/`. Each sync appends a new file
+    to each partition it has responses for, of row groups of at most `row_group_size` rows, so that
+    columnar readers, e.g. DuckDB or Polars, scan only the columns and partitions they need.
 
-    qualtrics_api_token = qualtrics_config["api_token"]
-    codebook_path = (
-        pathlib.Path(qualtrics_config["codebook_path"])
-        if "codebook_path" in qualtrics_config
-        else None
+    The status of each sync is appended to a JSON lines file next to it, {survey_id}_status.jsonl unless a name is provided.
+
+    The process is otherwise that of `sync_sql`. If `mode` is SyncMode.UPDATE, every response recorded or modified
+    since the last sync is exported, by its last modified date, and replaces its previous version in the dataset.
+    Requires the optional `pyarrow` dependency.
+    """
+    path = pathlib.Path(path)
+
+    _sync(
+        survey_id=survey_id,
+        surveys=surveys,
+        # A restart exports every response, regardless of the last status.
+        status_reader=(
+            (lambda survey_id: None)
+            if restart
+            else get_last_status_parquet(file_name=status_file_name, path=path)
+        ),
+        status_writer=write_status_parquet(file_name=status_file_name, path=path),
+        responses_writer=write_responses_parquet(
+            dataset_name=responses_dataset_name,
+            path=path,
+            upsert=mode == SyncMode.UPDATE,
+            row_group_size=row_group_size,
+        ),
+        setup_func=setup_parquet(
+            responses_dataset_name=responses_dataset_name,
+            status_file_name=status_file_name,
+            path=path,
+            restart=restart,
+        ),
+        responses_post_processing_func=response_post_processing_func,
+        write_lock=write_lock,
+        mode=mode,
+        **kwargs,
     )
 
-    surveys = Surveys(api_token=qualtrics_api_token)
 
-    if "survey_id" not in qualtrics_config:
-        raise ValueError("Survey ID is not provided in the config file.")
+@dataclass
+class SurveyConfig:
+    """The sync configuration of a single survey."""
+
+    survey_id: str
+    responses_table_name: str | None = None
+    status_table_name: str | None = None
+    codebook_path: pathlib.Path | None = None
+    survey_args: dict[str, Any] = field(default_factory=dict)
+
+
+def parse_survey_configs(
+    qualtrics_config: dict[str, Any],
+    responses_table_name: str | None = None,
+    status_table_name: str | None = None,
+) -> list[SurveyConfig]:
+    """Parse the surveys to sync from the `qualtrics` section of a config file.
+
+    Either a single `survey_id` or a `surveys` array of tables may be given.
+    Each entry of the latter may set its own `survey_id`, `responses_table_name`, `status_table_name`,
+    `codebook_path`, and `survey_args`; the top-level `codebook_path` and `survey_args` are used as defaults.
+
+    Table names given here, e.g. from the CLI, only apply to a single survey.
+    """
+    codebook_path = qualtrics_config.get("codebook_path")
+    survey_args = qualtrics_config.get("survey_args", {})
+
+    if "surveys" not in qualtrics_config:
+        if "survey_id" not in qualtrics_config:
+            raise ValueError("Survey ID is not provided in the config file.")
+
+        return [
+            SurveyConfig(
+                survey_id=qualtrics_config["survey_id"],
+                responses_table_name=responses_table_name,
+                status_table_name=status_table_name,
+                codebook_path=(
+                    pathlib.Path(codebook_path) if codebook_path is not None else None
+                ),
+                survey_args=survey_args,
+            )
+        ]
+
+    surveys = qualtrics_config["surveys"]
+
+    if len(surveys) > 1 and (
+        responses_table_name is not None or status_table_name is not None
+    ):
+        raise ValueError("Table names can only be provided for a single survey.")
+
+    survey_configs = []
+    for survey in surveys:
+        if "survey_id" not in survey:
+            raise ValueError(f"Survey ID is not provided for survey {survey}.")
+
+        t_codebook_path = survey.get("codebook_path", codebook_path)
+
+        survey_configs.append(
+            SurveyConfig(
+                survey_id=survey["survey_id"],
+                responses_table_name=survey.get(
+                    "responses_table_name", responses_table_name
+                ),
+                status_table_name=survey.get("status_table_name", status_table_name),
+                codebook_path=(
+                    pathlib.Path(t_codebook_path)
+                    if t_codebook_path is not None
+                    else None
+                ),
+                survey_args={**survey_args, **survey.get("survey_args", {})},
+            )
+        )
+
+    return survey_configs
+
+
+class TableLocks:
+    """A lock per target table, so that concurrent syncs to the same table write one at a time."""
 
-    survey_id = qualtrics_config["survey_id"]
+    def __init__(self):
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
 
-    survey_args = (
-        qualtrics_config["survey_args"] if "survey_args" in qualtrics_config else {}
+    def _get(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+
+    @contextlib.contextmanager
+    def hold(self, *names: str):
+        # Acquire in a consistent order to avoid deadlocks.
+        with contextlib.ExitStack() as stack:
+            for name in sorted(set(names)):
+                stack.enter_context(self._get(name))
+            yield
+
+
+def create_sync_engine(config: dict[str, Any]) -> sqlalchemy.Engine:
+    """Create the MySQL engine of a sync, allowing local files to be loaded if the `load_data` write method is used."""
+    write_method = WriteMethod(config.get("sync", {}).get("write_method", "to_sql"))
+
+    return create_mysql_engine(
+        **{
+            "local_infile": write_method == WriteMethod.LOAD_DATA,
+            **config["mysql"],
+        }
     )
 
-    logger.info(f"Type: {type}")
-    logger.info(f"Restart: {restart}")
-    logger.info(f"Responses table name: {responses_table_name}")
-    logger.info(f"Status table name: {status_table_name}")
-    logger.info(f"Verbose: {verbose}")
+
+def sync_survey(
+    config: dict[str, Any],
+    type: SyncType,
+    survey_config: SurveyConfig,
+    surveys: Surveys,
+    verbose: bool,
+    restart: bool,
+    table_locks: TableLocks | None = None,
+    engine: sqlalchemy.Engine | None = None,
+):
+    survey_id = parse_file_id(survey_config.survey_id)
+    codebook_path = survey_config.codebook_path
+
+    responses_table_name = format_responses_name(
+        survey_id=survey_id, table_name=survey_config.responses_table_name
+    )
+    status_table_name = format_status_name(
+        survey_id=survey_id, table_name=survey_config.status_table_name
+    )
+    write_lock = (
+        table_locks.hold(responses_table_name, status_table_name)
+        if table_locks is not None
+        else None
+    )
 
     def post_processing_func(df: pd.DataFrame):
         if codebook_path is None:
             return df
 
         codebook = generate_codebook(codebook_path)
-        tmp = coalesce_multiselect(df, codebook=codebook)
-        tmp = rename_columns(tmp, codebook=codebook, verbose=verbose)
+        return apply_codebook(df, codebook=codebook, verbose=verbose)
 
-        return tmp
+    sync_config = config.get("sync", {})
+    mode = SyncMode(sync_config.get("mode", "append"))
 
     if type == SyncType.SHEETS:
         responses_url = config["google"]["urls"]["responses"]
@@ -520,29 +1181,136 @@ def sync(
             survey_id=survey_id,
             surveys=surveys,
             response_post_processing_func=post_processing_func,
-            responses_sheet_name=responses_table_name,
-            status_sheet_name=status_table_name,
+            responses_sheet_name=survey_config.responses_table_name,
+            status_sheet_name=survey_config.status_table_name,
             sheet_url=responses_url,
             sheets=sheets,
             restart=restart,
-            **survey_args,
+            write_lock=write_lock,
+            mode=mode,
+            **survey_config.survey_args,
         )
     elif type == SyncType.MYSQL:
-        engine = create_mysql_engine(
-            **config["mysql"],
+        if engine is None:
+            engine = create_sync_engine(config)
+
+        # The engine is passed down, so that no connection is held while the responses are exported.
+        sync_sql(
+            survey_id=survey_id,
+            surveys=surveys,
+            response_post_processing_func=post_processing_func,
+            conn=engine,
+            responses_table_name=survey_config.responses_table_name,
+            status_table_name=survey_config.status_table_name,
+            restart=restart,
+            write_lock=write_lock,
+            write_method=WriteMethod(sync_config.get("write_method", "to_sql")),
+            batch_size=sync_config.get("batch_size"),
+            on_conflict=ConflictPolicy(sync_config.get("on_conflict", "error")),
+            evolve_schema=sync_config.get("evolve_schema", False),
+            transactional=sync_config.get("transactional", False),
+            shadow_restart=sync_config.get("shadow_restart", False),
+            mode=mode,
+            **survey_config.survey_args,
         )
+    elif type == SyncType.PARQUET:
+        parquet_config = config["parquet"]
 
-        with engine.connect() as conn:
-            sync_sql(
-                survey_id=survey_id,
-                surveys=surveys,
-                response_post_processing_func=post_processing_func,
-                conn=conn,
-                responses_table_name=responses_table_name,
-                status_table_name=status_table_name,
-                restart=restart,
-                **survey_args,
-            )
+        sync_parquet(
+            survey_id=survey_id,
+            surveys=surveys,
+            response_post_processing_func=post_processing_func,
+            path=parquet_config["path"],
+            responses_dataset_name=survey_config.responses_table_name,
+            status_file_name=survey_config.status_table_name,
+            restart=restart,
+            write_lock=write_lock,
+            mode=mode,
+            row_group_size=parquet_config.get("row_group_size", ROW_GROUP_SIZE),
+            **survey_config.survey_args,
+        )
+
+
+def sync(
+    config: dict[str, Any],
+    type: SyncType,
+    responses_table_name: str | None,
+    status_table_name: str | None,
+    verbose: bool,
+    restart: bool,
+):
+    """Sync every survey in the config file to the given target.
+
+    Surveys are synced concurrently by a pool of `sync.max_workers` threads (defaults to 1),
+    sharing a single Qualtrics client limited to `sync.max_concurrent_requests` in-flight API requests.
+    Writes to the same target table are serialized.
+    """
+    qualtrics_config = config["qualtrics"]
+    sync_config = config.get("sync", {})
+
+    if "api_token" not in qualtrics_config:
+        raise ValueError("API token is not provided in the config file.")
+
+    qualtrics_api_token = qualtrics_config["api_token"]
+
+    schema_cache = SchemaCache(
+        ttl=sync_config.get("schema_cache_ttl", 300.0),
+        path=sync_config.get("schema_cache_path"),
+    )
+    surveys = Surveys(
+        api_token=qualtrics_api_token,
+        max_concurrent_requests=sync_config.get("max_concurrent_requests"),
+        schema_cache=schema_cache,
+    )
+
+    survey_configs = parse_survey_configs(
+        qualtrics_config=qualtrics_config,
+        responses_table_name=responses_table_name,
+        status_table_name=status_table_name,
+    )
+    max_workers = max(min(sync_config.get("max_workers", 1), len(survey_configs)), 1)
+
+    logger.info(f"Type: {type}")
+    logger.info(f"Restart: {restart}")
+    logger.info(f"Surveys: {len(survey_configs)}")
+    logger.info(f"Workers: {max_workers}")
+    logger.info(f"Responses table name: {responses_table_name}")
+    logger.info(f"Status table name: {status_table_name}")
+    logger.info(f"Verbose: {verbose}")
+
+    table_locks = TableLocks()
+    # Share one connection pool across all workers.
+    engine = create_sync_engine(config) if type == SyncType.MYSQL else None
+
+    def run(survey_config: SurveyConfig):
+        sync_survey(
+            config=config,
+            type=type,
+            survey_config=survey_config,
+            surveys=surveys,
+            verbose=verbose,
+            restart=restart,
+            table_locks=table_locks,
+            engine=engine,
+        )
+
+    if len(survey_configs) == 1:
+        return run(survey_configs[0])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            survey_config.survey_id: executor.submit(run, survey_config)
+            for survey_config in survey_configs
+        }
+
+    failed = []
+    for survey_id, future in futures.items():
+        if (e := future.exception()) is not None:
+            logger.error(f"Failed to sync survey {survey_id}: {e}")
+            failed.append(survey_id)
+
+    if len(failed) > 0:
+        raise Exception(f"Failed to sync {len(failed)} surveys: {failed}")
 
 
 def main():
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 import urllib.parse
+from dataclasses import dataclass, field
 from functools import cache
-from typing import Any
+from typing import Any, Iterable
 
 import numpy as np
 import pandas as pd
@@ -20,6 +21,7 @@ from sqlalchemy import (
     Integer,
     MetaData,
     Table,
+    UniqueConstraint,
 )
 from sqlalchemy import Text as SQLAlchemyText
 
@@ -159,15 +161,51 @@ def reset_request_defaults(request: T, set_items: dict[str, Any]) -> T:
     return request
 
 
-def rename_columns(
-    df: pd.DataFrame, codebook: list[dict[str, Any]], verbose: bool = True
-) -> pd.DataFrame:
+def coalesce_columns(
+    df: pd.DataFrame,
+    delimiter: str = ", ",
+    use_multiple: bool = True,
+) -> pd.Series:
+    """Coalesce the non-null values of each row of `df` into a single string.
+
+    Rows with no values become "", and rows with more than one value become "Multiple" if `use_multiple` is True,
+    else their values joined by `delimiter`, in column order.
+
+    This is vectorized over rows: the loop is over columns, of which a multi-select question has but a few.
+    """
+    values = df.to_numpy(dtype=object)
+    mask = pd.notna(values)
+
+    out = np.full(len(df), "", dtype=object)
+    has_value = np.zeros(len(df), dtype=bool)
+
+    if use_multiple:
+        multiple = mask.sum(axis=1) > 1
+        mask &= ~multiple[:, None]
+        out[multiple] = "Multiple"
+
+    for i in range(values.shape[1]):
+        col_mask = mask[:, i]
+        col_values = values[col_mask, i]
+
+        out[col_mask] = np.where(
+            has_value[col_mask], out[col_mask] + delimiter + col_values, col_values
+        )
+        has_value |= col_mask
+
+    return pd.Series(out, index=df.index, dtype=object)
+
+
+def _renaming_map(
+    codebook: list[dict[str, Any]], columns: set[str], verbose: bool = True
+) -> dict[str, str]:
     renaming_map = {}
+
     for question in codebook:
         root_q_num = question["question_number"]
         sub_questions = question.get("questions")
 
-        if root_q_num in df.columns:
+        if root_q_num in columns:
             if verbose:
                 renaming_map[root_q_num] = (
                     f"{root_q_num} - {question['question_string']}"
@@ -178,7 +216,7 @@ def rename_columns(
         if sub_questions is not None and len(sub_questions) >= 1:
             for sub_question in sub_questions:
                 q_num = sub_question["question_number"]
-                if q_num not in df.columns:
+                if q_num not in columns:
                     continue
 
                 if verbose:
@@ -188,6 +226,131 @@ def rename_columns(
                 else:
                     renaming_map[q_num] = f"{sub_question['question_number']}"
 
+    return renaming_map
+
+
+def _multiselect_columns(
+    codebook: list[dict[str, Any]], columns: list[str]
+) -> dict[str, list[str]]:
+    """Map each multi-select root question to its sub-question columns present in `columns`, in column order.
+
+    A column is claimed by the first question that lists it.
+    """
+    positions = {col: i for i, col in enumerate(columns)}
+    multiselect_columns = {}
+
+    for question in codebook:
+        if question["question_type"] != "MC":
+            continue
+
+        root_q_num = question["question_number"]
+        sub_questions = question.get("questions")
+
+        if sub_questions is None or len(sub_questions) <= 1:
+            continue
+
+        sub_question_columns = sorted(
+            {
+                q_num
+                for sub_question in sub_questions
+                if (q_num := sub_question["question_number"]) in positions
+            },
+            key=positions.__getitem__,
+        )
+        for col in sub_question_columns:
+            del positions[col]
+
+        multiselect_columns[root_q_num] = sub_question_columns
+
+    return multiselect_columns
+
+
+def _coalesce_multiselect_columns(
+    df: pd.DataFrame,
+    codebook: list[dict[str, Any]],
+    delimiter: str = ", ",
+    use_multiple: bool = True,
+) -> tuple[list[str], dict[str, pd.Series]]:
+    """Get the sub-question columns to drop, and the coalesced root question columns to add in their place."""
+    multiselect_columns = _multiselect_columns(codebook, df.columns.tolist())
+
+    root_questions = {
+        root_q_num: coalesce_columns(
+            df[sub_question_columns], delimiter=delimiter, use_multiple=use_multiple
+        )
+        for root_q_num, sub_question_columns in multiselect_columns.items()
+    }
+    drop_columns = [
+        col
+        for sub_question_columns in multiselect_columns.values()
+        for col in sub_question_columns
+    ]
+
+    return drop_columns, root_questions
+
+
+def _codebook_categorical_columns(
+    df: pd.DataFrame, codebook: list[dict[str, Any]], exclude: Iterable[str] = ()
+) -> dict[str, pd.Series]:
+    """Get the categorical columns of `df` with the codebook's answer choices added to their categories, if any are missing."""
+    exclude = set(exclude)
+    columns = {}
+
+    for question in codebook:
+        for sub_question in question.get("questions") or []:
+            q_num = sub_question["question_number"]
+            a_choices = sub_question.get("answer_choices")
+
+            if (
+                a_choices is None
+                or q_num in exclude
+                or q_num not in df.columns
+                or not isinstance(df[q_num].dtype, pd.CategoricalDtype)
+            ):
+                continue
+
+            values = df[q_num]
+            missing = [
+                choice
+                for choice in dict.fromkeys(a_choices.values())
+                if choice not in values.cat.categories
+            ]
+            if len(missing) > 0:
+                columns[q_num] = values.cat.add_categories(missing)
+
+    return columns
+
+
+def _materialize(
+    df: pd.DataFrame,
+    drop_columns: list[str],
+    new_columns: dict[str, pd.Series],
+    renaming_map: dict[str, str],
+) -> pd.DataFrame:
+    """Build a new DataFrame from `df` in one go: drop, then add or replace, then rename columns.
+
+    Adding columns one at a time fragments the DataFrame's blocks; a single concat does not.
+    """
+    out = df.drop(columns=drop_columns)
+
+    new_df = pd.DataFrame(new_columns, index=df.index)
+    if len(replace_columns := new_df.columns.intersection(out.columns)):
+        out[replace_columns] = new_df[replace_columns]
+        new_df = new_df.drop(columns=replace_columns)
+
+    out = pd.concat([out, new_df], axis=1)
+
+    if renaming_map:
+        out = out.rename(columns=renaming_map)
+
+    return out
+
+
+def rename_columns(
+    df: pd.DataFrame, codebook: list[dict[str, Any]], verbose: bool = True
+) -> pd.DataFrame:
+    renaming_map = _renaming_map(codebook, set(df.columns), verbose=verbose)
+
     df.rename(columns=renaming_map, inplace=True, errors="ignore")
     return df
 
@@ -219,43 +382,65 @@ def coalesce_multiselect(
         - delimiter (str): The delimiter to use when joining multiple values.
         - use_multiple (bool): Whether to use the "Multiple" string when multiple values are present.
     """
+    drop_columns, root_questions = _coalesce_multiselect_columns(
+        df, codebook, delimiter=delimiter, use_multiple=use_multiple
+    )
 
-    def join(x: pd.Series) -> str:
-        l = x.dropna().tolist()
+    df.drop(columns=drop_columns, inplace=True)
 
-        if use_multiple and len(l) > 1:
-            return "Multiple"
-        else:
-            return delimiter.join(l)
+    # Every root question column is set at once, rather than one at a time.
+    if root_questions:
+        df[list(root_questions)] = pd.DataFrame(root_questions, index=df.index)
 
-    root_questions = {}
+    return df
 
-    for question in codebook:
-        if question["question_type"] == "MC":
-            root_q_num = question["question_number"]
-            sub_questions = question.get("questions")
 
-            if sub_questions is None or len(sub_questions) <= 1:
-                continue
+def apply_codebook(
+    df: pd.DataFrame,
+    codebook: list[dict[str, Any]],
+    verbose: bool = True,
+    delimiter: str = ", ",
+    use_multiple: bool = True,
+) -> pd.DataFrame:
+    """Coalesce the multi-select columns of `df`, then rename its columns, per the codebook.
 
-            sub_question_numbers = [
-                sub_question["question_number"] for sub_question in sub_questions
-            ]
-            sub_question_columns = [
-                col for col in df.columns if col in sub_question_numbers
-            ]
-            root_questions[root_q_num] = df[sub_question_columns].apply(
-                lambda x: join(x), axis=1
-            )
-            df.drop(columns=sub_question_columns, inplace=True)
+    Equivalent to `rename_columns(coalesce_multiselect(df, ...), ...)`, but every drop, new column and rename
+    is computed up front, and the result is built with a single concat and rename.
 
-    for root_q_num, root_question_df in root_questions.items():
-        df[root_q_num] = root_question_df
+    Unlike them, `df` is left as-is, and a new DataFrame is returned.
 
-    return df
+    Categorical columns, e.g. read with `categorical=True`, gain any of the codebook's answer choices missing from their categories.
+
+    Args:
+        - df (pd.DataFrame): The DataFrame to transform.
+        - codebook (list[dict[str, Any]]): The codebook for the survey.
+        - verbose (bool): Whether to include the question string in the column names.
+        - delimiter (str): The delimiter to use when joining multiple values.
+        - use_multiple (bool): Whether to use the "Multiple" string when multiple values are present.
+    """
+    drop_columns, root_questions = _coalesce_multiselect_columns(
+        df, codebook, delimiter=delimiter, use_multiple=use_multiple
+    )
+    categorical_columns = _codebook_categorical_columns(
+        df, codebook, exclude=drop_columns
+    )
+
+    columns = set(df.columns).difference(drop_columns).union(root_questions)
+    renaming_map = _renaming_map(codebook, columns, verbose=verbose)
+
+    return _materialize(
+        df, drop_columns, {**categorical_columns, **root_questions}, renaming_map
+    )
 
 
 def dtype_to_sqlalchemy(dtype: Any, index: bool = False):
+    # Arrow-backed columns, e.g. read with `dtype_backend="pyarrow"`, map as their NumPy counterparts.
+    if isinstance(dtype, pd.ArrowDtype):
+        dtype = dtype.numpy_dtype
+    # As are categorical columns, e.g. labeled questions read with `categorical=True`, as their categories.
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+
     if isinstance(dtype, pd.Int64Dtype) or np.issubdtype(dtype, np.integer):
         return Integer
     elif isinstance(dtype, pd.Float64Dtype) or np.issubdtype(dtype, np.floating):
@@ -282,6 +467,8 @@ def generate_sql_schema(
     table_name: str,
     index_as_pk: bool = False,
     auto_increment: bool = True,
+    unique_index: bool = True,
+    composite_pk: bool = True,
 ):
     """Generate a SQLAlchemy table schema from a Pandas DataFrame.
 
@@ -290,17 +477,23 @@ def generate_sql_schema(
         table_name (str): The name of the table.
         index_as_pk (bool, optional): Whether to use the index as the primary key. Defaults to False.
         auto_increment (bool, optional): Whether to use autoincrement for the primary key. Defaults to True.
+        unique_index (bool, optional): Whether the index, if the primary key, is also unique on its own. Defaults to True.
+        composite_pk (bool, optional): Whether the autoincrementing id and the index form a composite primary key.
+            If False, e.g. for SQLite, which can't autoincrement a column of one, the id alone is the primary key,
+            and the index is only made non-nullable. Defaults to True.
     """
     metadata = MetaData()
     columns: list[Column] = [
         Column(str(name), dtype_to_sqlalchemy(dtype))
         for name, dtype in df.dtypes.items()
     ]
+    index_in_pk = index_as_pk and (composite_pk or not auto_increment)
     columns = [
         Column(
             str(name),
             dtype_to_sqlalchemy(dtype, index=index_as_pk),
-            primary_key=index_as_pk,
+            primary_key=index_in_pk,
+            nullable=not index_as_pk,
         )
         for name, dtype in df.index.to_frame().dtypes.items()
     ] + columns
@@ -308,33 +501,186 @@ def generate_sql_schema(
     if auto_increment:
         columns.insert(0, Column("id", Integer, primary_key=True, autoincrement=True))
 
-    table = Table(table_name, metadata, *columns)
+    constraints = []
+    if index_as_pk and unique_index:
+        # The index is unique on its own, so that conflicting rows can be upserted.
+        constraints.append(UniqueConstraint(*map(str, df.index.names)))
+
+    table = Table(table_name, metadata, *columns, *constraints)
     return table
 
 
-def qualtrics_schema_to_dtypes(
+LABELED_TYPES = ["oneOf", "anyOf"]
+DISPLAY_ORDER = " - Display Order"
+
+# A question's columns are keyed in the schema by its question ID, followed by a sub-field, e.g. QID1_1 or QID1_TEXT.
+RE_QUESTION_ID = re.compile(r"^QID\d+")
+
+# Metadata always exported by a projection: the response ID, start date and status are needed to read any export.
+REQUIRED_METADATA_IDS = ("_recordId", "startDate", "status")
+
+# The `ExportCreationRequest` field listing the IDs of each kind of column.
+PROJECTION_FIELDS = {
+    "question": "question_ids",
+    "embeddedData": "embedded_data_ids",
+    "metadata": "survey_metadata_ids",
+}
+
+
+@dataclass(frozen=True)
+class ColumnPlan:
+    """A plan for reading a survey's exported columns, compiled once from its response schema by `compile_column_plan`.
+
+    Attributes:
+        columns (dict[str, Any]): A map of column names (export tags) to Pandas/NumPy data types, including dates.
+        dtypes (dict[str, Any]): The above, excluding date columns; suitable for the `dtype` arg of `pd.read_csv`.
+        parse_dates (list[str]): The date columns; suitable for the `parse_dates` arg of `pd.read_csv`.
+        labeled (frozenset[str]): Columns of labeled questions, i.e. with a `oneOf` or `anyOf` set of answers.
+        skipped (frozenset[str]): Columns skipped by the plan: embedded data (if skipped) and display order columns.
+        sources (dict[str, tuple[str, str]]): A map of every column, skipped or not, to its data type
+            ("question", "embeddedData" or "metadata") and the ID it's exported by, e.g. QID1 for Q1_1.
+        fields (dict[str, str]): A map of every field ID of the schema, e.g. QID1_1, to its column name, e.g. Q1_1;
+            JSON exports key each response's values by field ID.
+    """
+
+    columns: dict[str, Any]
+    dtypes: dict[str, Any]
+    parse_dates: list[str]
+    labeled: frozenset[str]
+    skipped: frozenset[str]
+    sources: dict[str, tuple[str, str]] = field(default_factory=dict)
+    fields: dict[str, str] = field(default_factory=dict)
+
+    def _projected_ids(self, columns: Iterable[str]) -> set[tuple[str, str]]:
+        ids = {source for name, source in self.sources.items() if name in columns}
+        # Columns may also be requested by their ID.
+        ids |= {source for source in self.sources.values() if source[1] in columns}
+
+        unknown = set(columns) - set(self.sources) - {id for _, id in ids}
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+
+        return ids | {("metadata", id) for id in REQUIRED_METADATA_IDS}
+
+    def projection(self, columns: Iterable[str]) -> dict[str, list[str]]:
+        """Map columns, by export tag or ID, to the `question_ids`, `embedded_data_ids` and `survey_metadata_ids`
+        of an export request, so that only they're exported, along with REQUIRED_METADATA_IDS.
+
+        Every sibling column of a question is exported with it, e.g. Q1_1 and Q1_2 for Q1_1.
+        """
+        columns = set(columns)
+        projection: dict[str, list[str]] = {
+            name: [] for name in PROJECTION_FIELDS.values()
+        }
+
+        for data_type, id in sorted(self._projected_ids(columns)):
+            if data_type in PROJECTION_FIELDS:
+                projection[PROJECTION_FIELDS[data_type]].append(id)
+
+        return projection
+
+    def project(self, columns: Iterable[str]) -> ColumnPlan:
+        """Get the plan of only the columns exported by `projection(columns)`."""
+        ids = self._projected_ids(set(columns))
+        names = {name for name, source in self.sources.items() if source in ids}
+
+        return ColumnPlan(
+            columns={k: v for k, v in self.columns.items() if k in names},
+            dtypes={k: v for k, v in self.dtypes.items() if k in names},
+            parse_dates=[col for col in self.parse_dates if col in names],
+            labeled=self.labeled & names,
+            skipped=self.skipped & names,
+            sources={k: v for k, v in self.sources.items() if k in names},
+            fields={k: v for k, v in self.fields.items() if v in names},
+        )
+
+    def read_csv_dtypes(
+        self, dtypes: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Get the `dtype` and `parse_dates` args of `pd.read_csv`, with `dtypes` overriding the plan's own."""
+        if not dtypes:
+            return self.dtypes, self.parse_dates
+
+        columns = {**self.columns, **dtypes}
+
+        # Pandas' CSV reader cannot parse dates using the dtypes arg
+        # So we have to feed them into the parse_dates arg
+        parse_dates = [col for col, type in columns.items() if is_datetime_type(type)]
+        read_dtypes = {k: v for k, v in columns.items() if k not in parse_dates}
+
+        return read_dtypes, parse_dates
+
+
+def is_datetime_type(type: Any) -> bool:
+    return isinstance(type, np.datetime64) or type == np.datetime64
+
+
+def categorical_labels(dtypes: dict[str, Any]) -> dict[str, list[Any]]:
+    """Get the categories of each categorical data type of `dtypes`, e.g. the labels of a single-choice question."""
+    return {
+        col: list(dtype.categories)
+        for col, dtype in dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype) and dtype.categories is not None
+    }
+
+
+def categorize(df: pd.DataFrame, categories: dict[str, list[Any]]) -> pd.DataFrame:
+    """Cast columns of `df` to categoricals of the given categories, in place, e.g. those of `categorical_labels`.
+
+    Values outside of a column's categories are appended to them, so none are lost, except blank strings, which become NA.
+    """
+    for col, labels in categories.items():
+        if col not in df.columns:
+            continue
+
+        known = set(labels)
+        extra = sorted(
+            value
+            for value in df[col].dropna().unique()
+            if value not in known and str(value).strip() != ""
+        )
+        dtype = pd.CategoricalDtype(categories=[*labels, *extra])
+
+        if df[col].dtype != dtype:
+            df[col] = df[col].astype(object).astype(dtype)
+
+    return df
+
+
+def decode_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the categorical columns of `df` back to the type of their categories, e.g. for writers that don't support them."""
+    columns = {
+        col: dtype.categories.dtype
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    }
+    return df.astype(columns) if len(columns) > 0 else df
+
+
+def compile_column_plan(
     schema: dict[str, Any],
     use_labels: bool = True,
     skip_embedded_data: bool = True,
-    dtypes: dict[str, Any] | None = None,
-) -> dict[str, Any]:
+    categorical: bool = False,
+) -> ColumnPlan:
     """
-    Transforms a Qualtrics response schema into a map of column names to Pandas/NumPy data types,
-    with an option to use string types for labeled questions.
+    Compiles a Qualtrics response schema into a `ColumnPlan`: the data types of each exported column,
+    which are dates, which are labeled, and which are skipped.
 
     :param schema: Qualtrics response schema in dictionary format.
     :param use_labels: If True, map questions with labels to string type.
-    :return: A dictionary mapping column names to Pandas/NumPy data types.
+    :param skip_embedded_data: If True, skip embedded data columns.
+    :param categorical: If True, map single-choice questions with labels to a categorical type of their labels instead.
+    :return: The compiled ColumnPlan.
     """
-    if dtypes is None:
-        dtypes = {}
+    columns: dict[str, Any] = {}
+    labeled: set[str] = set()
+    skipped: set[str] = set()
+    sources: dict[str, tuple[str, str]] = {}
+    fields: dict[str, str] = {}
 
-    t_types: dict[str, Any] = {}
     properties: dict = schema["result"]["properties"]["values"]["properties"]
 
-    LABELED_TYPES = ["oneOf", "anyOf"]
-    DISPLAY_ORDER = " - Display Order"
-
     for key, value in properties.items():
         name = value.get("exportTag")
         type = value.get("type")
@@ -342,10 +688,17 @@ def qualtrics_schema_to_dtypes(
 
         data_type = value.get("dataType")
 
+        fields[key] = name
+        if data_type == "question" and (m := RE_QUESTION_ID.match(key)) is not None:
+            sources[name] = (data_type, m.group(0))
+        else:
+            sources[name] = (data_type, key)
+
         items = value.get("items", {})
         description = value.get("description", "")
 
         if skip_embedded_data and data_type == "embeddedData":
+            skipped.add(name)
             continue
 
         # prefer format type over type
@@ -354,45 +707,133 @@ def qualtrics_schema_to_dtypes(
 
         # skip over display order columns
         if description.endswith(DISPLAY_ORDER):
+            skipped.add(name)
             continue
 
         is_labeled = any(
-            [
-                (label_type in value) or (label_type in items)
-                for label_type in LABELED_TYPES
-            ]
+            (label_type in value) or (label_type in items)
+            for label_type in LABELED_TYPES
         )
+        if is_labeled:
+            labeled.add(name)
 
         if is_labeled and use_labels:
-            t_types[name] = str
+            # Only single-choice questions: a multi-select's cells can hold several labels.
+            labels = [choice["label"] for choice in value.get("oneOf", [])]
+
+            if categorical and len(labels) > 0:
+                columns[name] = pd.CategoricalDtype(categories=labels)
+            else:
+                columns[name] = str
             continue
 
         match type.lower():
             case "string":
-                t_types[name] = str
+                columns[name] = str
             case "boolean":
-                t_types[name] = bool
+                columns[name] = bool
             case "date-time" | "date" | "time":
-                t_types[name] = np.datetime64
+                columns[name] = np.datetime64
             case "number" | "array":
                 if is_labeled:
-                    t_types[name] = pd.Int64Dtype()
+                    columns[name] = pd.Int64Dtype()
                 else:
-                    t_types[name] = float
+                    columns[name] = float
             case _:
-                t_types[name] = str
+                columns[name] = str
+
+    parse_dates = [col for col, type in columns.items() if is_datetime_type(type)]
+
+    return ColumnPlan(
+        columns=columns,
+        dtypes={k: v for k, v in columns.items() if k not in parse_dates},
+        parse_dates=parse_dates,
+        labeled=frozenset(labeled),
+        skipped=frozenset(skipped),
+        sources=sources,
+        fields=fields,
+    )
+
+
+def qualtrics_schema_to_dtypes(
+    schema: dict[str, Any],
+    use_labels: bool = True,
+    skip_embedded_data: bool = True,
+    dtypes: dict[str, Any] | None = None,
+    categorical: bool = False,
+) -> dict[str, Any]:
+    """
+    Transforms a Qualtrics response schema into a map of column names to Pandas/NumPy data types,
+    with an option to use string, or categorical, types for labeled questions.
+
+    See `compile_column_plan` for the full, compiled plan.
+
+    :param schema: Qualtrics response schema in dictionary format.
+    :param use_labels: If True, map questions with labels to string type.
+    :param categorical: If True, map single-choice questions with labels to a categorical type of their labels instead.
+    :return: A dictionary mapping column names to Pandas/NumPy data types.
+    """
+    if dtypes is None:
+        dtypes = {}
+
+    plan = compile_column_plan(
+        schema=schema,
+        use_labels=use_labels,
+        skip_embedded_data=skip_embedded_data,
+        categorical=categorical,
+    )
 
     return {
-        **t_types,
+        **plan.columns,
         **dtypes,
     }
 
 
+def dtypes_to_arrow(dtypes: dict[str, Any]) -> dict[str, Any]:
+    """Map Pandas/NumPy data types, e.g. those of `qualtrics_schema_to_dtypes`, to Arrow data types.
+
+    Nullable extension types, e.g. `Int64`, map to the Arrow types of their NumPy counterparts, and Arrow-backed
+    types to their own. Raises a ValueError on types Arrow has no counterpart for.
+
+    Requires the optional `pyarrow` dependency.
+    """
+    import pyarrow as pa
+
+    def to_arrow(dtype: Any) -> Any:
+        if is_datetime_type(dtype):
+            return pa.timestamp("ns")
+        elif isinstance(dtype, pd.ArrowDtype):
+            return dtype.pyarrow_dtype
+        elif isinstance(dtype, pd.CategoricalDtype):
+            return pa.dictionary(pa.int32(), pa.string())
+        elif dtype is str or isinstance(dtype, pd.StringDtype):
+            return pa.string()
+
+        try:
+            numpy_dtype = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+            if numpy_dtype.kind in "OSU":
+                return pa.string()
+            return pa.from_numpy_dtype(numpy_dtype)
+        except (TypeError, NotImplementedError) as e:
+            raise ValueError(f"Unsupported dtype: {dtype}") from e
+
+    return {k: to_arrow(v) for k, v in dtypes.items()}
+
+
 def create_mysql_engine(
-    username: str, password: str, host: str, port: str, database: str, **kwargs: Any
+    username: str,
+    password: str,
+    host: str,
+    port: str,
+    database: str,
+    local_infile: bool = False,
+    **kwargs: Any,
 ) -> sqlalchemy.engine.Engine:
     engine_str = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
-    engine = sqlalchemy.create_engine(engine_str)
+    # Allow `LOAD DATA LOCAL INFILE`, which the client must opt into.
+    connect_args = {"local_infile": True} if local_infile else {}
+
+    engine = sqlalchemy.create_engine(engine_str, connect_args=connect_args)
     return engine
 
 
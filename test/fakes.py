@@ -0,0 +1,86 @@
+"""Fakes of the Qualtrics API shared by the tests."""
+
+import io
+import zipfile
+
+import httpx
+
+from qualtrics_utils.survey import Surveys
+
+
+def make_zip(name: str, content: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as f:
+        f.writestr(name, content)
+    return buffer.getvalue()
+
+
+def make_surveys(handler) -> Surveys:
+    surveys = Surveys(api_token="token")
+    surveys.client.set_httpx_client(
+        httpx.Client(base_url=surveys.base_url, transport=httpx.MockTransport(handler))
+    )
+    return surveys
+
+
+EXPORT_CSV = """StartDate,ResponseId,Status,Q1
+Start Date,Response ID,Response Type,Question 1
+{"ImportId":"startDate"},{"ImportId":"_recordId"},{"ImportId":"status"},{"ImportId":"QID1"}
+2023-01-01 00:00:00,R_1,IP Address,1
+2023-01-02 00:00:00,R_2,Survey Preview,2
+2023-01-03 00:00:00,R_3,IP Address,-1
+2023-01-04 00:00:00,R_4,IP Address, 
+2023-01-05 00:00:00,R_5,IP Address,5
+"""
+
+
+META = {"httpStatus": "200 - OK", "requestId": "Q_1"}
+
+
+SCHEMA = {
+    "result": {
+        "properties": {
+            "values": {
+                "properties": {
+                    "startDate": {
+                        "exportTag": "StartDate",
+                        "type": "string",
+                        "format": "date-time",
+                        "dataType": "metadata",
+                    },
+                    "status": {
+                        "exportTag": "Status",
+                        "type": "number",
+                        "dataType": "metadata",
+                        "oneOf": [
+                            {"label": "IP Address", "const": 0},
+                            {"label": "Survey Preview", "const": 1},
+                        ],
+                    },
+                    "QID1": {
+                        "exportTag": "Q1",
+                        "type": "string",
+                        "dataType": "question",
+                    },
+                }
+            }
+        }
+    }
+}
+
+
+def fake_api(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+
+    if path.endswith("/export-responses"):
+        result = {"progressId": "P_1", "percentComplete": 0.0, "status": "inProgress"}
+    elif path.endswith("/export-responses/P_1"):
+        result = {"status": "complete", "percentComplete": 100.0, "fileId": "F_1"}
+    elif path.endswith("/export-responses/F_1/file"):
+        return httpx.Response(200, content=make_zip("survey.csv", EXPORT_CSV))
+    elif path.endswith("/response-schema/"):
+        return httpx.Response(200, json=SCHEMA)
+    else:
+        return httpx.Response(404, json={"meta": META})
+
+    return httpx.Response(200, json={"result": result, "meta": META})
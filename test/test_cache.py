@@ -0,0 +1,43 @@
+import pathlib
+
+from qualtrics_utils.cache import SchemaCache
+
+SCHEMA = {"result": {"properties": {}}}
+
+
+def test_schema_cache_lru() -> None:
+    cache = SchemaCache(maxsize=2)
+
+    cache.put("SV_1", schema=SCHEMA)
+    cache.put("SV_2", schema=SCHEMA)
+    cache.get("SV_1")
+    cache.put("SV_3", schema=SCHEMA)
+
+    assert cache.get("SV_1") is not None
+    assert cache.get("SV_2") is None
+    assert cache.get("SV_3") is not None
+
+
+def test_schema_cache_disk(tmp_path: pathlib.Path) -> None:
+    cache = SchemaCache(path=tmp_path)
+    cache.put("SV_1", schema=SCHEMA, etag='"abc"')
+
+    assert cache.memoize("SV_1", "key", lambda: 1) == 1
+    assert cache.memoize("SV_1", "key", lambda: 2) == 1
+
+    entry = SchemaCache(path=tmp_path).get("SV_1")
+
+    assert entry is not None
+    assert entry.schema == SCHEMA
+    assert entry.revalidation_headers() == {"If-None-Match": '"abc"'}
+    assert entry.derived == {}
+
+
+def test_schema_cache_ttl() -> None:
+    cache = SchemaCache(ttl=0)
+    entry = cache.put("SV_1", schema=SCHEMA)
+
+    assert not cache.is_fresh(entry)
+
+    cache.invalidate("SV_1")
+    assert cache.get("SV_1") is None
@@ -0,0 +1,43 @@
+import pathlib
+
+import pandas as pd
+import pytest
+
+from qualtrics_utils import parquet
+from qualtrics_utils.parquet import upsert_dataset, write_dataset
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_responses(q1: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "StartDate": pd.to_datetime(["2023-01-31", "2023-02-01"]),
+            "Q1": q1,
+        },
+        index=pd.Index(["R_1", "R_2"], name="ResponseId"),
+    )
+
+
+def test_upsert_dataset_interrupted(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_dataset(make_responses([1.0, 2.0]), path=tmp_path, name="part-1")
+
+    def interrupted(*args, **kwargs):
+        raise RuntimeError("Interrupted")
+
+    monkeypatch.setattr(parquet, "write_dataset", interrupted)
+
+    with pytest.raises(RuntimeError):
+        upsert_dataset(make_responses([3.0, 4.0]), path=tmp_path, name="part-2")
+
+    # No response is lost: the files holding the previous versions are only removed once the new ones are written.
+    df = pq.read_table(tmp_path).to_pandas()
+    assert sorted(df["Q1"]) == [1.0, 2.0]
+
+    monkeypatch.undo()
+    upsert_dataset(make_responses([3.0, 4.0]), path=tmp_path, name="part-2")
+
+    df = pq.read_table(tmp_path).to_pandas()
+    assert sorted(zip(df["ResponseId"], df["Q1"])) == [("R_1", 3.0), ("R_2", 4.0)]
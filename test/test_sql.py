@@ -0,0 +1,177 @@
+import pandas as pd
+import pytest
+import sqlalchemy
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table
+
+from qualtrics_utils.sql import (
+    ConflictPolicy,
+    add_columns,
+    bulk_insert,
+    create_unique_index,
+    frame_to_tsv,
+    get_metadata_cache,
+    load_data_infile,
+    missing_columns,
+    swap_tables,
+)
+
+
+def make_table(conn: sqlalchemy.Connection) -> Table:
+    table = Table(
+        "responses",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("ResponseId", String(255), unique=True),
+        Column("Q1", Float),
+    )
+    table.create(conn)
+    return table
+
+
+def make_frame(rows: dict[str, float | None]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"Q1": list(rows.values())},
+        index=pd.Index(list(rows.keys()), name="ResponseId"),
+    )
+
+
+def read_table(conn: sqlalchemy.Connection, table: Table) -> dict[str, float | None]:
+    rows = conn.execute(sqlalchemy.select(table.c.ResponseId, table.c.Q1))
+    return dict(sorted(tuple(row) for row in rows))
+
+
+def test_bulk_insert() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with engine.connect() as conn:
+        table = make_table(conn)
+
+        stats = bulk_insert(
+            conn, table, make_frame({"R_1": 1.0, "R_2": None, "R_3": 3.0}), batch_size=2
+        )
+        assert (stats.rows, stats.batches) == (3, 2)
+        assert read_table(conn, table) == {"R_1": 1.0, "R_2": None, "R_3": 3.0}
+
+        overlap = make_frame({"R_3": 30.0, "R_4": 4.0})
+
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            with conn.begin_nested():
+                bulk_insert(conn, table, overlap)
+
+        bulk_insert(conn, table, overlap, on_conflict=ConflictPolicy.IGNORE)
+        assert read_table(conn, table)["R_3"] == 3.0
+
+        bulk_insert(conn, table, overlap, on_conflict=ConflictPolicy.UPDATE)
+        assert read_table(conn, table) == {
+            "R_1": 1.0,
+            "R_2": None,
+            "R_3": 30.0,
+            "R_4": 4.0,
+        }
+
+
+def test_frame_to_tsv() -> None:
+    df = pd.DataFrame(
+        {
+            "StartDate": pd.to_datetime(["2023-01-01 12:00:00", None]),
+            "Q1": pd.array([1, None], dtype="Int64"),
+            "Q2": ["a\tb\\c", "line\nbreak"],
+        },
+        index=pd.Index(["R_1", "R_2"], name="ResponseId"),
+    )
+
+    assert frame_to_tsv(df) == (
+        "R_1\t2023-01-01 12:00:00.000000\t1\ta\\tb\\\\c\n"
+        "R_2\t\\N\t\\N\tline\\nbreak\n"
+    )
+
+
+def test_load_data_infile_fallback() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with engine.connect() as conn:
+        table = make_table(conn)
+
+        stats = load_data_infile(conn, table, make_frame({"R_1": 1.0, "R_2": 2.0}))
+
+        assert stats.rows == 2
+        assert read_table(conn, table) == {"R_1": 1.0, "R_2": 2.0}
+
+
+def test_metadata_cache() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with engine.connect() as conn:
+        make_table(conn)
+        cache = get_metadata_cache(conn)
+
+        assert get_metadata_cache(conn) is cache
+        assert cache.has_table(conn, "responses")
+        assert not cache.has_table(conn, "status")
+
+        table = cache.get_table(conn, "responses")
+        assert [col.name for col in table.columns] == ["id", "ResponseId", "Q1"]
+        assert cache.get_table(conn, "responses") is table
+
+        cache.invalidate("responses")
+        assert cache.get_table(conn, "responses") is not table
+
+
+def test_add_missing_columns() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with engine.connect() as conn:
+        make_table(conn)
+        cache = get_metadata_cache(conn)
+        table = cache.get_table(conn, "responses")
+
+        df = make_frame({"R_1": 1.0}).assign(Q2=["a"], Q3=[2.5])
+        columns = missing_columns(table, df)
+        assert [col.name for col in columns] == ["Q2", "Q3"]
+
+        add_columns(conn, table, columns)
+
+        table = cache.get_table(conn, "responses")
+        assert [col.name for col in table.columns] == [
+            "id",
+            "ResponseId",
+            "Q1",
+            "Q2",
+            "Q3",
+        ]
+        assert missing_columns(table, df) == []
+
+        bulk_insert(conn, table, df)
+        row = conn.execute(sqlalchemy.select(table.c.Q2, table.c.Q3)).one()
+        assert tuple(row) == ("a", 2.5)
+
+
+def test_swap_tables() -> None:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    with engine.connect() as conn:
+        live = make_table(conn)
+        bulk_insert(conn, live, make_frame({"R_1": 1.0}))
+
+        staging = Table(
+            "responses_staging",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("ResponseId", String(255)),
+            Column("Q1", Float),
+        )
+        staging.create(conn)
+        bulk_insert(conn, staging, make_frame({"R_1": 10.0, "R_2": 20.0}))
+        create_unique_index(conn, "responses_staging", ["ResponseId"])
+
+        swap_tables(conn, {"responses_staging": "responses"})
+
+        cache = get_metadata_cache(conn)
+        assert not cache.has_table(conn, "responses_staging")
+        assert not cache.has_table(conn, "responses_old")
+
+        table = cache.get_table(conn, "responses")
+        assert read_table(conn, table) == {"R_1": 10.0, "R_2": 20.0}
+
+        with pytest.raises(sqlalchemy.exc.IntegrityError):
+            bulk_insert(conn, table, make_frame({"R_2": 2.0}))
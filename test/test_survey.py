@@ -0,0 +1,470 @@
+import asyncio
+import datetime
+import json
+import zipfile
+
+import httpx
+import pandas as pd
+import pytest
+
+from qualtrics_utils.async_survey import AsyncSurveys
+from qualtrics_utils.misc import ExportedFile
+from qualtrics_utils.polling import ETAPolling, FixedPolling, PollingStrategy
+from qualtrics_utils.survey import (
+    iter_export_chunks,
+    iter_ndjson_chunks,
+    make_export_request,
+    normalize_na,
+    open_export_data,
+    shard_date_range,
+)
+from qualtrics_utils.surveys_response_import_export_api_client.types import UNSET
+from fakes import EXPORT_CSV, META, SCHEMA, fake_api, make_surveys, make_zip
+
+
+def test_response_export_file_stream() -> None:
+    payload = make_zip("survey.csv", "ResponseId\nR_1\n")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/surveys/SV_1/export-responses/F_1/file")
+        return httpx.Response(200, content=payload)
+
+    surveys = make_surveys(handler)
+
+    with surveys._response_export_file_stream(survey_id="SV_1", file_id="F_1") as f:
+        assert f.read() == payload
+
+        with open_export_data(f) as raw, zipfile.ZipFile(raw) as data:
+            assert data.read("survey.csv") == b"ResponseId\nR_1\n"
+
+
+def test_iter_export_chunks() -> None:
+    data = make_zip("survey.csv", EXPORT_CSV)
+
+    chunks = list(
+        iter_export_chunks(
+            data=data,
+            dtypes={"Q1": str},
+            parse_dates=["StartDate"],
+            last_response_id="R_1",
+            chunksize=2,
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [0, 2, 1]
+
+    df = pd.concat(chunks)
+    assert df.index.tolist() == ["R_3", "R_4", "R_5"]
+    assert df["Q1"].isna().tolist() == [True, True, False]
+    assert pd.api.types.is_datetime64_any_dtype(df["StartDate"])
+
+
+def test_normalize_na() -> None:
+    df = pd.DataFrame(
+        {
+            "text": pd.Series(["a", " ", "-1", "x-1", ""], dtype=object),
+            "number": [1.0, -1.0, 2.0, 3.0, 4.0],
+            "labeled": pd.Series([1, -1, 2, 3, 4], dtype="Int64"),
+            "date": pd.to_datetime(["2023-01-01"] * 5),
+        }
+    )
+
+    normalize_na(df)
+
+    assert df["text"].isna().tolist() == [False, True, True, False, True]
+    assert df["number"].isna().tolist() == [False, True, False, False, False]
+    assert df["labeled"].isna().tolist() == [False, True, False, False, False]
+    assert df["labeled"].dtype == pd.Int64Dtype()
+    assert not df["date"].isna().any()
+
+
+def test_response_export_status_polling() -> None:
+    responses = [
+        httpx.Response(
+            200,
+            json={
+                "result": {"status": "inProgress", "percentComplete": 50.0},
+                "meta": META,
+            },
+        ),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(
+            200,
+            json={
+                "result": {
+                    "status": "complete",
+                    "percentComplete": 100.0,
+                    "fileId": "F_1",
+                },
+                "meta": META,
+            },
+        ),
+    ]
+
+    surveys = make_surveys(lambda request: responses.pop(0))
+    surveys.polling = FixedPolling(interval=0)
+
+    r = surveys._response_export_status(survey_id="SV_1", export_progress_id="P_1")
+
+    assert r.result.file_id == "F_1"
+    assert surveys.polling_metrics[-1].polls == 2
+
+
+def test_eta_polling() -> None:
+    polling = ETAPolling(fraction=0.5, min_delay=0, fallback=FixedPolling(interval=2))
+
+    assert polling.delay(polls=1, elapsed=10, percent_complete=50) == 5
+    # Without any reported progress, the fallback's fixed interval is used.
+    for percent_complete in [0.0, None, UNSET]:
+        assert (
+            polling.delay(polls=1, elapsed=10, percent_complete=percent_complete) == 2
+        )
+
+    with pytest.raises(TypeError):
+        PollingStrategy()
+
+
+def test_async_get_responses_df() -> None:
+    async def run() -> ExportedFile[pd.DataFrame]:
+        async with AsyncSurveys(
+            api_token="token", max_concurrent_requests=2
+        ) as surveys:
+            surveys.client.set_async_httpx_client(
+                httpx.AsyncClient(
+                    base_url=surveys.base_url, transport=httpx.MockTransport(fake_api)
+                )
+            )
+            return await surveys.get_responses_df(survey_id="SV_1")
+
+    exported_file = asyncio.run(run())
+
+    assert exported_file.file_id == "F_1"
+    assert exported_file.last_response_id == "R_5"
+    assert exported_file.data.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+    assert exported_file.last_start_date == datetime.datetime(2023, 1, 5)
+    assert exported_file.row_count == 4
+
+
+def test_async_iter_responses_df() -> None:
+    async def run() -> list[ExportedFile[pd.DataFrame]]:
+        async with AsyncSurveys(api_token="token") as surveys:
+            surveys.client.set_async_httpx_client(
+                httpx.AsyncClient(
+                    base_url=surveys.base_url, transport=httpx.MockTransport(fake_api)
+                )
+            )
+            return [
+                chunk
+                async for chunk in surveys.iter_responses_df(
+                    survey_id="SV_1", chunksize=2
+                )
+            ]
+
+    chunks = asyncio.run(run())
+
+    assert [chunk.data.index.tolist() for chunk in chunks] == [
+        ["R_1"],
+        ["R_3", "R_4"],
+        ["R_5"],
+    ]
+    assert chunks[-1].last_response_id == "R_5"
+    assert chunks[-1].continuation_token is None
+
+
+def test_get_responses_df_resume_from_watermark() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    exported_file = surveys.get_responses_df(
+        survey_id="SV_1",
+        last_response_id="R_3",
+        last_start_date=datetime.datetime(2023, 1, 3),
+    )
+
+    # No request is made for the last response's start date.
+    assert not any("/responses/" in request.url.path for request in requests)
+    assert json.loads(requests[0].content)["startDate"].startswith(
+        "2023-01-03T00:00:00"
+    )
+    assert exported_file.data.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+
+
+def test_make_export_request_sort_by_last_modified_date() -> None:
+    request = make_export_request(
+        start_date=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        sort_by_last_modified_date=True,
+    )
+
+    assert request.to_dict()["sortByLastModifiedDate"] is True
+
+
+def test_shard_date_range() -> None:
+    start_date = datetime.datetime(2023, 1, 1)
+    end_date = datetime.datetime(2023, 1, 4)
+
+    date_ranges = shard_date_range(start_date, end_date, shards=3)
+
+    assert [s for s, _ in date_ranges] == [
+        datetime.datetime(2023, 1, d) for d in (1, 2, 3)
+    ]
+    # Each shard overlaps the next, so that none falls between them.
+    assert date_ranges[0][1] == datetime.datetime(2023, 1, 2, 0, 0, 1)
+    assert date_ranges[-1][1] == end_date
+
+
+def test_get_responses_df_sharded() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    exported_file = surveys.get_responses_df(
+        survey_id="SV_1",
+        start_date=datetime.datetime(2023, 1, 1),
+        end_date=datetime.datetime(2023, 1, 5),
+        shards=2,
+    )
+
+    bodies = [
+        json.loads(request.content)
+        for request in requests
+        if request.url.path.endswith("/export-responses")
+    ]
+    assert sorted(body["startDate"][:10] for body in bodies) == [
+        "2023-01-01",
+        "2023-01-03",
+    ]
+
+    # Every shard exported the same responses, which are deduplicated.
+    assert exported_file.data.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+    assert exported_file.last_response_id == "R_5"
+    assert exported_file.row_count == 4
+
+
+def test_get_responses_df_columns() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    surveys.get_responses_df(survey_id="SV_1", columns=["Q1"])
+
+    body = json.loads(requests[0].content)
+    assert body["questionIds"] == ["QID1"]
+    assert body["embeddedDataIds"] == []
+    assert body["surveyMetadataIds"] == ["_recordId", "startDate", "status"]
+
+
+def test_get_column_plan_memoized() -> None:
+    surveys = make_surveys(fake_api)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    plan = surveys.get_column_plan("SV_1")
+    assert surveys.get_column_plan("SV_1") is plan
+
+    # A new schema drops the plans compiled from the old one.
+    surveys.schema_cache.put("SV_1", SCHEMA)
+    assert surveys.get_column_plan("SV_1") is not plan
+
+
+def make_filters_page(name: str, filter_id: str, next_page: str | None) -> dict:
+    element = {
+        "filterName": name,
+        "filterId": filter_id,
+        "creationDate": "2023-01-01T00:00:00Z",
+    }
+    return {"result": {"elements": [element], "nextPage": next_page}, "meta": META}
+
+
+def test_get_responses_df_filter_name() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.url.path.endswith("/filters"):
+            if request.url.params.get("skipToken") is None:
+                next_page = f"{request.url}?skipToken=1"
+                return httpx.Response(
+                    200, json=make_filters_page("Previews", "FL_1", next_page)
+                )
+            return httpx.Response(
+                200, json=make_filters_page("Completes", "FL_2", None)
+            )
+
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    assert [f.filter_id for f in surveys.list_filters("SV_1")] == ["FL_1", "FL_2"]
+
+    surveys.get_responses_df(survey_id="SV_1", filter_name="Completes")
+
+    body = next(
+        json.loads(request.content)
+        for request in requests
+        if request.url.path.endswith("/export-responses")
+    )
+    assert body["filterId"] == "FL_2"
+    assert body["allowContinuation"] is False
+
+    with pytest.raises(ValueError):
+        surveys.resolve_filter("SV_1", "Missing")
+
+    with pytest.raises(ValueError):
+        make_export_request(filter_id="FL_2", sort_by_last_modified_date=True)
+
+
+def test_get_responses_df_pyarrow() -> None:
+    pytest.importorskip("pyarrow")
+
+    surveys = make_surveys(fake_api)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    exported_file = surveys.get_responses_df(
+        survey_id="SV_1", engine="pyarrow", dtype_backend="pyarrow"
+    )
+    df = exported_file.data
+
+    assert df.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+    assert df["Q1"].isna().tolist() == [False, True, True, False]
+    assert isinstance(df["Q1"].dtype, pd.ArrowDtype)
+    assert exported_file.last_start_date == datetime.datetime(2023, 1, 5)
+
+    with pytest.raises(ValueError):
+        surveys.get_responses_df(survey_id="SV_1", dtype_backend="pyarrow")
+
+
+def test_get_responses_df_categorical() -> None:
+    surveys = make_surveys(fake_api)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    df = surveys.get_responses_df(survey_id="SV_1", categorical=True).data
+
+    assert df.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+    assert df["Status"].dtype == pd.CategoricalDtype(["IP Address", "Survey Preview"])
+    assert df["Status"].tolist() == ["IP Address"] * 4
+
+
+EXPORT_NDJSON = "\n".join(
+    json.dumps(record)
+    for record in [
+        {
+            "responseId": "R_1",
+            "values": {"startDate": "2023-01-01T00:00:00Z", "status": 0, "QID1": 1},
+            "labels": {"status": "IP Address"},
+        },
+        {
+            "responseId": "R_2",
+            "values": {"startDate": "2023-01-02T00:00:00Z", "status": 1, "QID1": 2},
+            "labels": {"status": "Survey Preview"},
+        },
+        {
+            "responseId": "R_3",
+            "values": {"startDate": "2023-01-03T00:00:00Z", "status": 0, "QID1": -1},
+            "labels": {"status": "IP Address"},
+        },
+        {
+            "responseId": "R_4",
+            "values": {"startDate": "2023-01-04T00:00:00Z", "status": 0},
+            "labels": {"status": "IP Address"},
+        },
+        {
+            "responseId": "R_5",
+            "values": {
+                "startDate": "2023-01-05T00:00:00Z",
+                "status": 0,
+                "QID1": ["5", "6"],
+            },
+            "labels": {"status": "IP Address"},
+        },
+    ]
+)
+
+
+def test_iter_ndjson_chunks() -> None:
+    chunks = list(
+        iter_ndjson_chunks(
+            data=make_zip("survey.json", EXPORT_NDJSON),
+            fields={"startDate": "StartDate", "status": "Status", "QID1": "Q1"},
+            dtypes={"Status": str, "Q1": str},
+            parse_dates=["StartDate"],
+            last_response_id="R_1",
+            chunksize=2,
+        )
+    )
+
+    assert [len(chunk) for chunk in chunks] == [0, 2, 1]
+
+    df = pd.concat(chunks)
+    assert df.index.tolist() == ["R_3", "R_4", "R_5"]
+    assert df["Q1"].tolist()[2] == '["5", "6"]'
+    assert df["Q1"].isna().tolist() == [True, True, False]
+    assert df["StartDate"].tolist()[0] == pd.Timestamp(2023, 1, 3)
+
+
+def test_iter_ndjson_chunks_multi_value_labels() -> None:
+    record = {
+        "responseId": "R_1",
+        "values": {"startDate": "2023-01-01T00:00:00Z", "QID1": ["1", "2"]},
+        "labels": {"QID1": ["Red, dark", "Blue"]},
+    }
+
+    (df,) = iter_ndjson_chunks(
+        data=make_zip("survey.json", json.dumps(record)),
+        fields={"startDate": "StartDate", "QID1": "Q1"},
+        dtypes={"Q1": str},
+        parse_dates=["StartDate"],
+    )
+
+    assert json.loads(df.loc["R_1", "Q1"]) == ["Red, dark", "Blue"]
+
+
+def test_get_responses_df_ndjson() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        if request.url.path.endswith("/export-responses/F_1/file"):
+            return httpx.Response(200, content=make_zip("survey.json", EXPORT_NDJSON))
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    exported_file = surveys.get_responses_df(survey_id="SV_1", format="ndjson")
+    df = exported_file.data
+
+    body = json.loads(requests[0].content)
+    assert body["format"] == "ndjson"
+    assert "includeLabelColumns" not in body
+
+    assert df.index.tolist() == ["R_1", "R_3", "R_4", "R_5"]
+    assert df["Q1"].isna().tolist() == [False, True, True, False]
+    assert exported_file.last_start_date == datetime.datetime(2023, 1, 5)
+
+    with pytest.raises(ValueError):
+        surveys.get_responses_df(survey_id="SV_1", format="xml")
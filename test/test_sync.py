@@ -0,0 +1,440 @@
+import datetime
+import json
+import pathlib
+
+import httpx
+import pandas as pd
+import pytest
+import sqlalchemy
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table
+
+from qualtrics_utils.misc import ExportedFile
+from qualtrics_utils.polling import FixedPolling
+from qualtrics_utils.sql import (
+    ConflictPolicy,
+    WriteMethod,
+    get_metadata_cache,
+    has_unique_index,
+    transaction,
+)
+from qualtrics_utils.sync import (
+    SurveyConfig,
+    SyncMode,
+    _sync,
+    parse_survey_configs,
+    setup_sql,
+    sync_parquet,
+    sync_sql,
+    write_responses_sql,
+)
+from fakes import SCHEMA, fake_api, make_surveys
+
+
+def test_parse_survey_configs_single() -> None:
+    survey_configs = parse_survey_configs(
+        {"survey_id": "SV_1", "survey_args": {"use_labels": True}},
+        responses_table_name="responses",
+    )
+
+    assert survey_configs == [
+        SurveyConfig(
+            survey_id="SV_1",
+            responses_table_name="responses",
+            survey_args={"use_labels": True},
+        )
+    ]
+
+
+def test_parse_survey_configs_many() -> None:
+    qualtrics_config = {
+        "codebook_path": "codebook.qsf",
+        "survey_args": {"use_labels": True},
+        "surveys": [
+            {"survey_id": "SV_1"},
+            {
+                "survey_id": "SV_2",
+                "responses_table_name": "responses",
+                "survey_args": {"use_labels": False},
+            },
+        ],
+    }
+    survey_configs = parse_survey_configs(qualtrics_config)
+
+    assert [s.survey_id for s in survey_configs] == ["SV_1", "SV_2"]
+    assert survey_configs[0].codebook_path == pathlib.Path("codebook.qsf")
+    assert survey_configs[1].responses_table_name == "responses"
+    assert survey_configs[1].survey_args == {"use_labels": False}
+
+    with pytest.raises(ValueError):
+        parse_survey_configs(qualtrics_config, responses_table_name="responses")
+
+
+class FakeSurveys:
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    def get_responses_df(self, survey_id: str, **kwargs) -> ExportedFile[pd.DataFrame]:
+        self.calls.append(kwargs)
+
+        df = pd.DataFrame(
+            {"Q1": [1.0, 2.0]}, index=pd.Index(["R_1", "R_2"], name="ResponseId")
+        )
+        return ExportedFile(
+            survey_id=survey_id,
+            file_id="F_1",
+            continuation_token=None,
+            last_response_id="R_2",
+            timestamp=datetime.datetime(2023, 1, 1),
+            data=df,
+            last_start_date=datetime.datetime(2023, 1, 2),
+            row_count=2,
+        )
+
+
+class ModifiedSurveys(FakeSurveys):
+    def get_responses_df(self, survey_id: str, **kwargs) -> ExportedFile[pd.DataFrame]:
+        exported_file = super().get_responses_df(survey_id, **kwargs)
+
+        # Each export modifies every response.
+        exported_file.data["Q1"] *= len(self.calls)
+        exported_file.last_modified_date = datetime.datetime(2023, 1, len(self.calls))
+
+        return exported_file
+
+
+class DatedSurveys(ModifiedSurveys):
+    def get_responses_df(self, survey_id: str, **kwargs) -> ExportedFile[pd.DataFrame]:
+        exported_file = super().get_responses_df(survey_id, **kwargs)
+
+        # The responses start in different months.
+        exported_file.data["StartDate"] = pd.to_datetime(["2023-01-31", "2023-02-01"])
+
+        return exported_file
+
+
+def create_sqlite_engine() -> sqlalchemy.Engine:
+    engine = sqlalchemy.create_engine("sqlite://")
+
+    # pysqlite doesn't emit BEGIN itself, which breaks savepoints; see SQLAlchemy's SQLite dialect docs.
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @sqlalchemy.event.listens_for(engine, "begin")
+    def begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def test_sync_watermark_same_start_date() -> None:
+    statuses: list[ExportedFile] = []
+
+    # The last sync ended on R_1, started at the same time as R_2.
+    _sync(
+        survey_id="SV_1",
+        surveys=FakeSurveys(),  # type: ignore
+        status_reader=lambda survey_id: {
+            "last_response_id": "R_1",
+            "continuation_token": None,
+            "last_start_date": datetime.datetime(2023, 1, 2),
+        },
+        status_writer=statuses.append,
+        responses_writer=lambda exported_file: None,
+        setup_func=lambda exported_file: None,
+    )
+
+    assert statuses[0].last_response_id == "R_2"
+    assert statuses[0].last_start_date == datetime.datetime(2023, 1, 2)
+
+
+def test_sync_sql_shadow_restart() -> None:
+    engine = create_sqlite_engine()
+    surveys = ModifiedSurveys()
+
+    with engine.connect() as conn:
+        for restart in (False, True):
+            sync_sql(
+                survey_id="SV_1",
+                surveys=surveys,  # type: ignore
+                conn=conn,
+                restart=restart,
+                shadow_restart=True,
+                write_method=WriteMethod.BULK,
+            )
+
+        # The reloaded responses are swapped into place, and the staging tables are gone.
+        df = pd.read_sql("SELECT ResponseId, Q1 FROM SV_1_responses", conn)
+        assert sorted(zip(df["ResponseId"], df["Q1"])) == [("R_1", 2.0), ("R_2", 4.0)]
+        assert sorted(sqlalchemy.inspect(conn).get_table_names()) == [
+            "SV_1_responses",
+            "SV_1_status",
+        ]
+        assert surveys.calls[1]["last_response_id"] is None
+
+        # The response ID's unique index is built once the staging table is loaded.
+        assert has_unique_index(conn, "SV_1_responses", ["ResponseId"])
+
+
+def test_sync_sql_engine(tmp_path: pathlib.Path) -> None:
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'sync.db'}")
+
+    class PooledSurveys(FakeSurveys):
+        def get_responses_df(self, survey_id: str, **kwargs):
+            # No connection is held while the responses are exported.
+            assert engine.pool.checkedout() == 0
+            return super().get_responses_df(survey_id, **kwargs)
+
+    surveys = PooledSurveys()
+    for _ in range(2):
+        sync_sql(
+            survey_id="SV_1",
+            surveys=surveys,  # type: ignore
+            conn=engine,
+            write_method=WriteMethod.BULK,
+            on_conflict=ConflictPolicy.IGNORE,
+        )
+
+    assert engine.pool.checkedout() == 0
+    assert surveys.calls[1]["last_response_id"] == "R_2"
+
+    with engine.connect() as conn:
+        count = conn.execute(sqlalchemy.text("SELECT COUNT(*) FROM SV_1_responses"))
+        assert count.scalar() == 2
+
+
+def test_sync_sql_transactional() -> None:
+    engine = create_sqlite_engine()
+
+    with engine.connect() as conn:
+        responses_table = Table(
+            "responses",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("ResponseId", String(255), unique=True),
+            Column("Q1", Float),
+        )
+        responses_table.create(conn)
+        Table(
+            "status",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("timestamp", String),
+            Column("last_response_id", String),
+            Column("continuation_token", String),
+            Column("file_id", String),
+        ).create(conn)
+        conn.commit()
+
+        def failing_status_writer(exported_file: ExportedFile) -> None:
+            raise RuntimeError("Interrupted")
+
+        count = sqlalchemy.select(sqlalchemy.func.count()).select_from(responses_table)
+
+        for write_method in (WriteMethod.BULK, WriteMethod.TO_SQL):
+            # Reflect the tables first, so that nothing but the write itself runs within the transaction.
+            get_metadata_cache(conn).get_table(conn, "responses")
+            conn.commit()
+
+            with pytest.raises(RuntimeError):
+                _sync(
+                    survey_id="SV_1",
+                    surveys=FakeSurveys(),  # type: ignore
+                    status_reader=lambda survey_id: None,
+                    status_writer=failing_status_writer,
+                    responses_writer=write_responses_sql(
+                        table_name="responses",
+                        conn=conn,
+                        write_method=write_method,
+                        commit=False,
+                    ),
+                    setup_func=lambda exported_file: None,
+                    transaction=lambda: transaction(conn),
+                )
+
+            assert conn.execute(count).scalar() == 0
+
+        surveys = FakeSurveys()
+        for _ in range(2):
+            sync_sql(
+                survey_id="SV_1",
+                surveys=surveys,  # type: ignore
+                conn=conn,
+                responses_table_name="responses",
+                status_table_name="status",
+                write_method=WriteMethod.BULK,
+                on_conflict=ConflictPolicy.IGNORE,
+                transactional=True,
+            )
+
+        assert conn.execute(count).scalar() == 2
+
+        # The status table is migrated to hold the watermarks, which the next sync resumes from.
+        status = conn.execute(
+            sqlalchemy.text("SELECT last_response_id, row_count FROM status")
+        )
+        assert tuple(status.first()) == ("R_2", 2)
+        assert surveys.calls[1]["last_response_id"] == "R_2"
+        assert surveys.calls[1]["last_start_date"] == datetime.datetime(2023, 1, 2)
+
+
+def test_setup_sql_unique_index() -> None:
+    exported_file = FakeSurveys().get_responses_df("SV_1")
+
+    with create_sqlite_engine().connect() as conn:
+        # As created by older versions: the response ID isn't unique on its own.
+        responses_table = Table(
+            "responses",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("ResponseId", String(255)),
+            Column("Q1", Float),
+        )
+        responses_table.create(conn)
+        conn.commit()
+
+        setup = setup_sql(
+            responses_table_name="responses", status_table_name="status", conn=conn
+        )
+        setup(exported_file)
+        setup(exported_file)
+
+        indexes = sqlalchemy.inspect(conn).get_indexes("responses")
+        assert [(i["column_names"], i["unique"]) for i in indexes] == [
+            (["ResponseId"], True)
+        ]
+
+        conn.execute(sqlalchemy.text("DROP INDEX " + indexes[0]["name"]))
+        conn.execute(
+            responses_table.insert(),
+            [{"ResponseId": "R_1", "Q1": 1.0}, {"ResponseId": "R_1", "Q1": 2.0}],
+        )
+        conn.commit()
+
+        with pytest.raises(ValueError):
+            setup(exported_file)
+
+
+def test_sync_sql_update_mode() -> None:
+    engine = create_sqlite_engine()
+
+    with engine.connect() as conn:
+        responses_table = Table(
+            "responses",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("ResponseId", String(255), unique=True),
+            Column("Q1", Float),
+        )
+        responses_table.create(conn)
+        conn.commit()
+
+        surveys = ModifiedSurveys()
+        for _ in range(2):
+            sync_sql(
+                survey_id="SV_1",
+                surveys=surveys,  # type: ignore
+                conn=conn,
+                responses_table_name="responses",
+                status_table_name="status",
+                mode=SyncMode.UPDATE,
+            )
+
+        # The responses are upserted, rather than appended.
+        rows = conn.execute(
+            sqlalchemy.select(responses_table.c.ResponseId, responses_table.c.Q1)
+        )
+        assert sorted(map(tuple, rows)) == [("R_1", 2.0), ("R_2", 4.0)]
+
+        assert surveys.calls[0]["sort_by_last_modified_date"]
+        assert surveys.calls[0]["start_date"] is None
+        assert "last_response_id" not in surveys.calls[0]
+        assert surveys.calls[1]["start_date"] == datetime.datetime(
+            2023, 1, 1, tzinfo=datetime.timezone.utc
+        )
+
+
+def test_sync_sql_update_mode_export() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return fake_api(request)
+
+    surveys = make_surveys(handler)
+    surveys.polling = FixedPolling(interval=0)
+    surveys.schema_cache.put("SV_1", SCHEMA)
+
+    started_at = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    with create_sqlite_engine().connect() as conn:
+        Table(
+            "responses",
+            MetaData(),
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("ResponseId", String(255), unique=True),
+            Column("Q1", String(255)),
+        ).create(conn)
+        conn.commit()
+
+        for _ in range(2):
+            sync_sql(
+                survey_id="SV_1",
+                surveys=surveys,
+                conn=conn,
+                responses_table_name="responses",
+                status_table_name="status",
+                mode=SyncMode.UPDATE,
+            )
+
+        rows = conn.execute(sqlalchemy.text("SELECT ResponseId FROM responses"))
+        assert sorted(row[0] for row in rows) == ["R_1", "R_3", "R_4", "R_5"]
+
+    bodies = [
+        json.loads(request.content)
+        for request in requests
+        if request.url.path.endswith("/export-responses")
+    ]
+    assert bodies[0]["sortByLastModifiedDate"] is True
+    assert "startDate" not in bodies[0]
+
+    # The export has no last modified date, so the next sync starts from when the previous export was requested.
+    start_date = datetime.datetime.fromisoformat(bodies[1]["startDate"])
+    assert start_date.replace(tzinfo=None) >= started_at.replace(microsecond=0)
+
+
+def test_sync_parquet(tmp_path: pathlib.Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    surveys = DatedSurveys()
+    for mode in (SyncMode.APPEND, SyncMode.APPEND, SyncMode.UPDATE):
+        sync_parquet(
+            survey_id="SV_1",
+            surveys=surveys,  # type: ignore
+            path=tmp_path,
+            mode=mode,
+        )
+
+    assert sorted(p.name for p in (tmp_path / "SV_1_responses").iterdir()) == [
+        "start_month=2023-01",
+        "start_month=2023-02",
+    ]
+    # The second sync resumes from the status sidecar.
+    assert surveys.calls[1]["last_response_id"] == "R_2"
+    assert len((tmp_path / "SV_1_status.jsonl").read_text().splitlines()) == 3
+
+    # Appended responses are kept, while upserted ones replace every previous version.
+    df = pq.read_table(tmp_path / "SV_1_responses").to_pandas()
+    assert sorted(zip(df["ResponseId"], df["Q1"])) == [("R_1", 3.0), ("R_2", 6.0)]
+    assert sorted(df["start_month"].astype(str)) == ["2023-01", "2023-02"]
+
+    sync_parquet(
+        survey_id="SV_1",
+        surveys=surveys,  # type: ignore
+        path=tmp_path,
+        restart=True,
+    )
+
+    df = pq.read_table(tmp_path / "SV_1_responses").to_pandas()
+    assert sorted(df["Q1"]) == [4.0, 8.0]
+    assert surveys.calls[3]["last_response_id"] is None
@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from qualtrics_utils.utils import (
+    apply_codebook,
+    categorical_labels,
+    categorize,
+    coalesce_multiselect,
+    compile_column_plan,
+    decode_categoricals,
+    dtypes_to_arrow,
+    qualtrics_schema_to_dtypes,
+    rename_columns,
+)
+
+SCHEMA = {
+    "result": {
+        "properties": {
+            "values": {
+                "properties": {
+                    "startDate": {
+                        "exportTag": "StartDate",
+                        "type": "string",
+                        "format": "date-time",
+                        "dataType": "metadata",
+                    },
+                    "QID1": {
+                        "exportTag": "Q1",
+                        "type": "number",
+                        "dataType": "question",
+                        "oneOf": [
+                            {"label": "Agree", "const": 1},
+                            {"label": "Disagree", "const": 2},
+                        ],
+                    },
+                    "QID2": {
+                        "exportTag": "Q2",
+                        "type": "number",
+                        "dataType": "question",
+                    },
+                    "QID1_DO": {
+                        "exportTag": "Q1_DO",
+                        "type": "string",
+                        "dataType": "question",
+                        "description": "Q1 - Display Order",
+                    },
+                    "school": {
+                        "exportTag": "school",
+                        "type": "string",
+                        "dataType": "embeddedData",
+                    },
+                }
+            }
+        }
+    }
+}
+
+
+def test_compile_column_plan() -> None:
+    plan = compile_column_plan(SCHEMA, use_labels=False)
+
+    assert plan.dtypes == {"Q1": pd.Int64Dtype(), "Q2": float}
+    assert plan.parse_dates == ["StartDate"]
+    assert plan.labeled == {"Q1"}
+    assert plan.skipped == {"Q1_DO", "school"}
+
+    assert compile_column_plan(SCHEMA, use_labels=True).dtypes["Q1"] is str
+
+
+def test_categorical_column_plan() -> None:
+    plan = compile_column_plan(SCHEMA, categorical=True)
+
+    assert plan.dtypes["Q1"] == pd.CategoricalDtype(["Agree", "Disagree"])
+    assert categorical_labels(plan.dtypes) == {"Q1": ["Agree", "Disagree"]}
+    assert compile_column_plan(SCHEMA).dtypes["Q1"] is str
+
+    df = pd.DataFrame({"Q1": ["Agree", " ", "Neutral", None]})
+    categorize(df, categorical_labels(plan.dtypes))
+
+    # Values outside of the labels are kept, and blanks become NA.
+    assert df["Q1"].cat.categories.tolist() == ["Agree", "Disagree", "Neutral"]
+    assert df["Q1"].isna().tolist() == [False, True, False, True]
+
+    decoded = decode_categoricals(df)
+    assert decoded["Q1"].dtype == object
+    assert decoded["Q1"].tolist()[0] == "Agree"
+
+
+def test_column_plan_read_csv_dtypes() -> None:
+    plan = compile_column_plan(SCHEMA)
+
+    dtypes, parse_dates = plan.read_csv_dtypes({"StartDate": str, "Q2": np.datetime64})
+
+    assert dtypes == {"StartDate": str, "Q1": str}
+    assert parse_dates == ["Q2"]
+    assert qualtrics_schema_to_dtypes(SCHEMA, dtypes={"Q2": str})["Q2"] is str
+
+
+def test_column_plan_projection() -> None:
+    plan = compile_column_plan(SCHEMA, use_labels=False)
+
+    assert plan.projection(["Q1", "school"]) == {
+        "question_ids": ["QID1"],
+        "embedded_data_ids": ["school"],
+        "survey_metadata_ids": ["_recordId", "startDate", "status"],
+    }
+    assert plan.projection(["QID2"])["question_ids"] == ["QID2"]
+
+    projected = plan.project(["Q2"])
+    assert projected.dtypes == {"Q2": float}
+    assert projected.parse_dates == ["StartDate"]
+
+    with pytest.raises(ValueError):
+        plan.projection(["Q3"])
+
+
+def test_dtypes_to_arrow() -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    types = dtypes_to_arrow(
+        {
+            "Q1": pd.Int64Dtype(),
+            "Q2": "float32",
+            "Q3": pd.BooleanDtype(),
+            "Q4": pd.ArrowDtype(pa.int16()),
+            "Q5": object,
+            "StartDate": np.datetime64,
+        }
+    )
+
+    assert types == {
+        "Q1": pa.int64(),
+        "Q2": pa.float32(),
+        "Q3": pa.bool_(),
+        "Q4": pa.int16(),
+        "Q5": pa.string(),
+        "StartDate": pa.timestamp("ns"),
+    }
+
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        dtypes_to_arrow({"Q1": pd.PeriodDtype("D")})
+
+
+def test_coalesce_multiselect() -> None:
+    df = pd.DataFrame(
+        {
+            "Q1_1": ["a", None, "a", None],
+            "Q1_2": [None, None, "b", "b"],
+            "Q1_3": [None, None, "c", None],
+            "Q2": [1, 2, 3, 4],
+        },
+        index=["R_1", "R_2", "R_3", "R_4"],
+    )
+    codebook = [
+        {
+            "question_number": "Q1",
+            "question_type": "MC",
+            "questions": [{"question_number": f"Q1_{i}"} for i in (1, 2, 3, 4)],
+        }
+    ]
+
+    t_df = df.copy()
+    out = coalesce_multiselect(t_df, codebook)
+    # The DataFrame is coalesced in place.
+    assert out is t_df
+    assert out.columns.tolist() == ["Q2", "Q1"]
+    assert out["Q1"].tolist() == ["a", "", "Multiple", "b"]
+    assert out.index.tolist() == df.index.tolist()
+
+    out = coalesce_multiselect(df.copy(), codebook, delimiter="|", use_multiple=False)
+    assert out["Q1"].tolist() == ["a", "", "a|b|c", "b"]
+
+
+def test_apply_codebook() -> None:
+    df = pd.DataFrame(
+        {
+            "Q2_1": ["x", None],
+            "Q1_2": [None, "b"],
+            "Q1_1": ["a", "a"],
+            "Q3": [1, 2],
+        },
+        index=["R_1", "R_2"],
+    )
+    codebook = [
+        {
+            "question_number": "Q1",
+            "question_string": "Pick some",
+            "question_type": "MC",
+            "questions": [
+                {"question_number": "Q1_1", "question_string": "A"},
+                {"question_number": "Q1_2", "question_string": "B"},
+            ],
+        },
+        {
+            "question_number": "Q2",
+            "question_string": "Rate",
+            "question_type": "Matrix",
+            "questions": [{"question_number": "Q2_1", "question_string": "X"}],
+        },
+        {"question_number": "Q3", "question_string": "Age", "question_type": "TE"},
+    ]
+
+    out = apply_codebook(df.copy(), codebook, use_multiple=False)
+    expected = rename_columns(
+        coalesce_multiselect(df.copy(), codebook, use_multiple=False), codebook
+    )
+
+    pd.testing.assert_frame_equal(out, expected)
+    assert out.columns.tolist() == ["Q2 - X", "Q3 - Age", "Q1 - Pick some"]
+    assert out["Q1 - Pick some"].tolist() == ["a", "b, a"]